@@ -0,0 +1,41 @@
+# Performance testing on the TravisCI (pure Python vs. vectorized curve evaluator)
+import os
+import sys
+import platform
+import timeit
+from geomdl import BSpline, evaluators, utilities
+
+
+# Setup test
+def setup_test(sample_size, evaluator):
+    ctrlpts = [[5.0, 15.0, 0.0], [10.0, 25.0, 5.0], [20.0, 20.0, 10.0], [15.0, -5.0, 15.0], [7.5, 10.0, 20.0],
+               [12.5, 15.0, 25.0], [15.0, 0.0, 30.0], [5.0, -10.0, 35.0], [10.0, 15.0, 40.0], [5.0, 15.0, 30.0]]
+
+    ns = BSpline.Curve()
+    ns.degree = 3
+    ns.ctrlpts = ctrlpts
+    ns.knotvector = utilities.generate_knot_vector(ns.degree, ns.ctrlpts_size)
+    ns.sample_size = sample_size
+    ns.evaluator = evaluator
+
+    return ns
+
+
+# Setup number of executions
+number = int(os.environ['GEOMDL_PERF_NUMBER']) if 'GEOMDL_PERF_NUMBER' in os.environ else 5
+repeat = int(os.environ['GEOMDL_PERF_REPEAT']) if 'GEOMDL_PERF_REPEAT' in os.environ else 3
+version = os.environ['TRAVIS_PYTHON_VERSION'] if 'TRAVIS_PYTHON_VERSION' in os.environ else ".".join(str(v) for v in sys.version_info[0:3])
+
+# Run timeit
+for size in (10000, 100000):
+    res = {}
+    for evl in (evaluators.CurveEvaluator, evaluators.CurveEvaluatorVectorized):
+        stp = "from __main__ import setup_test; from geomdl import evaluators; " \
+              "ns=setup_test(" + str(size) + ", evaluators." + evl.__name__ + "())"
+        res[evl.__name__] = min(timeit.repeat(setup=stp, stmt="ns.evaluate()", repeat=repeat, number=number))
+
+    # Print results
+    for name, val in res.items():
+        print(__file__, "on", platform.python_implementation(), str(version), ">>", name, "with sample size",
+              str(size), ">>", str(number), "loops, best of", str(repeat), "is", str(val), "seconds per loop")
+    print("Speedup:", str(res['CurveEvaluator'] / res['CurveEvaluatorVectorized']))
@@ -0,0 +1,56 @@
+# Performance testing on the TravisCI (memory footprint and arithmetic of the geometric entities)
+import os
+import sys
+import platform
+import timeit
+from geomdl import elements
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+# Setup test
+def setup_test(num_vertices):
+    vertices = [elements.Vertex(float(i), float(i + 1), float(i + 2), id=i) for i in range(num_vertices)]
+    triangles = [elements.Triangle(vertices[i], vertices[i + 1], vertices[i + 2], id=i)
+                 for i in range(num_vertices - 2)]
+    return vertices, triangles
+
+
+# Setup number of executions
+number = int(os.environ['GEOMDL_PERF_NUMBER']) if 'GEOMDL_PERF_NUMBER' in os.environ else 5
+repeat = int(os.environ['GEOMDL_PERF_REPEAT']) if 'GEOMDL_PERF_REPEAT' in os.environ else 3
+version = os.environ['TRAVIS_PYTHON_VERSION'] if 'TRAVIS_PYTHON_VERSION' in os.environ else ".".join(str(v) for v in sys.version_info[0:3])
+
+# Test cases: (statement name, statement)
+tests = (
+    ("mesh generation", "setup_test(size)"),
+    ("vertex addition", "[vertices[i] + vertices[i + 1] for i in range(size - 1)]"),
+    ("vertex subtraction", "[vertices[i] - vertices[i + 1] for i in range(size - 1)]"),
+    ("vertex division", "[vertices[i] / 3.0 for i in range(size)]"),
+)
+
+# Run timeit
+for size in (1000, 10000, 100000):
+    res = {}
+    for name, stmt in tests:
+        stp = "from __main__ import setup_test; size=" + str(size) + "; vertices, triangles = setup_test(size)"
+        res[name] = min(timeit.repeat(setup=stp, stmt=stmt, repeat=repeat, number=number))
+
+    # Print results
+    for name, _ in tests:
+        print(__file__, "on", platform.python_implementation(), str(version), ">>", name, "with", str(size),
+              "vertices >>", str(number), "loops, best of", str(repeat), "is", str(res[name]), "seconds per loop")
+
+    # Measure the memory allocated for the vertices and the triangles
+    if tracemalloc is not None:
+        tracemalloc.start()
+        mem_start = tracemalloc.get_traced_memory()[0]
+        mesh = setup_test(size)
+        mem_size = tracemalloc.get_traced_memory()[0] - mem_start
+        tracemalloc.stop()
+        print(__file__, "on", platform.python_implementation(), str(version), ">>", "memory with", str(size),
+              "vertices >>", str(mem_size // (2 * size - 2)), "bytes per entity")
+        del mesh
@@ -0,0 +1,42 @@
+# Performance testing on the TravisCI (knot span finding algorithms vs. knot vector length)
+import os
+import sys
+import platform
+import timeit
+from geomdl import helpers, linalg, utilities
+
+
+# Setup test
+def setup_test(num_ctrlpts, sample_size):
+    degree = 3
+    knotvector = utilities.generate_knot_vector(degree, num_ctrlpts)
+    knots = linalg.linspace(0.0, 1.0, sample_size)
+    return degree, knotvector, knots
+
+
+# Setup number of executions
+number = int(os.environ['GEOMDL_PERF_NUMBER']) if 'GEOMDL_PERF_NUMBER' in os.environ else 5
+repeat = int(os.environ['GEOMDL_PERF_REPEAT']) if 'GEOMDL_PERF_REPEAT' in os.environ else 3
+version = os.environ['TRAVIS_PYTHON_VERSION'] if 'TRAVIS_PYTHON_VERSION' in os.environ else ".".join(str(v) for v in sys.version_info[0:3])
+
+# Test cases: (statement name, statement)
+tests = (
+    ("linear search", "[helpers.find_span_linear(degree, kv, size, k) for k in knots]"),
+    ("binary search", "[helpers.find_span_binsearch(degree, kv, size, k) for k in knots]"),
+    ("sorted sweep", "helpers.find_spans(degree, kv, size, knots)"),
+)
+
+# Run timeit
+sample_size = 1000
+for size in (10, 100, 1000, 5000):
+    res = {}
+    for name, stmt in tests:
+        stp = "from __main__ import setup_test; from geomdl import helpers; size=" + str(size) + "; " \
+              "degree, kv, knots = setup_test(" + str(size) + ", " + str(sample_size) + ")"
+        res[name] = min(timeit.repeat(setup=stp, stmt=stmt, repeat=repeat, number=number))
+
+    # Print results
+    for name, _ in tests:
+        print(__file__, "on", platform.python_implementation(), str(version), ">>", name, "with", str(size),
+              "control points and", str(sample_size), "parameters >>", str(number), "loops, best of", str(repeat),
+              "is", str(res[name]), "seconds per loop")
@@ -0,0 +1,45 @@
+# Performance testing on the TravisCI (pure Python vs. vectorized surface evaluator)
+import os
+import sys
+import platform
+import timeit
+from geomdl import BSpline, evaluators, utilities
+
+
+# Setup test
+def setup_test(sample_size, evaluator):
+    size_u = 6
+    size_v = 5
+    ctrlpts = [[float(u), float(v), float((u * v) % 3)] for u in range(size_u) for v in range(size_v)]
+
+    ns = BSpline.Surface()
+    ns.degree_u = 3
+    ns.degree_v = 2
+    ns.set_ctrlpts(ctrlpts, size_u, size_v)
+    ns.knotvector_u = utilities.generate_knot_vector(ns.degree_u, size_u)
+    ns.knotvector_v = utilities.generate_knot_vector(ns.degree_v, size_v)
+    ns.sample_size = sample_size
+    ns.evaluator = evaluator
+
+    return ns
+
+
+# Setup number of executions
+number = int(os.environ['GEOMDL_PERF_NUMBER']) if 'GEOMDL_PERF_NUMBER' in os.environ else 1
+repeat = int(os.environ['GEOMDL_PERF_REPEAT']) if 'GEOMDL_PERF_REPEAT' in os.environ else 3
+version = os.environ['TRAVIS_PYTHON_VERSION'] if 'TRAVIS_PYTHON_VERSION' in os.environ else ".".join(str(v) for v in sys.version_info[0:3])
+
+# Run timeit
+for size in (100, 500):
+    res = {}
+    for evl in (evaluators.SurfaceEvaluator, evaluators.SurfaceEvaluatorVectorized):
+        stp = "from __main__ import setup_test; from geomdl import evaluators; " \
+              "ns=setup_test(" + str(size) + ", evaluators." + evl.__name__ + "())"
+        res[evl.__name__] = min(timeit.repeat(setup=stp, stmt="ns.evaluate()", repeat=repeat, number=number))
+
+    # Print results
+    for name, val in res.items():
+        print(__file__, "on", platform.python_implementation(), str(version), ">>", name, "with sample size",
+              str(size), "x", str(size), ">>", str(number), "loops, best of", str(repeat), "is", str(val),
+              "seconds per loop")
+    print("Speedup:", str(res['SurfaceEvaluator'] / res['SurfaceEvaluatorVectorized']))
@@ -0,0 +1,38 @@
+# Performance testing on the TravisCI (triangular mesh generation vs. number of triangles)
+import os
+import sys
+import platform
+import time
+from geomdl import tessellate
+
+
+# Setup test
+def setup_test(num_triangles):
+    # A grid of n x n points generates 2 * (n - 1)^2 triangles
+    size = int(round((num_triangles / 2.0) ** 0.5)) + 1
+    points = [[float(i), float(j), 0.0] for i in range(size) for j in range(size)]
+    return points, size
+
+
+# Setup number of executions
+repeat = int(os.environ['GEOMDL_PERF_REPEAT']) if 'GEOMDL_PERF_REPEAT' in os.environ else 3
+max_triangles = int(os.environ['GEOMDL_PERF_MAX_TRIANGLES']) if 'GEOMDL_PERF_MAX_TRIANGLES' in os.environ else 1000000
+version = os.environ['TRAVIS_PYTHON_VERSION'] if 'TRAVIS_PYTHON_VERSION' in os.environ else ".".join(str(v) for v in sys.version_info[0:3])
+
+# Run the test for 10k, 100k, 1M and 10M triangles (set GEOMDL_PERF_MAX_TRIANGLES=10000000 for the largest one)
+for num in (10000, 100000, 1000000, 10000000):
+    if num > max_triangles:
+        break
+    pts, sz = setup_test(num)
+    res = []
+    for _ in range(repeat if num < 1000000 else 1):
+        start = time.time()
+        vertices, triangles = tessellate.make_triangle_mesh(pts, sz, sz)
+        res.append(time.time() - start)
+        del vertices, triangles
+    num_tris = 2 * (sz - 1) ** 2
+
+    # Print results, linear scaling keeps the time per triangle constant
+    print(__file__, "on", platform.python_implementation(), str(version), ">> make_triangle_mesh with",
+          str(num_tris), "triangles >> best of", str(len(res)), "is", str(min(res)), "seconds,",
+          str(min(res) / num_tris * 1e6), "microseconds per triangle")
@@ -8,7 +8,7 @@
 """
 
 import pickle
-from . import abstract, evaluators, operations, tessellate, utilities
+from . import abstract, elements, evaluators, operations, tessellate, utilities, helpers, linalg
 from . import _utilities as utl
 from .exceptions import GeomdlException
 
@@ -62,9 +62,11 @@ class Curve(abstract.Curve):
 
     * ``precision``: number of decimal places to round to. *Default: 18*
     * ``normalize_kv``: activates knot vector normalization. *Default: True*
-    * ``find_span_func``: sets knot span search implementation. *Default:* :func:`.helpers.find_span_linear`
+    * ``find_span_func``: sets knot span search implementation. *Default:* :func:`.helpers.find_span_binsearch`
     * ``insert_knot_func``: sets knot insertion implementation. *Default:* :func:`.operations.insert_knot`
     * ``remove_knot_func``: sets knot removal implementation. *Default:* :func:`.operations.remove_knot`
+    * ``array_storage``: stores the control points in a contiguous NumPy array. *Default: False*
+    * ``single_precision``: stores the evaluated points as float32 values. *Default: False*
 
     Please refer to the :py:class:`.abstract.Curve()` documentation for more details.
     """
@@ -147,9 +149,60 @@ class Curve(abstract.Curve):
         cpts = self._evaluator.evaluate(start=start, stop=stop,
                                         degree=self.degree, knotvector=self.knotvector,
                                         ctrlpts=self._control_points, sample_size=self.sample_size,
-                                        dimension=self._dimension, precision=self._precision)
+                                        dimension=self._dimension, precision=self._eval_precision(),
+                                        ctrlpts_version=self._ctrlpts_version)
 
-        self._eval_points = cpts
+        self._eval_points = elements.PointGrid(cpts, [self.sample_size], typecode='f') if self._single_precision \
+            else cpts
+        self._eval_range = (start, stop)
+
+    def update_ctrlpt(self, index, value):
+        """ Updates a single control point.
+
+        Moving a control point changes the curve only on the knot spans it is defined on. Therefore, the evaluated
+        points are not reset and only the affected ones are re-evaluated when :py:attr:`evalpts` is accessed.
+
+        :param index: index of the control point
+        :type index: int
+        :param value: new control point
+        :type value: list, tuple
+        """
+        if not 0 <= index < self.ctrlpts_size:
+            raise GeomdlException("Control point index is out of range")
+        if len(value) != self._dimension:
+            raise GeomdlException("The input must be " + str(self._dimension) + " dimensional")
+
+        # Update the control point and clear the bounding box
+        self._own_buffers()
+        self._control_points[index] = [float(c) for c in value]
+        self._ctrlpts_version += 1
+        self._bounding_box = self._init_array()
+
+        # Mark the control point for re-evaluation
+        if self._eval_points:
+            self._dirty_ctrlpts.add(index)
+
+    def _update_evalpts(self):
+        """ Re-evaluates the points affected by the updated control points. """
+        self._own_buffers()
+        start, stop = self._eval_range
+        knots = linalg.linspace(start, stop, self.sample_size, decimals=self._eval_precision())
+        spans = helpers.find_spans(self.degree, self.knotvector, self.ctrlpts_size, knots, self._span_func)
+
+        # Control point i is used for evaluating the points on the knot spans i, ..., i + p
+        dirty_spans = set(i + k for i in self._dirty_ctrlpts for k in range(self.degree + 1))
+        indices = [idx for idx, span in enumerate(spans) if span in dirty_spans]
+
+        # Evaluate the affected points in one pass
+        cpts = self._evaluator.evaluate_list(parameters=[knots[idx] for idx in indices],
+                                             degree=self.degree, knotvector=self.knotvector,
+                                             ctrlpts=self._control_points, sample_size=self.sample_size,
+                                             dimension=self._dimension, precision=self._precision,
+                                             ctrlpts_version=self._ctrlpts_version)
+        for idx, pt in zip(indices, cpts):
+            self._eval_points[idx] = pt
+
+        self._dirty_ctrlpts.clear()
 
     def evaluate_single(self, param):
         """ Evaluates the curve at the input parameter.
@@ -171,7 +224,8 @@ class Curve(abstract.Curve):
         pt = self._evaluator.evaluate(start=param, stop=param,
                                       degree=self.degree, knotvector=self.knotvector,
                                       ctrlpts=self._control_points, sample_size=self.sample_size,
-                                      dimension=self._dimension, precision=self._precision)
+                                      dimension=self._dimension, precision=self._precision,
+                                      ctrlpts_version=self._ctrlpts_version)
 
         return pt[0]
 
@@ -186,15 +240,16 @@ class Curve(abstract.Curve):
         # Call parent method
         super(Curve, self).evaluate_list(param_list)
 
-        # Evaluate parameter list
-        res = []
-        for prm in param_list:
-            if self._kv_normalize:
-                if utilities.check_params([prm]):
-                    res.append(self.evaluate_single(prm))
-            else:
-                res.append(self.evaluate_single(prm))
-        return res
+        # Filter parameter list
+        if self._kv_normalize:
+            param_list = [prm for prm in param_list if utilities.check_params([prm])]
+
+        # Evaluate all parameters in one pass
+        return self._evaluator.evaluate_list(parameters=param_list,
+                                             degree=self.degree, knotvector=self.knotvector,
+                                             ctrlpts=self._control_points, sample_size=self.sample_size,
+                                             dimension=self._dimension, precision=self._precision,
+                                             ctrlpts_version=self._ctrlpts_version)
 
     def derivatives(self, u, order=0, **kwargs):
         """ Evaluates n-th order curve derivatives at the given parameter value.
@@ -214,6 +269,29 @@ class Curve(abstract.Curve):
                                            knotvector=self.knotvector, ctrlpts=self._control_points,
                                            dimension=self._dimension)
 
+    def derivatives_list(self, param_list, order=0):
+        """ Evaluates n-th order curve derivatives for an input range of parameters.
+
+        :param param_list: list of parameters
+        :type param_list: list, tuple
+        :param order: derivative order
+        :type order: int
+        :return: a list containing up to {order}-th derivatives of the curve for each parameter
+        :rtype: list
+        """
+        # Check all variables are set before the evaluation
+        self._check_variables()
+
+        # Check parameters
+        if self._kv_normalize:
+            if not utilities.check_params(param_list):
+                raise GeomdlException("Parameters should be between 0 and 1")
+
+        # Evaluate and return the derivatives at all parameters in one pass
+        return self._evaluator.derivatives_list(parameters=param_list, deriv_order=order, degree=self.degree,
+                                                knotvector=self.knotvector, ctrlpts=self._control_points,
+                                                dimension=self._dimension)
+
     def insert_knot(self, param, **kwargs):
         """ Inserts the knot and updates the control points array and the knot vector.
 
@@ -410,9 +488,13 @@ class Surface(abstract.Surface):
 
     * ``precision``: number of decimal places to round to. *Default: 18*
     * ``normalize_kv``: activates knot vector normalization. *Default: True*
-    * ``find_span_func``: sets knot span search implementation. *Default:* :func:`.helpers.find_span_linear`
+    * ``find_span_func``: sets knot span search implementation. *Default:* :func:`.helpers.find_span_binsearch`
     * ``insert_knot_func``: sets knot insertion implementation. *Default:* :func:`.operations.insert_knot`
     * ``remove_knot_func``: sets knot removal implementation. *Default:* :func:`.operations.remove_knot`
+    * ``array_storage``: stores the control points in a contiguous NumPy array. *Default: False*
+    * ``single_precision``: stores the evaluated points as float32 values. *Default: False*
+    * ``lod_cache_size``: maximum number of the levels of detail in the cache. *Default: 8*
+    * ``lod_cache_memory``: memory budget of the level of detail cache in bytes. *Default: 64 MB*
 
     Please refer to the :py:class:`.abstract.Surface()` documentation for more details.
     """
@@ -480,15 +562,24 @@ class Surface(abstract.Surface):
         Please refer to the `wiki <https://github.com/orbingol/NURBS-Python/wiki/Using-Python-Properties>`_ for details
         on using this class member.
 
+        The 2-dimensional array is generated on first access and it is regenerated after the control points are
+        updated. If the surface is initialized with ``array_storage=True``, the getter returns a (size_u, size_v,
+        dimension) view of the control points array.
+
         :getter: Gets the control points as a 2-dimensional array in [u][v] format
         :setter: Sets the control points as a 2-dimensional array in [u][v] format
         :type: list
         """
+        self._own_buffers()
+        if len(self._control_points2D) == 0 and len(self._control_points) > 0:
+            # Generate a 2-dimensional list of control points
+            size_u, size_v = self._control_points_size
+            self._control_points2D = [self._control_points[(i * size_v):((i + 1) * size_v)] for i in range(size_u)]
         return self._control_points2D
 
     @ctrlpts2d.setter
     def ctrlpts2d(self, value):
-        if not isinstance(value, (list, tuple)):
+        if not isinstance(value, (list, tuple)) and getattr(value, 'ndim', 0) != 3:
             raise ValueError("The input must be a list or tuple")
 
         # Clean up the surface and control points
@@ -532,15 +623,13 @@ class Surface(abstract.Surface):
         # Call parent function
         super(Surface, self).set_ctrlpts(ctrlpts, *args, **kwargs)
 
-        # Generate a 2-dimensional list of control points
-        array_init2d = kwargs.get('array_init2d', [[[] for _ in range(args[1])] for _ in range(args[0])])
-        ctrlpts_float2d = array_init2d
-        for i in range(0, self.ctrlpts_size_u):
-            for j in range(0, self.ctrlpts_size_v):
-                ctrlpts_float2d[i][j] = self._control_points[j + (i * self.ctrlpts_size_v)]
+        # The 2-dimensional array of control points is a view of the contiguous array
+        if self._array_storage:
+            self._control_points2D = self._control_points.reshape(args[0], args[1], self._dimension)
+            return
 
-        # Set the new 2-dimension control points
-        self._control_points2D = ctrlpts_float2d
+        # The 2-dimensional list of control points is generated on first access
+        self._control_points2D = self._init_array()
 
     def reset(self, **kwargs):
         """ Resets control points and/or evaluated points.
@@ -558,6 +647,21 @@ class Surface(abstract.Surface):
         if reset_ctrlpts:
             self._control_points2D = self._init_array()
 
+    def _cow_buffers(self):
+        # Call parent method
+        return super(Surface, self)._cow_buffers() + [self._control_points2D]
+
+    def _own_buffers(self):
+        if not self._cow_shared:
+            return
+        # Call parent method
+        super(Surface, self)._own_buffers()
+        # The 2-dimensional list contains the shared points, the array view needs to be regenerated
+        if not self._array_storage:
+            self._control_points2D = self._init_array()
+        elif len(self._control_points) > 0:
+            self._control_points2D = self._control_points.reshape(self._control_points2D.shape)
+
     def save(self, file_name):
         """ Saves the surface as a pickled file.
 
@@ -631,17 +735,95 @@ class Surface(abstract.Surface):
             if not utilities.check_params([start_u, stop_u, start_v, stop_v]):
                 raise GeomdlException("Parameters should be between 0 and 1")
 
-        # Clean up the surface points
-        self.reset(evalpts=True)
+        # Clean up the surface points, the levels of detail don't depend on the evaluated points
+        self.reset(evalpts=True, lod=False)
 
         # Evaluate
         spts = self._evaluator.evaluate(start=(start_u, start_v), stop=(stop_u, stop_v),
                                         degree=self._degree, knotvector=self._knot_vector,
                                         ctrlpts_size=self._control_points_size, ctrlpts=self._control_points,
                                         sample_size=self.sample_size, dimension=self._dimension,
-                                        precision=self._precision)
+                                        precision=self._eval_precision(), ctrlpts_version=self._ctrlpts_version,
+                                        as_array=True)
 
-        self._eval_points = spts
+        self._eval_points = elements.PointGrid(spts, self.sample_size, typecode='f' if self._single_precision else 'd')
+        self._eval_range = ((start_u, start_v), (stop_u, stop_v))
+
+    def update_ctrlpt(self, index_u, index_v, value):
+        """ Updates a single control point.
+
+        Moving a control point changes the surface only on the knot spans it is defined on. Therefore, the evaluated
+        points are not reset and only the affected ones are re-evaluated when :py:attr:`evalpts` is accessed.
+
+        .. code-block:: python
+
+            surf.evaluate()
+
+            # Move the control point at u = 2, v = 3
+            surf.update_ctrlpt(2, 3, [1.0, 2.0, 5.0])
+
+            # Re-evaluates the points around the updated control point
+            surface_points = surf.evalpts
+
+        :param index_u: index of the control point on the u-direction
+        :type index_u: int
+        :param index_v: index of the control point on the v-direction
+        :type index_v: int
+        :param value: new control point
+        :type value: list, tuple
+        """
+        if not 0 <= index_u < self.ctrlpts_size_u or not 0 <= index_v < self.ctrlpts_size_v:
+            raise GeomdlException("Control point index is out of range")
+        if len(value) != self._dimension:
+            raise GeomdlException("The input must be " + str(self._dimension) + " dimensional")
+
+        # Update the control point and clear the bounding box
+        self._own_buffers()
+        cpt = [float(c) for c in value]
+        self._control_points[index_v + (index_u * self.ctrlpts_size_v)] = cpt
+        self._ctrlpts_version += 1
+        if not self._array_storage:
+            self._control_points2D = self._init_array()
+        self._bounding_box = self._init_array()
+
+        # The tessellation depends on the evaluated points
+        self._tsl_component.reset()
+        self._lod_cache.clear()
+
+        # Mark the control point for re-evaluation
+        if self._eval_points:
+            self._dirty_ctrlpts.add((index_u, index_v))
+
+    def _update_evalpts(self):
+        """ Re-evaluates the points affected by the updated control points. """
+        self._own_buffers()
+        start, stop = self._eval_range
+        knots = [[] for _ in range(self.pdimension)]
+        spans = [[] for _ in range(self.pdimension)]
+        for idx in range(self.pdimension):
+            knots[idx] = linalg.linspace(start[idx], stop[idx], self.sample_size[idx],
+                                         decimals=self._eval_precision())
+            spans[idx] = helpers.find_spans(self._degree[idx], self._knot_vector[idx],
+                                            self._control_points_size[idx], knots[idx], self._span_func)
+
+        # Control point (i, j) is used for evaluating the points on the knot spans (i, ..., i + p) x (j, ..., j + q)
+        indices = set()
+        for i, j in self._dirty_ctrlpts:
+            idx_u = [idx for idx, span in enumerate(spans[0]) if i <= span <= i + self._degree[0]]
+            idx_v = [idx for idx, span in enumerate(spans[1]) if j <= span <= j + self._degree[1]]
+            indices.update((iu, iv) for iu in idx_u for iv in idx_v)
+        indices = sorted(indices)
+
+        # Evaluate the affected points in one pass
+        spts = self._evaluator.evaluate_list(parameters=[(knots[0][iu], knots[1][iv]) for iu, iv in indices],
+                                             degree=self._degree, knotvector=self._knot_vector,
+                                             ctrlpts_size=self._control_points_size, ctrlpts=self._control_points,
+                                             sample_size=self.sample_size, dimension=self._dimension,
+                                             precision=self._precision, ctrlpts_version=self._ctrlpts_version)
+        for (iu, iv), pt in zip(indices, spts):
+            self._eval_points[iv + (iu * len(knots[1]))] = pt
+
+        self._dirty_ctrlpts.clear()
 
     def evaluate_single(self, param):
         """ Evaluates the surface at the input (u, v) parameter pair.
@@ -659,7 +841,7 @@ class Surface(abstract.Surface):
                                       degree=self._degree, knotvector=self._knot_vector,
                                       ctrlpts_size=self._control_points_size, ctrlpts=self._control_points,
                                       sample_size=self.sample_size, dimension=self._dimension,
-                                      precision=self._precision)
+                                      precision=self._precision, ctrlpts_version=self._ctrlpts_version)
 
         return pt[0]
 
@@ -674,15 +856,16 @@ class Surface(abstract.Surface):
         # Call parent method
         super(Surface, self).evaluate_list(param_list)
 
-        # Evaluate (u,v) list
-        res = []
-        for prm in param_list:
-            if self._kv_normalize:
-                if utilities.check_params(prm):
-                    res.append(self.evaluate_single(prm))
-            else:
-                res.append(self.evaluate_single(prm))
-        return res
+        # Filter (u,v) list
+        if self._kv_normalize:
+            param_list = [prm for prm in param_list if utilities.check_params(prm)]
+
+        # Evaluate all (u,v) pairs in one pass
+        return self._evaluator.evaluate_list(parameters=param_list,
+                                             degree=self._degree, knotvector=self._knot_vector,
+                                             ctrlpts_size=self._control_points_size, ctrlpts=self._control_points,
+                                             sample_size=self.sample_size, dimension=self._dimension,
+                                             precision=self._precision, ctrlpts_version=self._ctrlpts_version)
 
     # Evaluates n-th order surface derivatives at the given (u,v) parameter
     def derivatives(self, u, v, order=0, **kwargs):
@@ -710,6 +893,31 @@ class Surface(abstract.Surface):
                                            ctrlpts_size=self._control_points_size, ctrlpts=self._control_points,
                                            dimension=self._dimension)
 
+    def derivatives_list(self, param_list, order=0):
+        """ Evaluates n-th order surface derivatives for a given list of (u, v) parameters.
+
+        :param param_list: list of parameter pairs (u, v)
+        :type param_list: list, tuple
+        :param order: derivative order
+        :type order: int
+        :return: a list of SKL arrays for each parameter pair, see :py:meth:`derivatives` for the SKL format
+        :rtype: list
+        """
+        # Check all variables are set before the evaluation
+        self._check_variables()
+
+        # Check parameters
+        if self._kv_normalize:
+            for prm in param_list:
+                if not utilities.check_params(prm):
+                    raise GeomdlException("Parameters should be between 0 and 1")
+
+        # Evaluate and return the derivatives at all parameter pairs in one pass
+        return self._evaluator.derivatives_list(parameters=param_list, deriv_order=order,
+                                                degree=self._degree, knotvector=self._knot_vector,
+                                                ctrlpts_size=self._control_points_size, ctrlpts=self._control_points,
+                                                dimension=self._dimension)
+
     def insert_knot(self, u=None, v=None, **kwargs):
         """ Inserts knot(s) on the u- or v-directions
 
@@ -867,9 +1075,11 @@ class Volume(abstract.Volume):
 
     * ``precision``: number of decimal places to round to. *Default: 18*
     * ``normalize_kv``: activates knot vector normalization. *Default: True*
-    * ``find_span_func``: sets knot span search implementation. *Default:* :func:`.helpers.find_span_linear`
+    * ``find_span_func``: sets knot span search implementation. *Default:* :func:`.helpers.find_span_binsearch`
     * ``insert_knot_func``: sets knot insertion implementation. *Default:* :func:`.operations.insert_knot`
     * ``remove_knot_func``: sets knot removal implementation. *Default:* :func:`.operations.remove_knot`
+    * ``array_storage``: stores the control points in a contiguous NumPy array. *Default: False*
+    * ``single_precision``: stores the evaluated points as float32 values. *Default: False*
 
     Please refer to the :py:class:`.abstract.Volume()` documentation for more details.
     """
@@ -943,8 +1153,8 @@ class Volume(abstract.Volume):
                                         degree=self._degree, knotvector=self._knot_vector,
                                         ctrlpts_size=self._control_points_size, ctrlpts=self._control_points,
                                         sample_size=self.sample_size, dimension=self._dimension,
-                                        precision=self._precision)
-        self._eval_points = vpts
+                                        precision=self._eval_precision(), as_array=True)
+        self._eval_points = elements.PointGrid(vpts, self.sample_size, typecode='f' if self._single_precision else 'd')
 
     def evaluate_single(self, param):
         """ Evaluates the volume at the input (u, v, w) parameter.
@@ -982,15 +1192,16 @@ class Volume(abstract.Volume):
         # Call parent method
         super(Volume, self).evaluate_list(param_list)
 
-        # Evaluate (u, v, w) list
-        res = []
-        for prm in param_list:
-            if self._kv_normalize:
-                if utilities.check_params(prm):
-                    res.append(self.evaluate_single(prm))
-            else:
-                res.append(self.evaluate_single(prm))
-        return res
+        # Filter (u, v, w) list
+        if self._kv_normalize:
+            param_list = [prm for prm in param_list if utilities.check_params(prm)]
+
+        # Evaluate all (u, v, w) triplets in one pass
+        return self._evaluator.evaluate_list(parameters=param_list,
+                                             degree=self._degree, knotvector=self._knot_vector,
+                                             ctrlpts_size=self._control_points_size, ctrlpts=self._control_points,
+                                             sample_size=self.sample_size, dimension=self._dimension,
+                                             precision=self._precision)
 
     def insert_knot(self, u=None, v=None, w=None, **kwargs):
         """ Inserts knot(s) on the u-, v- and w-directions
@@ -9,6 +9,24 @@
 
 from . import BSpline, compatibility, evaluators
 from ._utilities import export
+from .exceptions import GeomdlException
+try:
+    from . import _arrays
+except ImportError:
+    _arrays = None
+
+
+def _separate_ctrlpts_weights(obj):
+    """ Separates the weighted control points of the rational geometry into the control points and the weights.
+
+    :param obj: rational geometry
+    :return: unweighted control points and weights
+    :rtype: tuple
+    """
+    if obj._array_storage and len(obj._control_points) > 0:
+        return _arrays.separate_ctrlpts_weights(obj._control_points)
+    c, w = compatibility.separate_ctrlpts_weights(obj._control_points)
+    return [crd for crd in c], w
 
 
 @export
@@ -71,9 +89,11 @@ class Curve(BSpline.Curve):
 
     * ``precision``: number of decimal places to round to. *Default: 18*
     * ``normalize_kv``: activates knot vector normalization. *Default: True*
-    * ``find_span_func``: sets knot span search implementation. *Default:* :func:`.helpers.find_span_linear`
+    * ``find_span_func``: sets knot span search implementation. *Default:* :func:`.helpers.find_span_binsearch`
     * ``insert_knot_func``: sets knot insertion implementation. *Default:* :func:`.operations.insert_knot`
     * ``remove_knot_func``: sets knot removal implementation. *Default:* :func:`.operations.remove_knot`
+    * ``array_storage``: stores the control points in a contiguous NumPy array. *Default: False*
+    * ``single_precision``: stores the evaluated points as float32 values. *Default: False*
 
     Please refer to the :py:class:`.abstract.Curve()` documentation for more details.
     """
@@ -88,13 +108,43 @@ class Curve(BSpline.Curve):
     def __deepcopy__(self, memo):
         # Call parent method
         result = super(Curve, self).__deepcopy__(memo)
-        result.init_cache()
+        # Share the unweighted control points and the weights with the copy (copy-on-write)
+        result._cache['ctrlpts'] = self._cache['ctrlpts']
+        result._cache['weights'] = self._cache['weights']
         return result
 
     def init_cache(self):
         self._cache['ctrlpts'] = self._init_array()
         self._cache['weights'] = self._init_array()
 
+    def update_cache(self):
+        """ Separates the weighted control points into the unweighted control points and the weights cache. """
+        if len(self._control_points) == 0:
+            self.init_cache()
+            return
+        self._cache['ctrlpts'], self._cache['weights'] = _separate_ctrlpts_weights(self)
+
+    def _own_buffers(self):
+        if not self._cow_shared:
+            return
+        # Call parent method
+        super(Curve, self)._own_buffers()
+        # Regenerate the unweighted control points and the weights (view) from the private control points
+        self.update_cache()
+
+    def set_ctrlpts(self, ctrlpts, *args, **kwargs):
+        """ Sets the weighted control points and updates the unweighted control points and the weights.
+
+        The unweighted control points and the weights are separated only once, while setting the weighted control
+        points. Please see :py:meth:`.BSpline.Curve.set_ctrlpts` for details.
+
+        :param ctrlpts: input weighted control points as a list of coordinates
+        :type ctrlpts: list
+        """
+        # Call parent method
+        super(Curve, self).set_ctrlpts(ctrlpts, *args, **kwargs)
+        self.update_cache()
+
     @property
     def ctrlptsw(self):
         """ Weighted control points (Pw).
@@ -107,6 +157,7 @@ class Curve(BSpline.Curve):
         :getter: Gets the weighted control points
         :setter: Sets the weighted control points
         """
+        self._own_buffers()
         return self._control_points
 
     @ctrlptsw.setter
@@ -124,17 +175,13 @@ class Curve(BSpline.Curve):
         :setter: Sets unweighted control points
         :type: list
         """
-        # Populate the cache, if necessary
-        if not self._cache['ctrlpts']:
-            c, w = compatibility.separate_ctrlpts_weights(self._control_points)
-            self._cache['ctrlpts'] = [crd for crd in c]
-            self._cache['weights'] = w
+        self._own_buffers()
         return self._cache['ctrlpts']
 
     @ctrlpts.setter
     def ctrlpts(self, value):
         # Check if we can retrieve the existing weights. If not, generate a weights vector of 1.0s.
-        if not self.weights:
+        if len(self.weights) == 0:
             weights = [1.0 for _ in range(len(value))]
         else:
             weights = self.weights
@@ -156,16 +203,12 @@ class Curve(BSpline.Curve):
         :setter: Sets the weights vector
         :type: list
         """
-        # Populate the cache, if necessary
-        if not self._cache['weights']:
-            c, w = compatibility.separate_ctrlpts_weights(self._control_points)
-            self._cache['ctrlpts'] = [crd for crd in c]
-            self._cache['weights'] = w
+        self._own_buffers()
         return self._cache['weights']
 
     @weights.setter
     def weights(self, value):
-        if not self.ctrlpts:
+        if len(self.ctrlpts) == 0:
             raise ValueError("Set control points first")
 
         # Generate weighted control points using the new weights
@@ -174,6 +217,27 @@ class Curve(BSpline.Curve):
         # Set new weighted control points
         self.set_ctrlpts(ctrlptsw)
 
+    def update_ctrlpt(self, index, value):
+        """ Updates a single unweighted control point using its existing weight.
+
+        Please see :py:meth:`.BSpline.Curve.update_ctrlpt` for details.
+
+        :param index: index of the control point
+        :type index: int
+        :param value: new unweighted control point
+        :type value: list, tuple
+        """
+        if not 0 <= index < self.ctrlpts_size:
+            raise GeomdlException("Control point index is out of range")
+
+        # Generate the weighted control point
+        weight = self._control_points[index][-1]
+        super(Curve, self).update_ctrlpt(index, [float(c * weight) for c in value] + [weight])
+
+        # Update the cache
+        if len(self._cache['ctrlpts']) > 0:
+            self._cache['ctrlpts'][index] = [float(c) for c in value]
+
     def reset(self, **kwargs):
         """ Resets control points and/or evaluated points.
 
@@ -190,9 +254,14 @@ class Curve(BSpline.Curve):
         super(Curve, self).reset(ctrlpts=reset_ctrlpts, evalpts=reset_evalpts)
 
         if reset_ctrlpts:
-            # Delete the caches
-            self._cache['ctrlpts'] = self._init_array()
-            self._cache['weights'][:] = self._init_array()
+            # Re-initialize the caches
+            self.init_cache()
+
+    def reverse(self):
+        """ Reverses the curve """
+        # Call parent method
+        super(Curve, self).reverse()
+        self.update_cache()
 
 
 @export
@@ -275,9 +344,13 @@ class Surface(BSpline.Surface):
 
     * ``precision``: number of decimal places to round to. *Default: 18*
     * ``normalize_kv``: activates knot vector normalization. *Default: True*
-    * ``find_span_func``: sets knot span search implementation. *Default:* :func:`.helpers.find_span_linear`
+    * ``find_span_func``: sets knot span search implementation. *Default:* :func:`.helpers.find_span_binsearch`
     * ``insert_knot_func``: sets knot insertion implementation. *Default:* :func:`.operations.insert_knot`
     * ``remove_knot_func``: sets knot removal implementation. *Default:* :func:`.operations.remove_knot`
+    * ``array_storage``: stores the control points in a contiguous NumPy array. *Default: False*
+    * ``single_precision``: stores the evaluated points as float32 values. *Default: False*
+    * ``lod_cache_size``: maximum number of the levels of detail in the cache. *Default: 8*
+    * ``lod_cache_memory``: memory budget of the level of detail cache in bytes. *Default: 64 MB*
 
     Please refer to the :py:class:`.abstract.Surface()` documentation for more details.
     """
@@ -292,13 +365,43 @@ class Surface(BSpline.Surface):
     def __deepcopy__(self, memo):
         # Call parent method
         result = super(Surface, self).__deepcopy__(memo)
-        result.init_cache()
+        # Share the unweighted control points and the weights with the copy (copy-on-write)
+        result._cache['ctrlpts'] = self._cache['ctrlpts']
+        result._cache['weights'] = self._cache['weights']
         return result
 
     def init_cache(self):
         self._cache['ctrlpts'] = self._init_array()
         self._cache['weights'] = self._init_array()
 
+    def update_cache(self):
+        """ Separates the weighted control points into the unweighted control points and the weights cache. """
+        if len(self._control_points) == 0:
+            self.init_cache()
+            return
+        self._cache['ctrlpts'], self._cache['weights'] = _separate_ctrlpts_weights(self)
+
+    def _own_buffers(self):
+        if not self._cow_shared:
+            return
+        # Call parent method
+        super(Surface, self)._own_buffers()
+        # Regenerate the unweighted control points and the weights (view) from the private control points
+        self.update_cache()
+
+    def set_ctrlpts(self, ctrlpts, *args, **kwargs):
+        """ Sets the weighted control points and updates the unweighted control points and the weights.
+
+        The unweighted control points and the weights are separated only once, while setting the weighted control
+        points. Please see :py:meth:`.BSpline.Surface.set_ctrlpts` for details.
+
+        :param ctrlpts: input weighted control points as a list of coordinates
+        :type ctrlpts: list
+        """
+        # Call parent method
+        super(Surface, self).set_ctrlpts(ctrlpts, *args, **kwargs)
+        self.update_cache()
+
     @property
     def ctrlptsw(self):
         """ 1-dimensional array of weighted control points (Pw).
@@ -310,6 +413,7 @@ class Surface(BSpline.Surface):
         :getter: Gets weighted control points
         :setter: Sets weighted control points
         """
+        self._own_buffers()
         return self._control_points
 
     @ctrlptsw.setter
@@ -328,10 +432,7 @@ class Surface(BSpline.Surface):
         :setter: Sets unweighted control points.
         :type: list
         """
-        if not self._cache['ctrlpts']:
-            c, w = compatibility.separate_ctrlpts_weights(self._control_points)
-            self._cache['ctrlpts'] = [crd for crd in c]
-            self._cache['weights'] = w
+        self._own_buffers()
         return self._cache['ctrlpts']
 
     @ctrlpts.setter
@@ -340,7 +441,7 @@ class Surface(BSpline.Surface):
             raise ValueError("Please set the number of control points on the u- and v-directions")
 
         # Check if we can retrieve the existing weights. If not, generate a weights vector of 1.0s.
-        if not self.weights:
+        if len(self.weights) == 0:
             weights = [1.0 for _ in range(len(value))]
         else:
             weights = self.weights
@@ -359,15 +460,12 @@ class Surface(BSpline.Surface):
         :setter: Sets the weights vector
         :type: list
         """
-        if not self._cache['weights']:
-            c, w = compatibility.separate_ctrlpts_weights(self._control_points)
-            self._cache['ctrlpts'] = [crd for crd in c]
-            self._cache['weights'] = w
+        self._own_buffers()
         return self._cache['weights']
 
     @weights.setter
     def weights(self, value):
-        if not self.ctrlpts:
+        if len(self.ctrlpts) == 0:
             raise ValueError("Set control points first")
 
         # Generate weighted control points using the new weights
@@ -376,6 +474,30 @@ class Surface(BSpline.Surface):
         # Set weighted control points
         self.set_ctrlpts(ctrlptsw, self.ctrlpts_size_u, self.ctrlpts_size_v)
 
+    def update_ctrlpt(self, index_u, index_v, value):
+        """ Updates a single unweighted control point using its existing weight.
+
+        Please see :py:meth:`.BSpline.Surface.update_ctrlpt` for details.
+
+        :param index_u: index of the control point on the u-direction
+        :type index_u: int
+        :param index_v: index of the control point on the v-direction
+        :type index_v: int
+        :param value: new unweighted control point
+        :type value: list, tuple
+        """
+        if not 0 <= index_u < self.ctrlpts_size_u or not 0 <= index_v < self.ctrlpts_size_v:
+            raise GeomdlException("Control point index is out of range")
+
+        # Generate the weighted control point
+        index = index_v + (index_u * self.ctrlpts_size_v)
+        weight = self._control_points[index][-1]
+        super(Surface, self).update_ctrlpt(index_u, index_v, [float(c * weight) for c in value] + [weight])
+
+        # Update the cache
+        if len(self._cache['ctrlpts']) > 0:
+            self._cache['ctrlpts'][index] = [float(c) for c in value]
+
     def reset(self, **kwargs):
         """ Resets control points and/or evaluated points.
 
@@ -383,13 +505,15 @@ class Surface(BSpline.Surface):
 
             * ``evalpts``: if True, then resets evaluated points
             * ``ctrlpts`` if True, then resets control points
+            * ``lod``: if True, then resets the levels of detail. *Default: True*
 
         """
         reset_ctrlpts = kwargs.get('ctrlpts', False)
         reset_evalpts = kwargs.get('evalpts', False)
+        reset_lod = kwargs.get('lod', True)
 
         # Call parent function
-        super(Surface, self).reset(ctrlpts=reset_ctrlpts, evalpts=reset_evalpts)
+        super(Surface, self).reset(ctrlpts=reset_ctrlpts, evalpts=reset_evalpts, lod=reset_lod)
 
         if reset_ctrlpts:
             # Re-initialize the caches
@@ -444,9 +568,11 @@ class Volume(BSpline.Volume):
 
     * ``precision``: number of decimal places to round to. *Default: 18*
     * ``normalize_kv``: activates knot vector normalization. *Default: True*
-    * ``find_span_func``: sets knot span search implementation. *Default:* :func:`.helpers.find_span_linear`
+    * ``find_span_func``: sets knot span search implementation. *Default:* :func:`.helpers.find_span_binsearch`
     * ``insert_knot_func``: sets knot insertion implementation. *Default:* :func:`.operations.insert_knot`
     * ``remove_knot_func``: sets knot removal implementation. *Default:* :func:`.operations.remove_knot`
+    * ``array_storage``: stores the control points in a contiguous NumPy array. *Default: False*
+    * ``single_precision``: stores the evaluated points as float32 values. *Default: False*
 
     Please refer to the :py:class:`.abstract.Volume()` documentation for more details.
     """
@@ -461,13 +587,43 @@ class Volume(BSpline.Volume):
     def __deepcopy__(self, memo):
         # Call parent method
         result = super(Volume, self).__deepcopy__(memo)
-        result.init_cache()
+        # Share the unweighted control points and the weights with the copy (copy-on-write)
+        result._cache['ctrlpts'] = self._cache['ctrlpts']
+        result._cache['weights'] = self._cache['weights']
         return result
 
     def init_cache(self):
         self._cache['ctrlpts'] = self._init_array()
         self._cache['weights'] = self._init_array()
 
+    def update_cache(self):
+        """ Separates the weighted control points into the unweighted control points and the weights cache. """
+        if len(self._control_points) == 0:
+            self.init_cache()
+            return
+        self._cache['ctrlpts'], self._cache['weights'] = _separate_ctrlpts_weights(self)
+
+    def _own_buffers(self):
+        if not self._cow_shared:
+            return
+        # Call parent method
+        super(Volume, self)._own_buffers()
+        # Regenerate the unweighted control points and the weights (view) from the private control points
+        self.update_cache()
+
+    def set_ctrlpts(self, ctrlpts, *args, **kwargs):
+        """ Sets the weighted control points and updates the unweighted control points and the weights.
+
+        The unweighted control points and the weights are separated only once, while setting the weighted control
+        points. Please see :py:meth:`.BSpline.Volume.set_ctrlpts` for details.
+
+        :param ctrlpts: input weighted control points as a list of coordinates
+        :type ctrlpts: list
+        """
+        # Call parent method
+        super(Volume, self).set_ctrlpts(ctrlpts, *args, **kwargs)
+        self.update_cache()
+
     def reset(self, **kwargs):
         """ Resets control points and/or evaluated points.
 
@@ -498,6 +654,7 @@ class Volume(BSpline.Volume):
         :getter: Gets weighted control points
         :setter: Sets weighted control points
         """
+        self._own_buffers()
         return self._control_points
 
     @ctrlptsw.setter
@@ -516,10 +673,7 @@ class Volume(BSpline.Volume):
         :setter: Sets unweighted control points.
         :type: list
         """
-        if not self._cache['ctrlpts']:
-            c, w = compatibility.separate_ctrlpts_weights(self._control_points)
-            self._cache['ctrlpts'] = [crd for crd in c]
-            self._cache['weights'] = w
+        self._own_buffers()
         return self._cache['ctrlpts']
 
     @ctrlpts.setter
@@ -528,7 +682,7 @@ class Volume(BSpline.Volume):
             raise ValueError("Please set the number of control points for all u-, v- and w-directions")
 
         # Check if we can retrieve the existing weights. If not, generate a weights vector of 1.0s.
-        if not self.weights:
+        if len(self.weights) == 0:
             weights = [1.0 for _ in range(len(value))]
         else:
             weights = self.weights
@@ -547,15 +701,12 @@ class Volume(BSpline.Volume):
         :setter: Sets the weights vector
         :type: list
         """
-        if not self._cache['weights']:
-            c, w = compatibility.separate_ctrlpts_weights(self._control_points)
-            self._cache['ctrlpts'] = [crd for crd in c]
-            self._cache['weights'] = w
+        self._own_buffers()
         return self._cache['weights']
 
     @weights.setter
     def weights(self, value):
-        if not self.ctrlpts:
+        if len(self.ctrlpts) == 0:
             raise ValueError("Set control points first")
 
         # Generate weighted control points using the new weights
@@ -0,0 +1,85 @@
+"""
+.. module:: _arrays
+    :platform: Unix, Windows
+    :synopsis: Helper functions for contiguous array storage of the control points
+
+.. moduleauthor:: Onur Rauf Bingol <orbingol@gmail.com>
+
+"""
+
+from array import array
+import numpy as np
+
+# Initialize an empty __all__ for controlling imports
+__all__ = []
+
+
+def ctrlpts_array(ctrlpts, dimension, copy=True):
+    """ Copies the control points into a contiguous float64 array in (number of control points, dimension) shape.
+
+    If ``copy`` is False and the input is already a contiguous float64 array, it is returned without copying.
+
+    :param ctrlpts: control points
+    :type ctrlpts: list, tuple, numpy.ndarray
+    :param dimension: spatial dimension of the control points
+    :type dimension: int
+    :param copy: if False, avoids copying the input array when possible
+    :type copy: bool
+    :return: control points array
+    :rtype: numpy.ndarray
+    """
+    try:
+        if copy:
+            pts = np.array(ctrlpts, dtype=np.float64, order='C')
+        else:
+            pts = np.ascontiguousarray(ctrlpts, dtype=np.float64)
+    except (TypeError, ValueError):
+        raise ValueError("The input must be a list of " + str(dimension) + " dimensional control points")
+    if pts.ndim != 2 or pts.shape[1] != dimension:
+        raise ValueError("The input must be a list of " + str(dimension) + " dimensional control points")
+    return pts
+
+
+def separate_ctrlpts_weights(ctrlptsw):
+    """ Separates the weighted control points array into the unweighted control points and the weights.
+
+    The weights are returned as a view of the input array, i.e. no copies are made.
+
+    :param ctrlptsw: weighted control points array
+    :type ctrlptsw: numpy.ndarray
+    :return: unweighted control points and weights
+    :rtype: tuple
+    """
+    weights = ctrlptsw[:, -1]
+    return ctrlptsw[:, :-1] / weights[:, np.newaxis], weights
+
+
+def points_view(data, dimension):
+    """ Generates a (number of points, dimension) array view of the flat array of point coordinates.
+
+    :param data: flat array of point coordinates
+    :type data: array.array
+    :param dimension: spatial dimension of the points
+    :type dimension: int
+    :return: points array sharing the memory with the input
+    :rtype: numpy.ndarray
+    """
+    dtype = np.dtype(data.typecode)
+    if len(data) == 0:
+        return np.zeros((0, dimension), dtype=dtype)
+    return np.frombuffer(data, dtype=dtype).reshape(-1, dimension)
+
+
+def points_buffer(pts, typecode):
+    """ Copies the (number of points, dimension) array into a flat array of point coordinates.
+
+    :param pts: points array
+    :type pts: numpy.ndarray
+    :param typecode: ``d`` for float64 and ``f`` for float32 coordinates
+    :type typecode: str
+    :return: flat array of point coordinates
+    :rtype: array.array
+    """
+    data = array(typecode)
+    data.frombytes(np.ascontiguousarray(pts, dtype=np.dtype(typecode)).tobytes())
+    return data
@@ -0,0 +1,113 @@
+"""
+.. module:: _cache
+    :platform: Unix, Windows
+    :synopsis: Defines internal caching utilities
+
+.. moduleauthor:: Onur Rauf Bingol <orbingol@gmail.com>
+
+"""
+
+import os
+from collections import OrderedDict, namedtuple
+
+# Initialize an empty __all__ for controlling imports
+__all__ = []
+
+# Default limits, the number of entries follows the "GEOMDL_CACHE_SIZE" environment variable used by the lru_cache
+CACHE_SIZE = int(os.environ['GEOMDL_CACHE_SIZE']) if 'GEOMDL_CACHE_SIZE' in os.environ else 128
+CACHE_MEMORY = int(os.environ['GEOMDL_CACHE_MEMORY']) if 'GEOMDL_CACHE_MEMORY' in os.environ else 64 * 1024 * 1024
+
+#: Cache statistics
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize', 'memsize', 'maxmemsize'])
+
+
+def memory_size(obj):
+    """ Estimates the memory size of the cached data in bytes.
+
+    Each number is counted as 8 bytes and NumPy arrays report their own buffer size.
+
+    :param obj: data to be cached
+    :return: estimated memory size in bytes
+    :rtype: int
+    """
+    if hasattr(obj, 'nbytes'):
+        return int(obj.nbytes)
+    if isinstance(obj, (list, tuple)):
+        return sum(memory_size(o) for o in obj)
+    return 8
+
+
+class LRUCache(object):
+    """ Least recently used cache with hit/miss statistics and a memory budget.
+
+    The least recently used entries are discarded when the number of entries exceeds ``maxsize`` or the estimated
+    memory size of the entries exceeds ``maxmemsize`` bytes. The data which is larger than the memory budget is
+    computed but not stored.
+
+    :param maxsize: maximum number of entries
+    :type maxsize: int
+    :param maxmemsize: memory budget in bytes
+    :type maxmemsize: int
+    """
+
+    def __init__(self, maxsize=CACHE_SIZE, maxmemsize=CACHE_MEMORY):
+        self._maxsize = int(maxsize)
+        self._maxmemsize = int(maxmemsize)
+        self._data = OrderedDict()
+        self._sizes = dict()
+        self._memsize = 0
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, func, *args):
+        """ Returns the cached data for the key, computes and stores it via ``func(*args)`` if it is not cached.
+
+        :param key: hashable cache key
+        :param func: function that computes the data
+        :return: cached or computed data
+        """
+        try:
+            # Remove and re-insert to mark the entry as the most recently used one
+            value = self._data.pop(key)
+        except KeyError:
+            self._misses += 1
+            value = func(*args)
+            self._store(key, value)
+            return value
+        self._hits += 1
+        self._data[key] = value
+        return value
+
+    def _store(self, key, value):
+        size = memory_size(value)
+        if self._maxsize <= 0 or size > self._maxmemsize:
+            return
+        self._data[key] = value
+        self._sizes[key] = size
+        self._memsize += size
+        # Discard the least recently used entries
+        while len(self._data) > self._maxsize or self._memsize > self._maxmemsize:
+            old_key, _ = self._data.popitem(last=False)
+            self._memsize -= self._sizes.pop(old_key)
+
+    def info(self):
+        """ Returns the cache statistics.
+
+        :return: hits, misses, maximum number of entries, number of entries, memory size and memory budget
+        :rtype: CacheInfo
+        """
+        return CacheInfo(self._hits, self._misses, self._maxsize, len(self._data), self._memsize, self._maxmemsize)
+
+    def clear(self):
+        """ Clears the cache and the statistics. """
+        self._data.clear()
+        self._sizes.clear()
+        self._memsize = 0
+        self._hits = 0
+        self._misses = 0
@@ -0,0 +1,437 @@
+"""
+.. module:: _evaluators
+    :platform: Unix, Windows
+    :synopsis: Helper functions for vectorized evaluator classes
+
+.. moduleauthor:: Onur Rauf Bingol <orbingol@gmail.com>
+
+"""
+
+from itertools import product
+import numpy as np
+
+# Initialize an empty __all__ for controlling imports
+__all__ = []
+
+
+def linspace(start, stop, num):
+    """ Returns an array of evenly spaced parameters over the interval [start, stop].
+
+    Follows the same conventions with :func:`.linalg.linspace` when the start and end values are equal.
+
+    :param start: starting value
+    :type start: float
+    :param stop: end value
+    :type stop: float
+    :param num: number of samples to generate
+    :type num: int
+    :return: equally spaced parameters
+    :rtype: numpy.ndarray
+    """
+    start = float(start)
+    stop = float(stop)
+    if abs(start - stop) <= 10e-8:
+        return np.array([start])
+    return np.linspace(start, stop, max(int(num), 1))
+
+
+def find_spans(degree, knot_vector, num_ctrlpts, knots):
+    """ Finds the knot spans of an array of parameters.
+
+    The output is consistent with :func:`.helpers.find_span_linear`, i.e. the parameters at the end of the domain
+    are assigned to the last non-zero knot span.
+
+    :param degree: degree, :math:`p`
+    :type degree: int
+    :param knot_vector: knot vector, :math:`U`
+    :type knot_vector: list, tuple
+    :param num_ctrlpts: number of control points, :math:`n + 1`
+    :type num_ctrlpts: int
+    :param knots: array of parameters
+    :type knots: numpy.ndarray
+    :return: array of knot spans
+    :rtype: numpy.ndarray
+    """
+    kv = np.asarray(knot_vector, dtype=np.float64)
+    return np.searchsorted(kv[:num_ctrlpts], knots, side='right') - 1
+
+
+def basis_functions(degree, knot_vector, spans, knots):
+    """ Computes the non-vanishing basis functions for an array of parameters.
+
+    Vectorized implementation of Algorithm A2.2 from The NURBS Book by Piegl & Tiller.
+
+    :param degree: degree, :math:`p`
+    :type degree: int
+    :param knot_vector: knot vector, :math:`U`
+    :type knot_vector: list, tuple
+    :param spans: array of knot spans
+    :type spans: numpy.ndarray
+    :param knots: array of parameters
+    :type knots: numpy.ndarray
+    :return: basis functions in (number of parameters, degree + 1) shape
+    :rtype: numpy.ndarray
+    """
+    kv = np.asarray(knot_vector, dtype=np.float64)
+    knots = np.asarray(knots, dtype=np.float64)
+    num = len(knots)
+    left = np.zeros((num, degree + 1))
+    right = np.zeros((num, degree + 1))
+    N = np.ones((num, degree + 1))  # N[:, 0] = 1.0 by definition
+
+    for j in range(1, degree + 1):
+        left[:, j] = knots - kv[spans + 1 - j]
+        right[:, j] = kv[spans + j] - knots
+        saved = np.zeros(num)
+        for r in range(0, j):
+            temp = N[:, r] / (right[:, r + 1] + left[:, j - r])
+            N[:, r] = saved + right[:, r + 1] * temp
+            saved = left[:, j - r] * temp
+        N[:, j] = saved
+
+    return N
+
+
+def basis_functions_ders(degree, knot_vector, spans, knots, order):
+    """ Computes the derivatives of the non-vanishing basis functions for an array of parameters.
+
+    Vectorized implementation of Algorithm A2.3 from The NURBS Book by Piegl & Tiller. The order of the derivative
+    should not be greater than the degree.
+
+    :param degree: degree, :math:`p`
+    :type degree: int
+    :param knot_vector: knot vector, :math:`U`
+    :type knot_vector: list, tuple
+    :param spans: array of knot spans
+    :type spans: numpy.ndarray
+    :param knots: array of parameters
+    :type knots: numpy.ndarray
+    :param order: order of the derivative
+    :type order: int
+    :return: derivatives of the basis functions in (number of parameters, order + 1, degree + 1) shape
+    :rtype: numpy.ndarray
+    """
+    kv = np.asarray(knot_vector, dtype=np.float64)
+    knots = np.asarray(knots, dtype=np.float64)
+    num = len(knots)
+    left = np.ones((degree + 1, num))
+    right = np.ones((degree + 1, num))
+    ndu = np.ones((degree + 1, degree + 1, num))  # N[0][0] = 1.0 by definition
+
+    for j in range(1, degree + 1):
+        left[j] = knots - kv[spans + 1 - j]
+        right[j] = kv[spans + j] - knots
+        saved = np.zeros(num)
+        for r in range(0, j):
+            # Lower triangle
+            ndu[j, r] = right[r + 1] + left[j - r]
+            temp = ndu[r, j - 1] / ndu[j, r]
+            # Upper triangle
+            ndu[r, j] = saved + (right[r + 1] * temp)
+            saved = left[j - r] * temp
+        ndu[j, j] = saved
+
+    # Load the basis functions
+    ders = np.zeros((order + 1, degree + 1, num))
+    ders[0] = ndu[:, degree]
+
+    # Start calculating derivatives
+    a = np.ones((2, degree + 1, num))
+    for r in range(0, degree + 1):
+        s1 = 0
+        s2 = 1
+        a[0, 0] = 1.0
+        for k in range(1, order + 1):
+            d = np.zeros(num)
+            rk = r - k
+            pk = degree - k
+            if r >= k:
+                a[s2, 0] = a[s1, 0] / ndu[pk + 1, rk]
+                d = a[s2, 0] * ndu[rk, pk]
+            j1 = 1 if rk >= -1 else -rk
+            j2 = k - 1 if (r - 1) <= pk else degree - r
+            for j in range(j1, j2 + 1):
+                a[s2, j] = (a[s1, j] - a[s1, j - 1]) / ndu[pk + 1, rk + j]
+                d = d + (a[s2, j] * ndu[rk + j, pk])
+            if r <= pk:
+                a[s2, k] = -a[s1, k - 1] / ndu[pk + 1, r]
+                d = d + (a[s2, k] * ndu[r, pk])
+            ders[k, r] = d
+            s1, s2 = s2, s1
+
+    # Multiply through by the the correct factors
+    r = float(degree)
+    for k in range(1, order + 1):
+        ders[k] *= r
+        r *= (degree - k)
+
+    return np.transpose(ders, (2, 0, 1))
+
+
+def curve_points(degree, spans, basis, ctrlpts):
+    """ Computes the curve points from the knot spans and the basis functions.
+
+    :param degree: degree, :math:`p`
+    :type degree: int
+    :param spans: array of knot spans
+    :type spans: numpy.ndarray
+    :param basis: basis functions in (number of parameters, degree + 1) shape
+    :type basis: numpy.ndarray
+    :param ctrlpts: control points
+    :type ctrlpts: list, tuple, numpy.ndarray
+    :return: curve points in (number of parameters, dimension) shape
+    :rtype: numpy.ndarray
+    """
+    P = np.asarray(ctrlpts, dtype=np.float64)
+    pts = np.zeros((len(spans), P.shape[1]))
+    for i in range(0, degree + 1):
+        pts += basis[:, i:i + 1] * P[spans - degree + i]
+    return pts
+
+
+def curve_derivatives(degree, spans, basis_ders, ctrlpts, order):
+    """ Computes the curve derivatives from the knot spans and the derivatives of the basis functions.
+
+    :param degree: degree, :math:`p`
+    :type degree: int
+    :param spans: array of knot spans
+    :type spans: numpy.ndarray
+    :param basis_ders: derivatives of the basis functions in (number of parameters, du + 1, degree + 1) shape
+    :type basis_ders: numpy.ndarray
+    :param ctrlpts: control points
+    :type ctrlpts: list, tuple, numpy.ndarray
+    :param order: order of the derivative
+    :type order: int
+    :return: curve derivatives in (number of parameters, order + 1, dimension) shape
+    :rtype: numpy.ndarray
+    """
+    P = np.asarray(ctrlpts, dtype=np.float64)
+    ders = np.zeros((len(spans), order + 1, P.shape[1]))
+    du = basis_ders.shape[1]
+    for i in range(0, degree + 1):
+        ders[:, :du, :] += basis_ders[:, :, i, np.newaxis] * P[spans - degree + i][:, np.newaxis, :]
+    return ders
+
+
+def surface_derivatives(degree, spans, basis_ders, ctrlpts, ctrlpts_size, order):
+    """ Computes the surface derivatives from the knot spans and the derivatives of the basis functions.
+
+    :param degree: degrees on the u- and v-directions
+    :type degree: list, tuple
+    :param spans: arrays of knot spans on the u- and v-directions
+    :type spans: list, tuple
+    :param basis_ders: derivatives of the basis functions on the u- and v-directions
+    :type basis_ders: list, tuple
+    :param ctrlpts: control points (v index varies first)
+    :type ctrlpts: list, tuple, numpy.ndarray
+    :param ctrlpts_size: number of control points on the u- and v-directions
+    :type ctrlpts_size: list, tuple
+    :param order: order of the derivative
+    :type order: int
+    :return: surface derivatives in (number of parameters, order + 1, order + 1, dimension) shape
+    :rtype: numpy.ndarray
+    """
+    P = np.asarray(ctrlpts, dtype=np.float64).reshape(ctrlpts_size[0], ctrlpts_size[1], -1)
+    du = basis_ders[0].shape[1]
+    dv = basis_ders[1].shape[1]
+    ders = np.zeros((len(spans[0]), order + 1, order + 1, P.shape[2]))
+    for r in range(0, degree[0] + 1):
+        for s in range(0, degree[1] + 1):
+            cpt = P[spans[0] - degree[0] + r, spans[1] - degree[1] + s]
+            # (N, du) x (N, dv) x (N, dim) -> (N, du, dv, dim)
+            ders[:, :du, :dv, :] += basis_ders[0][:, :, r, np.newaxis, np.newaxis] * \
+                basis_ders[1][:, np.newaxis, :, s, np.newaxis] * cpt[:, np.newaxis, np.newaxis, :]
+    return ders
+
+
+def basis_matrix(degree, knot_vector, num_ctrlpts, knots):
+    """ Generates the basis function matrix for an array of parameters.
+
+    The rows of the matrix correspond to the parameters and the columns correspond to the control points. Each row
+    contains at most :math:`p + 1` non-zero values placed on its knot span, i.e. the matrix is banded.
+
+    :param degree: degree, :math:`p`
+    :type degree: int
+    :param knot_vector: knot vector, :math:`U`
+    :type knot_vector: list, tuple
+    :param num_ctrlpts: number of control points, :math:`n + 1`
+    :type num_ctrlpts: int
+    :param knots: array of parameters
+    :type knots: numpy.ndarray
+    :return: basis function matrix in (number of parameters, number of control points) shape
+    :rtype: numpy.ndarray
+    """
+    spans = find_spans(degree, knot_vector, num_ctrlpts, knots)
+    basis = basis_functions(degree, knot_vector, spans, knots)
+    rows = np.arange(len(knots))
+    mat = np.zeros((len(knots), num_ctrlpts))
+    for i in range(0, degree + 1):
+        mat[rows, spans - degree + i] = basis[:, i]
+    return mat
+
+
+def surface_points(basis_u, basis_v, ctrlpts, ctrlpts_size):
+    """ Computes the surface points on a grid as :math:`N_u \\cdot P \\cdot N_v^T` for each coordinate.
+
+    :param basis_u: basis function matrix on the u-direction
+    :type basis_u: numpy.ndarray
+    :param basis_v: basis function matrix on the v-direction
+    :type basis_v: numpy.ndarray
+    :param ctrlpts: control points (v index varies first)
+    :type ctrlpts: list, tuple, numpy.ndarray
+    :param ctrlpts_size: number of control points on the u- and v-directions
+    :type ctrlpts_size: list, tuple
+    :return: surface points in (samples on u, samples on v, dimension) shape
+    :rtype: numpy.ndarray
+    """
+    P = np.asarray(ctrlpts, dtype=np.float64).reshape(ctrlpts_size[0], ctrlpts_size[1], -1)
+    dim = P.shape[2]
+    # First product: (samples_u x ctrlpts_u) . (ctrlpts_u x ctrlpts_v * dim)
+    temp = np.dot(basis_u, P.reshape(ctrlpts_size[0], -1)).reshape(basis_u.shape[0], ctrlpts_size[1], dim)
+    # Second product: (samples_v x ctrlpts_v) . (ctrlpts_v x dim) for each u sample
+    return np.matmul(basis_v, temp)
+
+
+def volume_points(basis_u, basis_v, basis_w, ctrlpts, ctrlpts_size):
+    """ Computes the volume points on a grid by contracting the control points tensor with the basis matrices.
+
+    :param basis_u: basis function matrix on the u-direction
+    :type basis_u: numpy.ndarray
+    :param basis_v: basis function matrix on the v-direction
+    :type basis_v: numpy.ndarray
+    :param basis_w: basis function matrix on the w-direction
+    :type basis_w: numpy.ndarray
+    :param ctrlpts: control points (v index varies first, then u and w)
+    :type ctrlpts: list, tuple, numpy.ndarray
+    :param ctrlpts_size: number of control points on the u-, v- and w-directions
+    :type ctrlpts_size: list, tuple
+    :return: volume points in (samples on u, samples on v, samples on w, dimension) shape
+    :rtype: numpy.ndarray
+    """
+    P = np.asarray(ctrlpts, dtype=np.float64).reshape(ctrlpts_size[2], ctrlpts_size[0], ctrlpts_size[1], -1)
+    return np.einsum('ia,jb,kc,cabd->ijkd', basis_u, basis_v, basis_w, P, optimize=True)
+
+
+def tensor_points(params, degree, knot_vector, ctrlpts, ctrlpts_size):
+    """ Computes the points of a tensor product geometry at the input list of parameters.
+
+    The knot spans and the basis functions are computed for all parameters in one pass on each parametric direction.
+
+    :param params: list of parameters, e.g. (u, v) pairs for surfaces and (u, v, w) triplets for volumes
+    :type params: list, tuple, numpy.ndarray
+    :param degree: degrees for each parametric direction
+    :type degree: list, tuple
+    :param knot_vector: knot vectors for each parametric direction
+    :type knot_vector: list, tuple
+    :param ctrlpts: control points (v index varies first, then u and w)
+    :type ctrlpts: list, tuple, numpy.ndarray
+    :param ctrlpts_size: number of control points for each parametric direction
+    :type ctrlpts_size: list, tuple
+    :return: points in (number of parameters, dimension) shape
+    :rtype: numpy.ndarray
+    """
+    pdim = len(degree)
+    params = np.asarray(params, dtype=np.float64).reshape(-1, pdim)
+    spans = []
+    basis = []
+    for idx in range(pdim):
+        spans.append(find_spans(degree[idx], knot_vector[idx], ctrlpts_size[idx], params[:, idx]))
+        basis.append(basis_functions(degree[idx], knot_vector[idx], spans[idx], params[:, idx]))
+
+    # Control points are flattened in v, u, w order
+    order = [1, 0, 2][:pdim]
+    P = np.asarray(ctrlpts, dtype=np.float64)
+    pts = np.zeros((params.shape[0], P.shape[1]))
+    for offsets in product(*[range(d + 1) for d in degree]):
+        cidx = np.zeros(params.shape[0], dtype=np.intp)
+        weight = np.ones(params.shape[0])
+        stride = 1
+        for idx in order:
+            cidx += stride * (spans[idx] - degree[idx] + offsets[idx])
+            stride *= ctrlpts_size[idx]
+            weight *= basis[idx][:, offsets[idx]]
+        pts += weight[:, np.newaxis] * P[cidx]
+    return pts
+
+
+def rational_points(ptsw):
+    """ Projects the weighted points to the Cartesian space by dividing with the weights.
+
+    :param ptsw: weighted points, the weights are stored in the last coordinate
+    :type ptsw: numpy.ndarray
+    :return: unweighted points
+    :rtype: numpy.ndarray
+    """
+    return ptsw[..., :-1] / ptsw[..., -1:]
+
+
+def binomial_table(order):
+    """ Generates the table of binomial coefficients up to the input order.
+
+    :param order: order of the derivative
+    :type order: int
+    :return: binomial coefficients, entry ``[k, i]`` is *k choose i*
+    :rtype: numpy.ndarray
+    """
+    table = np.zeros((order + 1, order + 1))
+    table[:, 0] = 1.0
+    for k in range(1, order + 1):
+        table[k, 1:k + 1] = table[k - 1, 0:k] + table[k - 1, 1:k + 1]
+    return table
+
+
+def rational_curve_derivatives(ckw, order):
+    """ Computes the rational curve derivatives from the derivatives of the weighted curve.
+
+    Vectorized implementation of Algorithm A4.2 from The NURBS Book by Piegl & Tiller. The recurrence runs over the
+    derivative orders and each step is applied to all parameters at once.
+
+    :param ckw: weighted curve derivatives in (number of parameters, order + 1, dimension) shape
+    :type ckw: numpy.ndarray
+    :param order: order of the derivative
+    :type order: int
+    :return: rational curve derivatives in (number of parameters, order + 1, dimension - 1) shape
+    :rtype: numpy.ndarray
+    """
+    bc = binomial_table(order)
+    aders = ckw[..., :-1]
+    wders = ckw[..., -1:]
+    ck = np.empty_like(aders)
+    for k in range(0, order + 1):
+        v = aders[:, k].copy()
+        for i in range(1, k + 1):
+            v -= bc[k, i] * wders[:, i] * ck[:, k - i]
+        ck[:, k] = v / wders[:, 0]
+    return ck
+
+
+def rational_surface_derivatives(sklw, order):
+    """ Computes the rational surface derivatives from the derivatives of the weighted surface.
+
+    Vectorized implementation of Algorithm A4.4 from The NURBS Book by Piegl & Tiller. The recurrence runs over the
+    derivative orders and each step is applied to all parameters at once.
+
+    :param sklw: weighted surface derivatives in (number of parameters, order + 1, order + 1, dimension) shape
+    :type sklw: numpy.ndarray
+    :param order: order of the derivative
+    :type order: int
+    :return: rational surface derivatives in (number of parameters, order + 1, order + 1, dimension - 1) shape
+    :rtype: numpy.ndarray
+    """
+    bc = binomial_table(order)
+    aders = sklw[..., :-1]
+    wders = sklw[..., -1:]
+    skl = np.empty_like(aders)
+    for k in range(0, order + 1):
+        for l in range(0, order + 1):
+            v = aders[:, k, l].copy()
+            for j in range(1, l + 1):
+                v -= bc[l, j] * wders[:, 0, j] * skl[:, k, l - j]
+            for i in range(1, k + 1):
+                v -= bc[k, i] * wders[:, i, 0] * skl[:, k - i, l]
+                v2 = np.zeros_like(v)
+                for j in range(1, l + 1):
+                    v2 += bc[l, j] * wders[:, i, j] * skl[:, k - i, l - j]
+                v -= bc[k, i] * v2
+            skl[:, k, l] = v / wders[:, 0, 0]
+    return skl
@@ -242,12 +242,12 @@ def export_dict_crv(obj):
         degree=obj.degree,
         knotvector=list(obj.knotvector),
         control_points=dict(
-            points=obj.ctrlpts
+            points=[[float(c) for c in pt] for pt in obj.ctrlpts]
         ),
         delta=obj.delta
     )
     if obj.rational:
-        data['control_points']['weights'] = list(obj.weights)
+        data['control_points']['weights'] = [float(w) for w in obj.weights]
 
     # For trim curves
     sense = obj.opt_get('reversed')
@@ -384,12 +384,12 @@ def export_dict_surf(obj):
         size_u=obj.ctrlpts_size_u,
         size_v=obj.ctrlpts_size_v,
         control_points=dict(
-            points=obj.ctrlpts
+            points=[[float(c) for c in pt] for pt in obj.ctrlpts]
         ),
         delta=obj.delta
     )
     if obj.rational:
-        data['control_points']['weights'] = list(obj.weights)
+        data['control_points']['weights'] = [float(w) for w in obj.weights]
 
     # Surface sense
     sense = obj.opt_get('reversed')
@@ -468,12 +468,12 @@ def export_dict_vol(obj):
         size_v=obj.ctrlpts_size_v,
         size_w=obj.ctrlpts_size_w,
         control_points=dict(
-            points=obj.ctrlpts
+            points=[[float(c) for c in pt] for pt in obj.ctrlpts]
         ),
         delta=obj.delta
     )
     if obj.rational:
-        data['control_points']['weights'] = list(obj.weights)
+        data['control_points']['weights'] = [float(w) for w in obj.weights]
     return data
 
 
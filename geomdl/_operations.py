@@ -51,9 +51,9 @@ def tangent_curve_single_list(obj, param_list, normalize):
     :rtype: tuple
     """
     ret_vector = []
-    for param in param_list:
-        temp = tangent_curve_single(obj, param, normalize)
-        ret_vector.append(temp)
+    for ders in obj.derivatives_list(param_list, 1):
+        vector = linalg.vector_normalize(ders[1]) if normalize else ders[1]
+        ret_vector.append((tuple(ders[0]), tuple(vector)))
     return tuple(ret_vector)
 
 
@@ -94,9 +94,9 @@ def normal_curve_single_list(obj, param_list, normalize):
     :rtype: tuple
     """
     ret_vector = []
-    for param in param_list:
-        temp = normal_curve_single(obj, param, normalize)
-        ret_vector.append(temp)
+    for ders in obj.derivatives_list(param_list, 2):
+        vector = linalg.vector_normalize(ders[2]) if normalize else ders[2]
+        ret_vector.append((tuple(ders[0]), tuple(vector)))
     return tuple(ret_vector)
 
 
@@ -139,9 +139,12 @@ def binormal_curve_single_list(obj, param_list, normalize):
     :rtype: tuple
     """
     ret_vector = []
-    for param in param_list:
-        temp = binormal_curve_single(obj, param, normalize)
-        ret_vector.append(temp)
+    for ders in obj.derivatives_list(param_list, 2):
+        tan_vector = linalg.vector_normalize(ders[1]) if normalize else ders[1]
+        norm_vector = linalg.vector_normalize(ders[2]) if normalize else ders[2]
+        vector = linalg.vector_cross(tan_vector, norm_vector)
+        vector = linalg.vector_normalize(vector) if normalize else vector
+        ret_vector.append((tuple(ders[0]), tuple(vector)))
     return tuple(ret_vector)
 
 
@@ -182,9 +185,10 @@ def tangent_surface_single_list(obj, param_list, normalize):
     :rtype: tuple
     """
     ret_vector = []
-    for param in param_list:
-        temp = tangent_surface_single(obj, param, normalize)
-        ret_vector.append(temp)
+    for skl in obj.derivatives_list(param_list, 1):
+        vector_u = linalg.vector_normalize(skl[1][0]) if normalize else skl[1][0]
+        vector_v = linalg.vector_normalize(skl[0][1]) if normalize else skl[0][1]
+        ret_vector.append((tuple(skl[0][0]), tuple(vector_u), tuple(vector_v)))
     return tuple(ret_vector)
 
 
@@ -225,9 +229,10 @@ def normal_surface_single_list(obj, param_list, normalize):
     :rtype: tuple
     """
     ret_vector = []
-    for param in param_list:
-        temp = normal_surface_single(obj, param, normalize)
-        ret_vector.append(temp)
+    for skl in obj.derivatives_list(param_list, 1):
+        vector = linalg.vector_cross(skl[1][0], skl[0][1])
+        vector = linalg.vector_normalize(vector) if normalize else vector
+        ret_vector.append((tuple(skl[0][0]), tuple(vector)))
     return tuple(ret_vector)
 
 
@@ -244,7 +249,7 @@ def find_ctrlpts_curve(t, curve, **kwargs):
     :rtype: list
     """
     # Get keyword arguments
-    span_func = kwargs.get('find_span_func', helpers.find_span_linear)
+    span_func = kwargs.get('find_span_func', helpers.find_span_binsearch)
 
     # Find spans and the constant index
     span = span_func(curve.degree, curve.knotvector, len(curve.ctrlpts), t)
@@ -274,7 +279,7 @@ def find_ctrlpts_surface(t_u, t_v, surf, **kwargs):
     :rtype: list
     """
     # Get keyword arguments
-    span_func = kwargs.get('find_span_func', helpers.find_span_linear)
+    span_func = kwargs.get('find_span_func', helpers.find_span_binsearch)
 
     # Find spans
     span_u = span_func(surf.degree_u, surf.knotvector_u, surf.ctrlpts_size_u, t_u)
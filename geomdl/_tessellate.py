@@ -7,9 +7,13 @@
 
 """
 
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import chain
 from . import linalg
 from . import ray
-from .elements import Vertex, Triangle, Quad
+from .elements import Vertex, Triangle, Quad, PointGrid
 
 # Initialize an empty __all__ for controlling imports
 __all__ = []
@@ -54,18 +58,17 @@ def make_triangle_mesh(points, size_u, size_v, **kwargs):
         final_vertices = []
 
         # Get all vertices inside the triangle list
-        tri_vertex_ids = []
+        tri_vertex_ids = set()
         for tri in triangle_list:
-            for td in tri.data:
-                if td not in tri_vertex_ids:
-                    tri_vertex_ids.append(td)
+            tri_vertex_ids.update(tri.data)
 
         # Find vertices used in triangles
-        seen_vertices = []
+        seen_vertices = set()
         for vertex in vertex_list:
-            if vertex.id in tri_vertex_ids and vertex.id not in seen_vertices:
+            vid = vertex.id
+            if vid in tri_vertex_ids and vid not in seen_vertices:
                 final_vertices.append(vertex)
-                seen_vertices.append(vertex.id)
+                seen_vertices.add(vid)
 
         # Fix vertex numbering (automatically fixes triangle vertex numbering)
         vert_new_id = 0
@@ -148,6 +151,459 @@ def make_triangle_mesh(points, size_u, size_v, **kwargs):
     return vertices, triangles
 
 
+def _interleave(typecode, columns):
+    """ Interleaves the input arrays, e.g. generates [a0, b0, a1, b1, ...] from [a0, a1, ...] and [b0, b1, ...].
+
+    :param typecode: type code of the output array
+    :type typecode: str
+    :param columns: arrays of the same length and type code
+    :type columns: list, tuple
+    :return: interleaved array
+    :rtype: array.array
+    """
+    num = len(columns)
+    result = array(typecode, [0]) * (num * len(columns[0]))
+    for idx, col in enumerate(columns):
+        result[idx::num] = col
+    return result
+
+
+def _grid_cell_vertices(typecode, size_u, size_v):
+    """ Generates the vertex indices of the corners of the cells of a (size_u x size_v) grid of vertices.
+
+    The cell (i, j) has the corners ``j + (i * size_v)`` (v1), ``j + ((i + 1) * size_v)`` (v2), ``v2 + 1`` (v3) and
+    ``v1 + 1`` (v4). Please see :func:`.make_triangle_mesh` for the organization of the corners.
+
+    :param typecode: type code of the output arrays
+    :type typecode: str
+    :param size_u: number of vertices on the u-direction
+    :type size_u: int
+    :param size_v: number of vertices on the v-direction
+    :type size_v: int
+    :return: vertex indices of the cell corners in (v1, v2, v3, v4) format
+    :rtype: tuple
+    """
+    indices = array(typecode, range(size_u * size_v))
+    firsts = array(typecode)  # vertices having a next vertex on the v-direction
+    lasts = array(typecode)  # vertices having a previous vertex on the v-direction
+    for i in range(size_u):
+        firsts.extend(indices[(i * size_v):(((i + 1) * size_v) - 1)])
+        lasts.extend(indices[((i * size_v) + 1):((i + 1) * size_v)])
+
+    # The corners v2 and v3 of a cell are the corners v1 and v4 of the next cell on the u-direction
+    num_cells = (size_u - 1) * (size_v - 1)
+    return firsts[:num_cells], firsts[(size_v - 1):], lasts[(size_v - 1):], lasts[:num_cells]
+
+
+def _grid_coordinates(points, typecode):
+    """ Returns the coordinates of the grid of points as a flat array.
+
+    :param points: input points
+    :type points: list, tuple, elements.PointGrid
+    :param typecode: type code of the output array
+    :type typecode: str
+    :return: flat array of coordinates
+    :rtype: array.array
+    """
+    if isinstance(points, PointGrid):
+        return points.data if points.data.typecode == typecode else array(typecode, points.data)
+    return array(typecode, chain.from_iterable(points))
+
+
+def make_triangle_grid(mesh, points, size_u, size_v, **kwargs):
+    """ Generates a triangular mesh from a grid of points and stores it in a compact mesh.
+
+    This function generates the same vertices and triangles with :func:`.make_triangle_mesh` using the default
+    tessellation function (:func:`.surface_tessellate`), but it fills the flat arrays of the input :class:`.Mesh`
+    instance instead of creating :class:`.Vertex` and :class:`.Triangle` objects. The vertex coordinates are taken
+    from the flat array of the input grid and the triangle vertex indices are generated row by row via array slicing,
+    i.e. there are no per-cell operations.
+
+    This function accepts the following keyword arguments:
+
+    * ``vertex_spacing``: Defines the size of the triangles via setting the jump value between points
+
+    :param mesh: compact mesh to be filled
+    :type mesh: elements.Mesh
+    :param points: input points
+    :type points: list, tuple, elements.PointGrid
+    :param size_u: number of elements on the u-direction
+    :type size_u: int
+    :param size_v: number of elements on the v-direction
+    :type size_v: int
+    :return: the input mesh
+    :rtype: elements.Mesh
+    """
+    # Vertex spacing for triangulation
+    vertex_spacing = kwargs.get('vertex_spacing', 1)  # defines the size of the triangles
+
+    # Variable initialization
+    u_jump = (1.0 / float(size_u - 1)) * vertex_spacing  # for computing vertex parametric u value
+    v_jump = (1.0 / float(size_v - 1)) * vertex_spacing  # for computing vertex parametric v value
+    rows = range(0, size_u, vertex_spacing)
+    cols = range(0, size_v, vertex_spacing)
+    varr_size_u = len(rows)  # vertex array size on the u-direction
+    varr_size_v = len(cols)  # vertex array size on the v-direction
+
+    # Vertices which are not used by any triangle are not included (consistent with make_triangle_mesh)
+    mesh.clear()
+    if varr_size_u < 2 or varr_size_v < 2:
+        return mesh
+
+    # Generate vertices directly from input points (preliminary evaluation)
+    vertices = mesh.vertices
+    dim = mesh.dimension
+    coords = _grid_coordinates(points, vertices.typecode)
+    if vertex_spacing == 1:
+        vertices.extend(coords[:(size_u * size_v * dim)])
+    else:
+        for i in rows:
+            row = coords[(i * size_v * dim):((i + 1) * size_v * dim)]
+            vertices.extend(_interleave(vertices.typecode, [row[k::(vertex_spacing * dim)] for k in range(dim)]))
+
+    # Parametric positions are accumulated in the same way with make_triangle_mesh
+    params = [[], []]
+    for idx, (jump, num) in enumerate(((u_jump, varr_size_u), (v_jump, varr_size_v))):
+        param = 0.0
+        for _ in range(num):
+            params[idx].append(param)
+            param += jump
+    uvs = mesh.uv
+    params_u = array(uvs.typecode)
+    for u in params[0]:
+        params_u.extend(array(uvs.typecode, [u]) * varr_size_v)
+    uvs.extend(_interleave(uvs.typecode, [params_u, array(uvs.typecode, params[1]) * varr_size_u]))
+    mesh.inside.extend(bytearray(varr_size_u * varr_size_v))
+
+    # Generate triangles, please see make_triangle_mesh for the organization of the vertices in a quad element
+    faces = mesh.faces
+    v1, v2, v3, v4 = _grid_cell_vertices(faces.typecode, varr_size_u, varr_size_v)
+    faces.extend(_interleave(faces.typecode, (v1, v2, v3, v1, v3, v4)))
+
+    return mesh
+
+
+def make_quad_grid(mesh, points, size_u, size_v):
+    """ Generates a mesh of quadrilateral elements and stores it in a compact mesh.
+
+    This function generates the same vertices and quads with :func:`.make_quad_mesh`, but it fills the flat arrays of
+    the input :class:`.Mesh` instance instead of creating :class:`.Vertex` and :class:`.Quad` objects.
+
+    :param mesh: compact mesh to be filled
+    :type mesh: elements.Mesh
+    :param points: list of points
+    :type points: list, tuple, elements.PointGrid
+    :param size_u: number of points on the u-direction (column)
+    :type size_u: int
+    :param size_v: number of points on the v-direction (row)
+    :type size_v: int
+    :return: the input mesh
+    :rtype: elements.Mesh
+    """
+    mesh.clear()
+
+    # Generate vertices
+    vertices = mesh.vertices
+    vertices.extend(_grid_coordinates(points, vertices.typecode))
+    mesh.uv.extend([0.0] * (2 * len(points)))
+    mesh.inside.extend(bytearray(len(points)))
+
+    # Generate quads
+    if size_u < 2 or size_v < 2:
+        return mesh
+    faces = mesh.faces
+    faces.extend(_interleave(faces.typecode, _grid_cell_vertices(faces.typecode, size_u, size_v)))
+
+    return mesh
+
+
+def _adaptive_params(knotvector, domain, scale):
+    """ Generates the function converting the lattice coordinates to the parameters for the adaptive tessellation.
+
+    Each knot span of the domain is divided into ``scale`` units of the integer lattice.
+
+    :param knotvector: knot vector
+    :type knotvector: list, tuple
+    :param domain: domain of the knot vector
+    :type domain: list, tuple
+    :param scale: number of lattice units in a knot span
+    :type scale: int
+    :return: number of knot spans and the conversion function
+    :rtype: tuple
+    """
+    knots = sorted(set(k for k in knotvector if domain[0] <= k <= domain[1]))
+    last = len(knots) - 2
+
+    def param(x):
+        span = min(x // scale, last)
+        offset = x - (span * scale)
+        if offset == 0:
+            return knots[span]
+        return knots[span] + ((knots[span + 1] - knots[span]) * offset) / float(scale)
+
+    return last + 1, param
+
+
+def _adaptive_stencil(cell):
+    """ Returns the lattice coordinates of the points tested for splitting the cell of the adaptive tessellation.
+
+    The cells are divided into quarters on the directions which can be split, i.e. the stencil of a cell consists of
+    the stencils of its children.
+
+    :param cell: lattice coordinates of the cell in (u_min, u_max, v_min, v_max) format
+    :type cell: tuple
+    :return: lattice coordinates on the u- and v-directions
+    :rtype: tuple
+    """
+    x0, x1, y0, y1 = cell
+    nx = 4 if x1 - x0 > 2 else 2
+    ny = 4 if y1 - y0 > 2 else 2
+    return [x0 + ((i * (x1 - x0)) // nx) for i in range(nx + 1)], [y0 + ((j * (y1 - y0)) // ny) for j in range(ny + 1)]
+
+
+def _adaptive_split(cell, pts, tol, cos_angle):
+    """ Checks if the cell of the adaptive tessellation should be split on the u- and v-directions.
+
+    A direction is split if the chordal deviation of the stencil points on the cell edges along the direction or the
+    angle between the normals on these edges is larger than the tolerances. If no direction is selected, both
+    directions are split if the stencil points inside the cell deviate from the planes of the triangles of the cell or
+    the angle between their normals and the normals at the triangle corners is larger than the tolerance.
+
+    :param cell: lattice coordinates of the cell in (u_min, u_max, v_min, v_max) format
+    :type cell: tuple
+    :param pts: evaluated points and unit normals of the lattice coordinates
+    :type pts: dict
+    :param tol: chordal deviation tolerance
+    :type tol: float
+    :param cos_angle: cosine of the angle tolerance
+    :type cos_angle: float
+    :return: split status on the u- and v-directions
+    :rtype: tuple
+    """
+    x0, x1, y0, y1 = cell
+    xs, ys = _adaptive_stencil(cell)
+
+    def bends(key1, key2):
+        # Angle between the unit normals, degenerate normals are not tested
+        n1, n2 = pts[key1][1], pts[key2][1]
+        if n1 is None or n2 is None:
+            return False
+        return (n1[0] * n2[0]) + (n1[1] * n2[1]) + (n1[2] * n2[2]) < cos_angle
+
+    def curved(keys):
+        # Chordal deviation of the points from the line segment between the end points and the angle between normals
+        p1, p2 = pts[keys[0]][0], pts[keys[-1]][0]
+        vec = [b - a for a, b in zip(p1, p2)]
+        vec_sq = sum(v ** 2 for v in vec)
+        for key in keys[1:-1]:
+            pm = pts[key][0]
+            t = min(1.0, max(0.0, sum(v * (m - a) for v, m, a in zip(vec, pm, p1)) / vec_sq)) if vec_sq > 0.0 else 0.0
+            if sum((m - a - (t * v)) ** 2 for m, a, v in zip(pm, p1, vec)) > tol ** 2:
+                return True
+        return any(bends(keys[0], key) or bends(key, keys[-1]) for key in keys[1:])
+
+    def warped(key, corners):
+        # Chordal deviation of the point from the plane of the triangle and the angle between normals
+        if any(bends(key, corner) for corner in corners):
+            return True
+        pm, p1, p2, p3 = [pts[k][0] for k in (key,) + corners]
+        if len(pm) != 3:
+            return False
+        normal = linalg.vector_cross([b - a for a, b in zip(p1, p2)], [b - a for a, b in zip(p1, p3)])
+        magn = math.sqrt(sum(n ** 2 for n in normal))
+        if magn == 0.0:
+            return curved([corners[0], key, corners[2]])
+        return abs(sum(n * (m - a) for n, m, a in zip(normal, pm, p1))) > tol * magn
+
+    split_u = x1 - x0 > 2 and (curved([(x, y0) for x in xs]) or curved([(x, y1) for x in xs]))
+    split_v = y1 - y0 > 2 and (curved([(x0, y) for y in ys]) or curved([(x1, y) for y in ys]))
+    if not split_u and not split_v:
+        # Triangles of the cell, please see make_triangle_mesh for the organization of the vertices in a quad element
+        lower = ((x0, y0), (x1, y0), (x1, y1))
+        upper = ((x0, y0), (x1, y1), (x0, y1))
+        for x in xs[1:-1]:
+            for y in ys[1:-1]:
+                if warped((x, y), lower if (x - x0) * (y1 - y0) >= (y - y0) * (x1 - x0) else upper):
+                    return x1 - x0 > 2, y1 - y0 > 2
+    return split_u, split_v
+
+
+def make_adaptive_mesh(mesh, surface, **kwargs):
+    """ Generates a triangular mesh by adaptively refining the parametric domain and stores it in a compact mesh.
+
+    The refinement starts from the knot spans of the surface. A cell is split into two or four cells until the chordal
+    deviation of the surface from the edges and the triangles of the cell, and the angle between the surface normals
+    are within the tolerances on a 5x5 stencil of points of the cell. The points and the normals are computed via
+    ``derivatives_list`` method of the surface, one call for each refinement level. Therefore, the flat regions of the
+    surface generate less triangles than the curved regions.
+
+    The cells having vertices of the neighboring cells on their edges are triangulated as a fan around their centers,
+    i.e. the generated mesh has no cracks between the cells of the different sizes.
+
+    This function accepts the following keyword arguments:
+
+    * ``tolerance``: maximum chordal deviation. *Default: 0.1% of the bounding box diagonal of the control points*
+    * ``angle``: maximum angle between the normals in degrees. *Default: 15*
+    * ``max_depth``: maximum number of the subdivisions of a knot span on each direction. *Default: 8*
+
+    :param mesh: compact mesh to be filled
+    :type mesh: elements.Mesh
+    :param surface: surface to be tessellated
+    :type surface: abstract.Surface
+    :return: the input mesh
+    :rtype: elements.Mesh
+    """
+    # Keyword arguments
+    tol = kwargs.get('tolerance', None)
+    if tol is None:
+        bbox = surface.bbox
+        tol = 0.001 * linalg.point_distance(bbox[0], bbox[1])
+    cos_angle = math.cos(math.radians(kwargs.get('angle', 15)))
+    max_depth = max(1, int(kwargs.get('max_depth', 8)))
+
+    # The lattice is one level finer than the deepest cells to keep the cell centers on the lattice
+    scale = 2 ** (max_depth + 1)
+    domain = surface.domain
+    num_u, param_u = _adaptive_params(surface.knotvector_u, domain[0], scale)
+    num_v, param_v = _adaptive_params(surface.knotvector_v, domain[1], scale)
+
+    # Evaluated points and unit normals of the lattice coordinates
+    pts = dict()
+
+    def evaluate(keys):
+        keys = [k for k in dict.fromkeys(keys) if k not in pts]
+        if not keys:
+            return
+        ders = surface.derivatives_list([(param_u(k[0]), param_v(k[1])) for k in keys], order=1)
+        for key, skl in zip(keys, ders):
+            normal = None
+            if len(skl[0][0]) == 3:
+                normal = linalg.vector_cross(skl[1][0], skl[0][1])
+                magn = math.sqrt(sum(n ** 2 for n in normal))
+                normal = [n / magn for n in normal] if magn > 0.0 else None
+            pts[key] = (list(skl[0][0]), normal)
+
+    # Refine the cells level by level
+    cells = [(i * scale, (i + 1) * scale, j * scale, (j + 1) * scale) for i in range(num_u) for j in range(num_v)]
+    leaves = []
+    while cells:
+        tests = [c for c in cells if c[1] - c[0] > 2 or c[3] - c[2] > 2]
+        stencil = []
+        for cell in tests:
+            xs, ys = _adaptive_stencil(cell)
+            stencil += [(x, y) for x in xs for y in ys]
+        evaluate(stencil)
+        leaves += [c for c in cells if c[1] - c[0] <= 2 and c[3] - c[2] <= 2]
+        cells = []
+        for cell in tests:
+            split_u, split_v = _adaptive_split(cell, pts, tol, cos_angle)
+            x0, x1, y0, y1 = cell
+            xs = (x0, (x0 + x1) // 2, x1) if split_u else (x0, x1)
+            ys = (y0, (y0 + y1) // 2, y1) if split_v else (y0, y1)
+            if len(xs) == 2 and len(ys) == 2:
+                leaves.append(cell)
+                continue
+            cells += [(xs[i], xs[i + 1], ys[j], ys[j + 1]) for i in range(len(xs) - 1) for j in range(len(ys) - 1)]
+
+    # Find the cell corners on the horizontal and vertical lattice lines
+    lines_u = dict()
+    lines_v = dict()
+    for x0, x1, y0, y1 in leaves:
+        for x, y in ((x0, y0), (x1, y0), (x1, y1), (x0, y1)):
+            lines_u.setdefault(y, set()).add(x)
+            lines_v.setdefault(x, set()).add(y)
+    lines_u = {k: sorted(v) for k, v in lines_u.items()}
+    lines_v = {k: sorted(v) for k, v in lines_v.items()}
+
+    # Generate the boundary of the cells, including the corners of the neighboring cells on the edges
+    polygons = []
+    for x0, x1, y0, y1 in leaves:
+        bottom = lines_u[y0][bisect_right(lines_u[y0], x0):bisect_left(lines_u[y0], x1)]
+        right = lines_v[x1][bisect_right(lines_v[x1], y0):bisect_left(lines_v[x1], y1)]
+        top = lines_u[y1][bisect_right(lines_u[y1], x0):bisect_left(lines_u[y1], x1)]
+        left = lines_v[x0][bisect_right(lines_v[x0], y0):bisect_left(lines_v[x0], y1)]
+        polygon = [(x0, y0)] + [(x, y0) for x in bottom] + [(x1, y0)] + [(x1, y) for y in right] + [(x1, y1)] + \
+                  [(x, y1) for x in reversed(top)] + [(x0, y1)] + [(x0, y) for y in reversed(left)]
+        polygons.append((((x0 + x1) // 2, (y0 + y1) // 2), polygon))
+    evaluate(center for center, polygon in polygons if len(polygon) > 4)
+
+    # Generate triangles, please see make_triangle_mesh for the organization of the vertices in a quad element
+    mesh.clear()
+    vertex_ids = dict()
+    faces = mesh.faces
+    for center, polygon in polygons:
+        ids = [vertex_ids.setdefault(key, len(vertex_ids)) for key in polygon]
+        if len(ids) == 4:
+            faces.extend((ids[0], ids[1], ids[2], ids[0], ids[2], ids[3]))
+        else:
+            cid = vertex_ids.setdefault(center, len(vertex_ids))
+            for idx in range(len(ids)):
+                faces.extend((cid, ids[idx], ids[(idx + 1) % len(ids)]))
+
+    # Generate vertices
+    keys = sorted(vertex_ids, key=vertex_ids.get)
+    mesh.vertices.extend(chain.from_iterable(pts[k][0] for k in keys))
+    mesh.uv.extend(chain.from_iterable((param_u(k[0]), param_v(k[1])) for k in keys))
+    mesh.inside.extend(bytearray(len(keys)))
+
+    return mesh
+
+
+def mesh_from_entities(mesh, vertices, faces):
+    """ Fills the compact mesh from the lists of vertex and face objects.
+
+    The vertex IDs must be consecutive and start from zero, which is the case for the outputs of
+    :func:`.make_triangle_mesh` and :func:`.make_quad_mesh`.
+
+    :param mesh: compact mesh to be filled
+    :type mesh: elements.Mesh
+    :param vertices: list of vertices
+    :type vertices: list, tuple
+    :param faces: list of faces, e.g. triangles or quads
+    :type faces: list, tuple
+    :return: the input mesh
+    :rtype: elements.Mesh
+    """
+    mesh.clear()
+    for vertex in vertices:
+        mesh.add_vertex(vertex.data, vertex.uv, vertex.inside)
+    for face in faces:
+        mesh.add_face(*face.data)
+    return mesh
+
+
+def mesh_to_entities(mesh):
+    """ Generates the lists of vertex and face objects from the compact mesh.
+
+    :param mesh: compact mesh
+    :type mesh: elements.Mesh
+    :return: a tuple containing lists of vertices and faces (triangles or quads)
+    :rtype: tuple
+    """
+    face_cls = Triangle if mesh.face_size == 3 else Quad
+    dim = mesh.dimension
+    vdata = mesh.vertices
+    uvs = mesh.uv
+    inside = mesh.inside
+
+    vertices = []
+    for idx in range(mesh.num_vertices):
+        vrt = Vertex(*vdata[(idx * dim):((idx + 1) * dim)], id=idx)
+        vrt.uv = [uvs[2 * idx], uvs[(2 * idx) + 1]]
+        if inside[idx]:
+            vrt.inside = True
+        vertices.append(vrt)
+
+    faces = []
+    fdata = mesh.faces
+    fsize = mesh.face_size
+    for idx in range(mesh.num_faces):
+        fc = face_cls(*[vertices[vi] for vi in fdata[(idx * fsize):((idx + 1) * fsize)]], id=idx)
+        faces.append(fc)
+
+    return vertices, faces
+
+
 def polygon_triangulate(tri_idx, *args):
     """ Triangulates a monotone polygon defined by a list of vertices.
 
@@ -250,7 +706,8 @@ def surface_trim_tessellate(v1, v2, v3, v4, vidx, tidx, trims, tessellate_args):
     """ Triangular tessellation algorithm for trimmed surfaces.
 
     This function can be directly used as an input to :func:`.make_triangle_mesh` using ``tessellate_func`` keyword
-    argument.
+    argument. The ``trim_index`` key of the tessellation arguments can be set to a :class:`TrimIndex` instance
+    generated from the trim curves to avoid indexing the trim curves for each call.
 
     :param v1: vertex 1
     :type v1: Vertex
@@ -276,13 +733,18 @@ def surface_trim_tessellate(v1, v2, v3, v4, vidx, tidx, trims, tessellate_args):
     tols = tol ** 2
     vtol = ((tols, tols), (-tols, tols), (-tols, -tols), (tols, -tols))
 
+    # Spatial index of the trim curves (generated only once by the tessellation class)
+    trim_index = tessellate_args.get('trim_index') if tessellate_args else None
+    if trim_index is None:
+        trim_index = TrimIndex(trims, tol=tol)
+
     # Start processing vertices
     vertices = [v1, v2, v3, v4]
     for idx in range(len(vertices)):
-        for trim in trims:
+        for tdx, trim in enumerate(trims):
             cf = 1 if trim.opt['reversed'] else -1
             uv = [p + (cf * t) for p, t in zip(vertices[idx].uv, vtol[idx])]
-            if linalg.wn_poly(uv, trim.evalpts):
+            if trim_index.winding(tdx, uv):
                 if trim.opt['reversed']:
                     if vertices[idx].opt_get('trim') is None or not vertices[idx].opt_get('trim'):
                         vertices[idx].inside = False
@@ -300,23 +762,27 @@ def surface_trim_tessellate(v1, v2, v3, v4, vidx, tidx, trims, tessellate_args):
     if all(vertices_inside):
         return [], []
 
-    # Generate edges as rays
-    edge1 = ray.Ray(v1.uv, v2.uv)
-    edge2 = ray.Ray(v2.uv, v3.uv)
-    edge3 = ray.Ray(v3.uv, v4.uv)
-    edge4 = ray.Ray(v4.uv, v1.uv)
-
-    # Put all edge rays to a list
-    edges = [edge1, edge2, edge3, edge4]
-
     # List of intersections
     intersections = []
 
-    # Loop all trim curves
-    for trim in trims:
-        pts = trim.evalpts
-        for idx in range(len(pts) - 1):
+    # Find the trim curve segments around the cell
+    uvs = [v.uv for v in vertices]
+    segments = trim_index.segments([min(uv[0] for uv in uvs), min(uv[1] for uv in uvs)],
+                                   [max(uv[0] for uv in uvs), max(uv[1] for uv in uvs)])
+    if segments:
+        # Generate edges as rays
+        edge1 = ray.Ray(v1.uv, v2.uv)
+        edge2 = ray.Ray(v2.uv, v3.uv)
+        edge3 = ray.Ray(v3.uv, v4.uv)
+        edge4 = ray.Ray(v4.uv, v1.uv)
+
+        # Put all edge rays to a list
+        edges = [edge1, edge2, edge3, edge4]
+
+        # Loop the trim curve segments in the order of the trim curves
+        for tdx, idx in segments:
             # Generate a ray from trim curve's evaluated points
+            pts = trim_index.points(tdx)
             trim_ray = ray.Ray(pts[idx], pts[idx + 1])
 
             # Intersection test of the trim curve's ray with all edges
@@ -385,8 +851,8 @@ def surface_trim_tessellate(v1, v2, v3, v4, vidx, tidx, trims, tessellate_args):
     # Check again if the barycentric coordinates of the triangles are inside
     for idx in range(len(tris)):
         tri_center = linalg.triangle_center(tris[idx], uv=True)
-        for trim in trims:
-            if linalg.wn_poly(tri_center, trim.evalpts):
+        for tdx, trim in enumerate(trims):
+            if trim_index.winding(tdx, tri_center):
                 if trim.opt['reversed']:
                     if tris[idx].opt_get('trim') is None or not tris[idx].opt_get('trim'):
                         tris[idx].inside = False
@@ -406,3 +872,137 @@ def surface_trim_tessellate(v1, v2, v3, v4, vidx, tidx, trims, tessellate_args):
             tris_final.append(tri)
 
     return tris_vertices, tris_final
+
+
+class TrimIndex(object):
+    """ Spatial index of the trim curve segments on the parametric space.
+
+    The segments of all trim curves are bucketed into a uniform grid, so that a cell of the tessellation grid only
+    tests the segments around it for intersections. The segments of each trim curve are also bucketed into horizontal
+    bands for the scanline point classification, i.e. the winding number test only visits the segments crossing the
+    horizontal line through the test point.
+
+    Both queries return the same results with testing all segments, as they skip only the segments which cannot pass
+    the tests.
+
+    :param trims: trim curves
+    :type trims: list, tuple
+    :param tol: tolerance value for the segment intersections
+    :type tol: float
+    """
+    __slots__ = ('_polygons', '_bands', '_segments', '_seg_min', '_seg_max', '_grid')
+
+    def __init__(self, trims, tol=10e-8):
+        self._polygons = [list(trim.evalpts) for trim in trims]
+        self._bands = [self._scanline_bands(pts) for pts in self._polygons]
+
+        # Bounding boxes of the segments enlarged by the intersection tolerance
+        self._segments = []
+        self._seg_min = []
+        self._seg_max = []
+        for tdx, pts in enumerate(self._polygons):
+            for idx in range(len(pts) - 1):
+                self._segments.append((tdx, idx))
+                self._seg_min.append([min(p1, p2) - tol * (abs(p2 - p1) + 1.0) for p1, p2 in zip(pts[idx], pts[idx + 1])])
+                self._seg_max.append([max(p1, p2) + tol * (abs(p2 - p1) + 1.0) for p1, p2 in zip(pts[idx], pts[idx + 1])])
+        self._grid = self._segment_grid(tol)
+
+    @staticmethod
+    def _bucket_range(lo, hi, origin, step, num):
+        """ Returns the range of the buckets overlapping with the [lo, hi] interval. """
+        return range(max(0, min(num - 1, int((lo - origin) / step))), max(0, min(num - 1, int((hi - origin) / step))) + 1)
+
+    def _scanline_bands(self, pts):
+        if len(pts) < 2:
+            return None
+        v_min = min(pt[1] for pt in pts)
+        v_max = max(pt[1] for pt in pts)
+        if v_max <= v_min:
+            # Horizontal segments never cross a horizontal line
+            return None
+        num = max(1, (len(pts) - 1) // 2)
+        step = (v_max - v_min) / num
+        bands = [[] for _ in range(num)]
+        for idx in range(len(pts) - 1):
+            lo, hi = sorted((pts[idx][1], pts[idx + 1][1]))
+            for bdx in self._bucket_range(lo, hi, v_min, step, num):
+                bands[bdx].append(idx)
+        return v_min, v_max, step, bands
+
+    def _segment_grid(self, tol):
+        if not self._segments:
+            return None
+        origin = [min(pt[i] for pt in self._seg_min) for i in range(2)]
+        extent = [max(pt[i] for pt in self._seg_max) - origin[i] for i in range(2)]
+        num = int(len(self._segments) ** 0.5) + 1
+        step = [ext / num if ext > 0.0 else 1.0 for ext in extent]
+        grid = [[] for _ in range(num * num)]
+        for sdx in range(len(self._segments)):
+            lo = self._seg_min[sdx]
+            hi = self._seg_max[sdx]
+            for i in self._bucket_range(lo[0], hi[0], origin[0], step[0], num):
+                for j in self._bucket_range(lo[1], hi[1], origin[1], step[1], num):
+                    grid[j + (i * num)].append(sdx)
+        return origin, step, num, grid, tol
+
+    def points(self, idx):
+        """ Returns the evaluated points of the trim curve.
+
+        :param idx: index of the trim curve
+        :type idx: int
+        :return: evaluated points
+        :rtype: list
+        """
+        return self._polygons[idx]
+
+    def winding(self, idx, point):
+        """ Winding number test for a point in the trim curve.
+
+        The result is the same with :func:`.linalg.wn_poly`.
+
+        :param idx: index of the trim curve
+        :type idx: int
+        :param point: point to be tested
+        :type point: list, tuple
+        :return: True if the point is inside the trim curve, False otherwise
+        :rtype: bool
+        """
+        bands = self._bands[idx]
+        if bands is None or not bands[0] <= point[1] <= bands[1]:
+            return False
+        v_min, _, step, buckets = bands
+        vertices = self._polygons[idx]
+        wn = 0
+        for i in buckets[min(len(buckets) - 1, int((point[1] - v_min) / step))]:
+            if vertices[i][1] <= point[1]:
+                if vertices[i + 1][1] > point[1]:
+                    if linalg.is_left(vertices[i], vertices[i + 1], point) > 0:
+                        wn += 1
+            else:
+                if vertices[i + 1][1] <= point[1]:
+                    if linalg.is_left(vertices[i], vertices[i + 1], point) < 0:
+                        wn -= 1
+        return bool(wn)
+
+    def segments(self, bbox_min, bbox_max):
+        """ Finds the trim curve segments which can intersect with the edges of the input bounding box.
+
+        :param bbox_min: minimum corner of the bounding box
+        :type bbox_min: list, tuple
+        :param bbox_max: maximum corner of the bounding box
+        :type bbox_max: list, tuple
+        :return: (trim curve index, segment index) pairs in the order of the trim curves
+        :rtype: list
+        """
+        if self._grid is None:
+            return []
+        origin, step, num, grid, tol = self._grid
+        lo = [b - tol * (abs(e - b) + 1.0) for b, e in zip(bbox_min, bbox_max)]
+        hi = [e + tol * (abs(e - b) + 1.0) for b, e in zip(bbox_min, bbox_max)]
+        candidates = set()
+        for i in self._bucket_range(lo[0], hi[0], origin[0], step[0], num):
+            for j in self._bucket_range(lo[1], hi[1], origin[1], step[1], num):
+                candidates.update(grid[j + (i * num)])
+        return [self._segments[sdx] for sdx in sorted(candidates)
+                if self._seg_min[sdx][0] <= hi[0] and lo[0] <= self._seg_max[sdx][0] and
+                self._seg_min[sdx][1] <= hi[1] and lo[1] <= self._seg_max[sdx][1]]
@@ -12,9 +12,26 @@ import abc
 import warnings
 from . import vis, helpers, knotvector, voxelize, utilities
 from . import tessellate
+from . import linalg
+from ._cache import LRUCache, CACHE_MEMORY
 from .evaluators import AbstractEvaluator
 from .exceptions import GeomdlException
 from . import _utilities as utl
+try:
+    from . import _arrays
+except ImportError:
+    _arrays = None
+
+
+def _copy_points(pts):
+    """ Copies the list of points together with the points, or the array of points.
+
+    :param pts: list of points, NumPy array or :class:`.elements.PointGrid`
+    :return: copy of the points
+    """
+    if isinstance(pts, list):
+        return [list(pt) for pt in pts]
+    return copy.copy(pts)
 
 
 @utl.add_metaclass(abc.ABCMeta)
@@ -300,11 +317,23 @@ class SplineGeometry(Geometry):
 
     * ``precision``: number of decimal places to round to. *Default: 18*
     * ``normalize_kv``: if True, knot vector(s) will be normalized to [0,1] domain. *Default: True*
-    * ``find_span_func``: default knot span finding algorithm. *Default:* :func:`.helpers.find_span_linear`
+    * ``find_span_func``: default knot span finding algorithm. *Default:* :func:`.helpers.find_span_binsearch`
+    * ``array_storage``: stores the control points in a contiguous NumPy array. *Default: False*
+    * ``single_precision``: stores the evaluated points as float32 values. *Default: False*
+
+    With ``single_precision=True``, the evaluation parameters are not rounded to ``precision`` decimal places and the
+    evaluated points are computed in float64 and stored as float32 values in a :class:`.elements.PointGrid`. Each
+    coordinate differs from the float64 evaluation by at most 2^-24 (about 6e-8) times its magnitude. This mode is
+    designed for the visualization workloads, the rest of the operations still use float64 values.
+
+    The copies generated by ``copy.deepcopy`` share the control points, the knot vectors and the evaluated points with
+    the original geometry. The shared data is duplicated when one of the geometries modifies it, e.g. via
+    ``update_ctrlpt``, or returns it from a getter. Therefore, the copies stay independent of the original geometry
+    even if the lists or the arrays returned by the getters are modified directly.
     """
     # __slots__ = (
     #     '_pdim', '_dinit', '_rational', '_degree', '_knot_vector', '_control_points', '_control_points_size',
-    #     '_delta', '_bounding_box', '_evaluator', '_vis_component', '_span_func', '_kv_normalize'
+    #     '_delta', '_bounding_box', '_evaluator', '_vis_component', '_span_func', '_kv_normalize', '_array_storage'
     # )
 
     def __init__(self, **kwargs):
@@ -321,8 +350,15 @@ class SplineGeometry(Geometry):
         self._bounding_box = self._init_array()  # bounding box
         self._evaluator = None  # evaluator instance
         self._vis_component = None  # visualization component
-        self._span_func = kwargs.get('find_span_func', helpers.find_span_linear)  # default "find_span" function
+        self._span_func = kwargs.get('find_span_func', helpers.find_span_binsearch)  # default "find_span" function
         self._kv_normalize = kwargs.get('normalize_kv', True)  # flag to control knot vector normalization
+        self._dirty_ctrlpts = set()  # updated control points since the last evaluation
+        self._ctrlpts_version = 0  # number of the in-place control point updates
+        self._cow_shared = False  # flag for the buffers shared with the copies of the geometry
+        self._array_storage = kwargs.get('array_storage', False)  # flag to control contiguous ctrlpts storage
+        if self._array_storage and _arrays is None:
+            raise GeomdlException("Please install 'numpy' package to use array storage: pip install numpy")
+        self._single_precision = kwargs.get('single_precision', False)  # flag to control float32 evalpts storage
 
     def __eq__(self, other):
         if not hasattr(other, '_pdim'):
@@ -388,6 +424,70 @@ class SplineGeometry(Geometry):
         """
         return self._rational
 
+    @property
+    def evalpts(self):
+        """ Evaluated points.
+
+        If some control points are updated after the evaluation, e.g. via ``update_ctrlpt`` method, the evaluated
+        points affected by these control points are re-evaluated before returning.
+
+        Please refer to the `wiki <https://github.com/orbingol/NURBS-Python/wiki/Using-Python-Properties>`_ for details
+        on using this class member.
+
+        :getter: Gets the coordinates of the evaluated points
+        :type: list
+        """
+        self._own_buffers()
+        if self._dirty_ctrlpts and self._eval_points:
+            self._update_evalpts()
+        return super(SplineGeometry, self).evalpts
+
+    def _update_evalpts(self):
+        """ Re-evaluates the points affected by the updated control points.
+
+        The default implementation resets the evaluated points, so that the geometry will be evaluated again.
+        """
+        self.reset(evalpts=True)
+
+    def __deepcopy__(self, memo):
+        # Share the buffers with the copy instead of duplicating them (copy-on-write)
+        for buf in self._cow_buffers():
+            memo[id(buf)] = buf
+        self._cow_shared = True
+        return super(SplineGeometry, self).__deepcopy__(memo)
+
+    def _cow_buffers(self):
+        """ Returns the buffers which are shared with the copies of the geometry.
+
+        The shared buffers are replaced by the setters. The methods modifying them in place should call
+        :py:meth:`_own_buffers` first.
+
+        :return: list of buffers
+        :rtype: list
+        """
+        return [self._control_points, self._eval_points] + list(self._knot_vector)
+
+    def _eval_precision(self):
+        """ Returns the number of decimal places to round the evaluation parameters to.
+
+        :return: number of decimal places, None if the parameters are not rounded
+        :rtype: int
+        """
+        return None if self._single_precision else self._precision
+
+    def _own_buffers(self):
+        """ Creates private copies of the buffers shared with the copies of the geometry.
+
+        The getters call this method before returning a buffer, as the returned lists and arrays can be modified in
+        place.
+        """
+        if not self._cow_shared:
+            return
+        self._control_points = _copy_points(self._control_points)
+        self._eval_points = _copy_points(self._eval_points)
+        self._knot_vector = [copy.copy(kv) for kv in self._knot_vector]
+        self._cow_shared = False
+
     @property
     def dimension(self):
         """ Spatial dimension.
@@ -438,6 +538,7 @@ class SplineGeometry(Geometry):
         :setter: Sets the knot vector
         :type: list
         """
+        self._own_buffers()
         return self._knot_vector
 
     @knotvector.setter
@@ -455,6 +556,7 @@ class SplineGeometry(Geometry):
         :setter: Sets the control points
         :type: list
         """
+        self._own_buffers()
         return self._control_points
 
     @ctrlpts.setter
@@ -580,11 +682,27 @@ class SplineGeometry(Geometry):
         The input will be an array of coordinates. If you are working in the 3-dimensional space, then your coordinates
         will be an array of 3 elements representing *(x, y, z)* coordinates.
 
+        If the geometry is initialized with ``array_storage=True``, the control points are copied into a single
+        contiguous float64 NumPy array in (number of control points, dimension) shape instead of a list of lists and
+        the ``array_init``, ``array_check_for`` and ``callback`` keyword arguments are ignored.
+
+        The input can be adopted without validating and converting the control points one by one via
+        ``validate=False``. In this case, only the number of control points and the dimension of the first control
+        point (or the shape of the array) are checked, and the geometry takes the ownership of the input. A list input
+        is stored as it is and a NumPy array is converted via ``tolist()``. With ``array_storage=True``, a contiguous
+        float64 array input is stored without copying.
+
+        .. code-block:: python
+
+            # Set the control points of a surface from a (size_u * size_v, dimension) array
+            surf.set_ctrlpts(ctrlpts_array, size_u, size_v, validate=False)
+
         Keyword Arguments:
             * ``array_init``: initializes the control points array in the instance
             * ``array_check_for``: defines the types for input validation
             * ``callback``: defines the callback function for processing input points
             * ``dimension``: defines the spatial dimension of the input points
+            * ``validate``: if False, skips the validation of the individual control points. *Default: True*
 
         :param ctrlpts: input control points as a list of coordinates
         :type ctrlpts: list
@@ -609,21 +727,54 @@ class SplineGeometry(Geometry):
             raise ValueError("Number of arguments after ctrlpts must be " + str(self._pdim))
 
         # Keyword arguments
-        array_init = kwargs.get('array_init', [[] for _ in range(len(ctrlpts))])
+        array_init = kwargs.get('array_init', None)
         array_check_for = kwargs.get('array_check_for', (list, tuple))
         callback_func = kwargs.get('callback', validate_and_clean)
+        validate = kwargs.get('validate', True)
         self._dimension = kwargs.get('dimension', len(ctrlpts[0]))
 
         # Pop existing keywords from kwargs dict
-        existing_kws = ['array_init', 'array_check_for', 'callback', 'dimension']
+        existing_kws = ['array_init', 'array_check_for', 'callback', 'dimension', 'validate']
         for ekw in existing_kws:
             if ekw in kwargs:
                 kwargs.pop(ekw)
 
         # Set control points and sizes
-        self._control_points = callback_func(ctrlpts, array_check_for, self._dimension, array_init, **kwargs)
+        if not validate:
+            self._control_points = self._adopt_ctrlpts(ctrlpts, args)
+        elif self._array_storage:
+            self._control_points = _arrays.ctrlpts_array(ctrlpts, self._dimension)
+        else:
+            if array_init is None:
+                array_init = [[] for _ in range(len(ctrlpts))]
+            self._control_points = callback_func(ctrlpts, array_check_for, self._dimension, array_init, **kwargs)
         self._control_points_size = [int(arg) for arg in args]
 
+    def _adopt_ctrlpts(self, ctrlpts, sizes):
+        """ Checks the shape of the trusted control points input and returns it for storing without copying.
+
+        :param ctrlpts: control points
+        :type ctrlpts: list, tuple, numpy.ndarray
+        :param sizes: number of control points corresponding to each parametric dimension
+        :type sizes: list, tuple
+        :return: control points
+        :rtype: list, numpy.ndarray
+        """
+        num_ctrlpts = 1
+        for sz in sizes:
+            num_ctrlpts *= int(sz)
+        if len(ctrlpts) != num_ctrlpts:
+            raise ValueError("The number of control points must be " + str(num_ctrlpts))
+        if getattr(ctrlpts, 'ndim', 2) != 2 or len(ctrlpts[0]) != self._dimension:
+            raise ValueError("The input must be a list of " + str(self._dimension) + " dimensional control points")
+        if self._array_storage:
+            return _arrays.ctrlpts_array(ctrlpts, self._dimension, copy=False)
+        if isinstance(ctrlpts, list):
+            return ctrlpts
+        if hasattr(ctrlpts, 'tolist'):
+            return ctrlpts.tolist()
+        return list(ctrlpts)
+
     @abc.abstractmethod
     def render(self, **kwargs):
         """ Abstract method for spline rendering and visualization.
@@ -687,7 +838,9 @@ class Curve(SplineGeometry):
 
     * ``precision``: number of decimal places to round to. *Default: 18*
     * ``normalize_kv``: if True, knot vector(s) will be normalized to [0,1] domain. *Default: True*
-    * ``find_span_func``: default knot span finding algorithm. *Default:* :func:`.helpers.find_span_linear`
+    * ``find_span_func``: default knot span finding algorithm. *Default:* :func:`.helpers.find_span_binsearch`
+    * ``array_storage``: stores the control points in a contiguous NumPy array. *Default: False*
+    * ``single_precision``: stores the evaluated points as float32 values. *Default: False*
     """
 
     def __init__(self, **kwargs):
@@ -754,6 +907,7 @@ class Curve(SplineGeometry):
         :setter: Sets the knot vector
         :type: list
         """
+        self._own_buffers()
         return self._knot_vector[0]
 
     @knotvector.setter
@@ -782,6 +936,7 @@ class Curve(SplineGeometry):
         :setter: Sets the control points
         :type: list
         """
+        self._own_buffers()
         return self._control_points
 
     @ctrlpts.setter
@@ -878,7 +1033,10 @@ class Curve(SplineGeometry):
 
     def reverse(self):
         """ Reverses the curve """
-        self._control_points = list(reversed(self._control_points))
+        if self._array_storage:
+            self._control_points = self._control_points[::-1].copy()
+        else:
+            self._control_points = list(reversed(self._control_points))
         max_k = self.knotvector[-1]
         new_kv = [max_k - k for k in self.knotvector]
         self._knot_vector[0] = list(reversed(new_kv))
@@ -1029,6 +1187,9 @@ class Curve(SplineGeometry):
             self._control_points = self._init_array()
             self._bounding_box = self._init_array()
 
+        if reset_ctrlpts or reset_evalpts:
+            self._dirty_ctrlpts.clear()
+
         if reset_evalpts:
             self._eval_points = self._init_array()
 
@@ -1115,6 +1276,20 @@ class Curve(SplineGeometry):
             if not utilities.check_params([u]):
                 raise GeomdlException("Parameters should be between 0 and 1")
 
+    def derivatives_list(self, param_list, order=0):
+        """ Evaluates the derivatives of the curve for an input range of parameters.
+
+        The default implementation calls :py:meth:`derivatives` for each parameter.
+
+        :param param_list: list of parameters
+        :type param_list: list, tuple
+        :param order: derivative order
+        :type order: int
+        :return: a list containing up to {order}-th derivatives of the curve for each parameter
+        :rtype: list
+        """
+        return [self.derivatives(u, order) for u in param_list]
+
 
 @utl.add_metaclass(abc.ABCMeta)
 class Surface(SplineGeometry):
@@ -1168,7 +1343,11 @@ class Surface(SplineGeometry):
 
     * ``precision``: number of decimal places to round to. *Default: 18*
     * ``normalize_kv``: if True, knot vector(s) will be normalized to [0,1] domain. *Default: True*
-    * ``find_span_func``: default knot span finding algorithm. *Default:* :func:`.helpers.find_span_linear`
+    * ``find_span_func``: default knot span finding algorithm. *Default:* :func:`.helpers.find_span_binsearch`
+    * ``array_storage``: stores the control points in a contiguous NumPy array. *Default: False*
+    * ``single_precision``: stores the evaluated points as float32 values. *Default: False*
+    * ``lod_cache_size``: maximum number of the levels of detail in the cache. *Default: 8*
+    * ``lod_cache_memory``: memory budget of the level of detail cache in bytes. *Default: 64 MB*
     """
     # __slots__ = ('_tsl_component', '_trims')
 
@@ -1179,6 +1358,13 @@ class Surface(SplineGeometry):
         super(Surface, self).__init__(**kwargs)
         self._tsl_component = None  # tessellation component
         self._trims = self._init_array()  # trim curves
+        self._lod_cache = LRUCache(kwargs.get('lod_cache_size', 8), kwargs.get('lod_cache_memory', CACHE_MEMORY))
+
+    def __deepcopy__(self, memo):
+        # Don't copy the tessellations of the levels of detail
+        info = self._lod_cache.info()
+        memo[id(self._lod_cache)] = LRUCache(info.maxsize, info.maxmemsize)
+        return super(Surface, self).__deepcopy__(memo)
 
     @property
     def order_u(self):
@@ -1289,6 +1475,7 @@ class Surface(SplineGeometry):
         :setter: Sets the knot vector
         :type: list
         """
+        self._own_buffers()
         return self._knot_vector
 
     @knotvector.setter
@@ -1312,6 +1499,7 @@ class Surface(SplineGeometry):
         :setter: Sets knot vector for the u-direction
         :type: list
         """
+        self._own_buffers()
         return self._knot_vector[0]
 
     @knotvector_u.setter
@@ -1343,6 +1531,7 @@ class Surface(SplineGeometry):
         :setter: Sets knot vector for the v-direction
         :type: list
         """
+        self._own_buffers()
         return self._knot_vector[1]
 
     @knotvector_v.setter
@@ -1376,6 +1565,7 @@ class Surface(SplineGeometry):
         :setter: Sets the control points
         :type: list
         """
+        self._own_buffers()
         return self._control_points
 
     @ctrlpts.setter
@@ -1556,8 +1746,8 @@ class Surface(SplineGeometry):
         if float(value) <= 0 or float(value) >= 1:
             raise ValueError("Surface evaluation delta (u-direction) must be between 0.0 and 1.0")
 
-        # Clean up the surface points
-        self.reset(evalpts=True)
+        # Clean up the surface points, the levels of detail don't depend on the evaluation delta
+        self.reset(evalpts=True, lod=False)
 
         # Set new delta value
         self._delta[0] = float(value)
@@ -1588,8 +1778,8 @@ class Surface(SplineGeometry):
         if float(value) <= 0 or float(value) >= 1:
             raise ValueError("Surface evaluation delta (v-direction) should be between 0.0 and 1.0")
 
-        # Clean up the surface points
-        self.reset(evalpts=True)
+        # Clean up the surface points, the levels of detail don't depend on the evaluation delta
+        self.reset(evalpts=True, lod=False)
 
         # Set new delta value
         self._delta[1] = float(value)
@@ -1653,6 +1843,7 @@ class Surface(SplineGeometry):
             return
 
         self._tsl_component = value
+        self._lod_cache.clear()
 
     @property
     def vertices(self):
@@ -1721,6 +1912,7 @@ class Surface(SplineGeometry):
             if v.dimension != 2:
                 raise GeomdlException("Curve at index " + str(i) + " is not a 2-dimensional curve")
         self._trims = tuple(value)
+        self._lod_cache.clear()
 
     @property
     def data(self):
@@ -1929,15 +2121,140 @@ class Surface(SplineGeometry):
                 kwargs.pop(kw)
 
         # Call tessellation component for vertex and triangle generation
-        self._tsl_component.tessellate(self.evalpts, size_u=self.sample_size_u, size_v=self.sample_size_v,
-                                       trims=self.trims, **kwargs)
+        self._tessellate_component(self._tsl_component, self.evalpts, self.sample_size_u, self.sample_size_v,
+                                   **kwargs)
+
+    def _tessellate_component(self, component, points, size_u, size_v, **kwargs):
+        """ Tessellates the surface using the input tessellation component.
+
+        :param component: tessellation component
+        :type component: tessellate.AbstractTessellate
+        :param points: evaluated points
+        :param size_u: number of evaluated points on the u-direction
+        :type size_u: int
+        :param size_v: number of evaluated points on the v-direction
+        :type size_v: int
+        """
+        # Adaptive tessellation evaluates the surface directly
+        if isinstance(component, tessellate.AdaptiveTessellate):
+            if self.trims:
+                raise GeomdlException("Adaptive tessellation does not support trimmed surfaces")
+            component.tessellate(self, **kwargs)
+            return
+
+        # Call tessellation component for vertex and triangle generation
+        component.tessellate(points, size_u=size_u, size_v=size_v, trims=self.trims, **kwargs)
+
+        # Re-evaluate vertex coordinates in a single pass using the compact mesh
+        mesh = getattr(component, 'mesh', None)
+        if mesh is not None and mesh.num_vertices > 0:
+            uvs = mesh.uv
+            indices = []
+            params = []
+            for idx in range(mesh.num_vertices):
+                uv = (uvs[2 * idx], uvs[(2 * idx) + 1])
+                if self._kv_normalize and not utilities.check_params(uv):
+                    continue
+                indices.append(idx)
+                params.append(uv)
+            if params:
+                component.update_vertices(indices, self.evaluate_list(params))
+            return
 
-        # Re-evaluate vertex coordinates
-        for idx in range(len(self._tsl_component.vertices)):
-            uv = self._tsl_component.vertices[idx].uv
+        # Fall back to the vertex objects for the custom tessellation components
+        for idx in range(len(component.vertices)):
+            uv = component.vertices[idx].uv
             if self._kv_normalize and not utilities.check_params(uv):
                 continue
-            self._tsl_component.vertices[idx].data = self.evaluate_single(uv)
+            component.vertices[idx].data = self.evaluate_single(uv)
+
+    def tessellate_lod(self, **kwargs):
+        """ Tessellates the surface for a level of detail and caches the result.
+
+        The tessellations are stored in a least recently used cache keyed by the sample size, the vertex spacing and
+        the tolerance, so that switching between the levels of detail does not re-tessellate the surface. The cache is
+        limited by the ``lod_cache_size`` and ``lod_cache_memory`` initialization arguments and it is cleared when the
+        surface or the tessellation component changes. The tessellation component and the evaluated points of the
+        surface are not modified.
+
+        .. code-block:: python
+
+            coarse = surf.tessellate_lod(sample_size=10)
+            fine = surf.tessellate_lod(sample_size=50)
+            adaptive = surf.tessellate_lod(tolerance=0.01)
+
+            # Vertex coordinates of the coarse level
+            vertices = coarse.vertices
+
+        Keyword Arguments:
+            * ``sample_size``: number of points on both directions or (u, v) tuple. *Default:* :py:attr:`sample_size`
+            * ``vertex_spacing``: defines the size of the triangles. *Default: 1*
+            * ``tolerance``: chordal deviation tolerance of the :class:`.tessellate.AdaptiveTessellate` component,
+              the sample size and the vertex spacing are not used if it is set. *Default: None*
+
+        :return: compact mesh of the level of detail
+        :rtype: elements.Mesh
+        """
+        sample_size = kwargs.get('sample_size', None)
+        if sample_size is None:
+            sample_size = self.sample_size
+        elif isinstance(sample_size, int):
+            sample_size = (sample_size, sample_size)
+        vertex_spacing = int(kwargs.get('vertex_spacing', 1))
+        tolerance = kwargs.get('tolerance', None)
+
+        # The adaptive tessellation does not use the evaluated points
+        if tolerance is not None or isinstance(self._tsl_component, tessellate.AdaptiveTessellate):
+            key = (None, None, tolerance)
+        else:
+            key = (tuple(int(s) for s in sample_size), vertex_spacing, None)
+        return self._lod_cache.get(key, self._tessellate_lod, *key)
+
+    def _tessellate_lod(self, sample_size, vertex_spacing, tolerance):
+        """ Tessellates the surface for a level of detail using a new tessellation component.
+
+        :param sample_size: number of points on the u- and v-directions
+        :type sample_size: tuple
+        :param vertex_spacing: vertex spacing
+        :type vertex_spacing: int
+        :param tolerance: chordal deviation tolerance
+        :type tolerance: float
+        :return: compact mesh of the level of detail
+        :rtype: elements.Mesh
+        """
+        if tolerance is not None and not isinstance(self._tsl_component, tessellate.AdaptiveTessellate):
+            component = tessellate.AdaptiveTessellate(tolerance=tolerance)
+            self._tessellate_component(component, None, 0, 0)
+            return component.mesh
+
+        component = self._tsl_component.__class__()
+        component.arguments = dict(self._tsl_component.arguments)
+        if tolerance is not None:
+            self._tessellate_component(component, None, 0, 0, tolerance=tolerance)
+            return component.mesh
+        if sample_size is None:
+            self._tessellate_component(component, None, 0, 0)
+            return component.mesh
+
+        # Evaluate the points for the sample size, if it is different than the sample size of the surface
+        if tuple(sample_size) == tuple(self.sample_size):
+            points = self.evalpts
+        else:
+            params = [linalg.linspace(d[0], d[1], n, decimals=self._eval_precision())
+                      for d, n in zip(self.domain, sample_size)]
+            points = self.evaluate_list([(u, v) for u in params[0] for v in params[1]])
+        self._tessellate_component(component, points, sample_size[0], sample_size[1], vertex_spacing=vertex_spacing)
+        return component.mesh
+
+    @property
+    def lod_cache(self):
+        """ Cache of the tessellations generated by :py:meth:`tessellate_lod`.
+
+        The cache provides ``info()`` method for the statistics and ``clear()`` method for removing the tessellations.
+
+        :getter: Gets the cache of the levels of detail
+        """
+        return self._lod_cache
 
     def reset(self, **kwargs):
         """ Resets control points and/or evaluated points.
@@ -1945,10 +2262,12 @@ class Surface(SplineGeometry):
         Keyword Arguments:
             * ``evalpts``: if True, then resets evaluated points
             * ``ctrlpts`` if True, then resets control points
+            * ``lod``: if True, then resets the levels of detail. *Default: True*
 
         """
         reset_ctrlpts = kwargs.get('ctrlpts', False)
         reset_evalpts = kwargs.get('evalpts', False)
+        reset_lod = kwargs.get('lod', True)
 
         if reset_ctrlpts:
             self._control_points = self._init_array()
@@ -1956,11 +2275,16 @@ class Surface(SplineGeometry):
             self._control_points_size[1] = 0
             self._bounding_box = self._init_array()
 
+        if reset_ctrlpts or reset_evalpts:
+            self._dirty_ctrlpts.clear()
+
         if reset_evalpts:
             self._eval_points = self._init_array()
 
         # Reset vertices and triangles
         self._tsl_component.reset()
+        if reset_lod:
+            self._lod_cache.clear()
 
     # Checks whether the surface evaluation is possible or not
     def _check_variables(self):
@@ -2053,6 +2377,20 @@ class Surface(SplineGeometry):
             if not utilities.check_params([u, v]):
                 raise GeomdlException("Parameters should be between 0 and 1")
 
+    def derivatives_list(self, param_list, order=0):
+        """ Evaluates the derivatives of the surface for a given list of (u, v) parameters.
+
+        The default implementation calls :py:meth:`derivatives` for each parameter pair.
+
+        :param param_list: list of parameter pairs (u, v)
+        :type param_list: list, tuple
+        :param order: derivative order
+        :type order: int
+        :return: a list of SKL arrays for each parameter pair
+        :rtype: list
+        """
+        return [self.derivatives(uv[0], uv[1], order) for uv in param_list]
+
 
 @utl.add_metaclass(abc.ABCMeta)
 class Volume(SplineGeometry):
@@ -2102,7 +2440,9 @@ class Volume(SplineGeometry):
 
     * ``precision``: number of decimal places to round to. *Default: 18*
     * ``normalize_kv``: if True, knot vector(s) will be normalized to [0,1] domain. *Default: True*
-    * ``find_span_func``: default knot span finding algorithm. *Default:* :func:`.helpers.find_span_linear`
+    * ``find_span_func``: default knot span finding algorithm. *Default:* :func:`.helpers.find_span_binsearch`
+    * ``array_storage``: stores the control points in a contiguous NumPy array. *Default: False*
+    * ``single_precision``: stores the evaluated points as float32 values. *Default: False*
     """
 
     def __init__(self, **kwargs):
@@ -2263,6 +2603,7 @@ class Volume(SplineGeometry):
         :setter: Sets the knot vector
         :type: list
         """
+        self._own_buffers()
         return self._knot_vector
 
     @knotvector.setter
@@ -2287,6 +2628,7 @@ class Volume(SplineGeometry):
         :setter: Sets knot vector for the u-direction
         :type: list
         """
+        self._own_buffers()
         return self._knot_vector[0]
 
     @knotvector_u.setter
@@ -2318,6 +2660,7 @@ class Volume(SplineGeometry):
         :setter: Sets knot vector for the v-direction
         :type: list
         """
+        self._own_buffers()
         return self._knot_vector[1]
 
     @knotvector_v.setter
@@ -2349,6 +2692,7 @@ class Volume(SplineGeometry):
         :setter: Sets knot vector for the w-direction
         :type: list
         """
+        self._own_buffers()
         return self._knot_vector[2]
 
     @knotvector_w.setter
@@ -2377,6 +2721,7 @@ class Volume(SplineGeometry):
         :setter: Sets the control points
         :type: list
         """
+        self._own_buffers()
         return self._control_points
 
     @ctrlpts.setter
@@ -2759,6 +3104,9 @@ class Volume(SplineGeometry):
             self._control_points_size = [0, 0, 0]
             self._bounding_box = self._init_array()
 
+        if reset_ctrlpts or reset_evalpts:
+            self._dirty_ctrlpts.clear()
+
         if reset_evalpts:
             self._eval_points = self._init_array()
 
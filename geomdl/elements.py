@@ -9,18 +9,52 @@
 
 import copy
 import abc
+from array import array
 from .exceptions import GeomdlException
 from . import _utilities as utl
+try:
+    from . import _arrays
+except ImportError:
+    _arrays = None
+
+
+# Attribute names cache for the entity classes
+_ENTITY_SLOTS = {}
+
+
+def _entity_slots(cls):
+    """ Returns the names of the instance attributes defined in the ``__slots__`` of the class hierarchy.
+
+    :param cls: entity class
+    :return: attribute names
+    :rtype: tuple
+    """
+    try:
+        return _ENTITY_SLOTS[cls]
+    except KeyError:
+        names = []
+        for c in reversed(cls.__mro__):
+            slots = c.__dict__.get('__slots__', ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            names += [sl for sl in slots if sl not in ('__weakref__', '_iter_index')]
+        _ENTITY_SLOTS[cls] = tuple(names)
+        return _ENTITY_SLOTS[cls]
 
 
 @utl.add_metaclass(abc.ABCMeta)
 class AbstractEntity(object):
-    """ Abstract base class for all geometric entities. """
+    """ Abstract base class for all geometric entities.
+
+    The entities define ``__slots__`` to keep the memory footprint of the large meshes low. The custom data dict
+    (:py:attr:`opt`) is allocated when it is set for the first time.
+    """
+    __slots__ = ('_name', '_id', '_opt_data', '_data', '_iter_index', '__weakref__')
+
     def __init__(self, *args, **kwargs):
         self._name = "entity"  # object name
         self._id = int(kwargs.get('id', 0))  # object ID
-        self._opt_data = dict()  # custom data dict
-        self._cache = {}  # cache dict
+        self._opt_data = None  # custom data dict (allocated on demand)
         self._data = []  # data storage array
 
     def __cmp__(self, other):
@@ -67,10 +101,24 @@ class AbstractEntity(object):
     def __reversed__(self):
         return reversed(self._data)
 
+    def __getstate__(self):
+        state = dict()
+        for k in _entity_slots(self.__class__):
+            try:
+                state[k] = getattr(self, k)
+            except AttributeError:
+                pass
+        state.update(getattr(self, '__dict__', {}))
+        return state
+
+    def __setstate__(self, state):
+        for k, v in state.items():
+            setattr(self, k, v)
+
     def __copy__(self):
         cls = self.__class__
         result = cls.__new__(cls)
-        result.__dict__.update(self.__dict__)
+        result.__setstate__(self.__getstate__())
         return result
 
     def __deepcopy__(self, memo):
@@ -78,10 +126,8 @@ class AbstractEntity(object):
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
-        # Don't copy the cache
-        memo[id(self._cache)] = self._cache.__new__(dict)
-        # Copy all other attributes
-        for k, v in self.__dict__.items():
+        # Copy all attributes
+        for k, v in self.__getstate__().items():
             setattr(result, k, copy.deepcopy(v, memo))
         return result
 
@@ -159,6 +205,8 @@ class AbstractEntity(object):
         :setter: Adds key and value pair to the dict
         :deleter: Deletes the contents of the dict
         """
+        if self._opt_data is None:
+            self._opt_data = dict()
         return self._opt_data
 
     @opt.setter
@@ -171,13 +219,16 @@ class AbstractEntity(object):
             raise GeomdlException("key must be string")
 
         if key_value[1] is None:
-            self._opt_data.pop(*key_value)
+            if self._opt_data is not None:
+                self._opt_data.pop(*key_value)
         else:
+            if self._opt_data is None:
+                self._opt_data = dict()
             self._opt_data[key_value[0]] = key_value[1]
 
     @opt.deleter
     def opt(self):
-        self._opt_data = dict()
+        self._opt_data = None
 
     def opt_get(self, value):
         """ Safely query for the value from the :py:attr:`opt` property.
@@ -188,19 +239,23 @@ class AbstractEntity(object):
         """
         try:
             return self._opt_data[value]
-        except KeyError:
+        except (KeyError, TypeError):
             return None
 
 
 @utl.export
 class Vertex(AbstractEntity):
     """ 3-dimensional Vertex entity with spatial and parametric position. """
+    __slots__ = ('_uv',)
+
     def __init__(self, *args, **kwargs):
         super(Vertex, self).__init__(*args, **kwargs)
         self._name = "vertex"
-        self.data = [float(arg) for arg in args] if args else [0.0, 0.0, 0.0]  # spatial coordinates
+        if args:
+            self.data = args  # spatial coordinates
+        else:
+            self._data = [0.0, 0.0, 0.0]
         self._uv = [0.0, 0.0]  # parametric coordinates
-        self._opt_data['inside'] = False  # flag for trimming
 
     def __nonzero__(self):
         # For Python 2 compatibility
@@ -208,35 +263,19 @@ class Vertex(AbstractEntity):
 
     def __bool__(self):
         # For Python 3 compatibility
-        return self.opt_get("inside")
+        return self.inside
 
     def __add__(self, other):
         if not isinstance(other, self.__class__):
             raise GeomdlException("Can only add Vertex objects")
-        res_data = [0.0 for _ in range(3)]
-        for idx in range(3):
-            res_data[idx] = self.data[idx] + other.data[idx]
-        res_uv = [0.0 for _ in range(2)]
-        for idx in range(2):
-            res_uv[idx] = self.uv[idx] + other.uv[idx]
-        res_val = self.__class__()
-        res_val.data = res_data
-        res_val.uv = res_uv
-        return res_val
+        sd, od, su, ou = self._data, other._data, self._uv, other._uv
+        return self._make([sd[0] + od[0], sd[1] + od[1], sd[2] + od[2]], [su[0] + ou[0], su[1] + ou[1]])
 
     def __sub__(self, other):
         if not isinstance(other, self.__class__):
             raise GeomdlException("Can only subtract Vertex objects")
-        res_data = [0.0 for _ in range(3)]
-        for idx in range(3):
-            res_data[idx] = self.data[idx] - other.data[idx]
-        res_uv = [0.0 for _ in range(2)]
-        for idx in range(2):
-            res_uv[idx] = self.uv[idx] - other.uv[idx]
-        res_val = self.__class__()
-        res_val.data = res_data
-        res_val.uv = res_uv
-        return res_val
+        sd, od, su, ou = self._data, other._data, self._uv, other._uv
+        return self._make([sd[0] - od[0], sd[1] - od[1], sd[2] - od[2]], [su[0] - ou[0], su[1] - ou[1]])
 
     def __div__(self, other):
         return self.__truediv__(other)
@@ -244,15 +283,18 @@ class Vertex(AbstractEntity):
     def __truediv__(self, other):
         if not isinstance(other, (float, int)):
             raise GeomdlException("Can only divide by a float or an integer")
-        res_data = [0.0 for _ in range(3)]
-        for idx in range(3):
-            res_data[idx] = self.data[idx] / float(other)
-        res_uv = [0.0 for _ in range(2)]
-        for idx in range(2):
-            res_uv[idx] = self.uv[idx] / float(other)
-        res_val = self.__class__()
-        res_val.data = res_data
-        res_val.uv = res_uv
+        other = float(other)
+        sd, su = self._data, self._uv
+        return self._make([sd[0] / other, sd[1] / other, sd[2] / other], [su[0] / other, su[1] / other])
+
+    def _make(self, data, uv):
+        # Creates a new vertex from the computed components without validating them
+        res_val = self.__class__.__new__(self.__class__)
+        res_val._name = self._name
+        res_val._id = 0
+        res_val._opt_data = None
+        res_val._data = data
+        res_val._uv = uv
         return res_val
 
     @property
@@ -351,11 +393,13 @@ class Vertex(AbstractEntity):
         :setter: Sets the flag
         :type: bool
         """
-        return self.opt_get("inside")
+        return bool(self.opt_get("inside"))
 
     @inside.setter
     def inside(self, value):
-        self.opt = ["inside", bool(value)]
+        # The flag is stored only if it is set or the custom data dict already exists
+        if value or self._opt_data is not None:
+            self.opt = ["inside", bool(value)]
 
     @property
     def data(self):
@@ -383,10 +427,11 @@ class Triangle(AbstractEntity):
     A Triangle entity stores the vertices in its data structure. :attr:`data` returns the vertex IDs and :attr:`vertices`
     return the :class:`Vertex` instances that compose the triangular structure.
     """
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(Triangle, self).__init__(*args, **kwargs)
         self._name = "triangle"
-        self._opt_data['inside'] = False  # flag for trimming
         if args:
             self.add_vertex(*args)
 
@@ -396,7 +441,7 @@ class Triangle(AbstractEntity):
 
     def __bool__(self):
         # For Python 3 compatibility
-        return self.opt_get("inside")
+        return self.inside
 
     @property
     def vertices(self):
@@ -456,11 +501,13 @@ class Triangle(AbstractEntity):
         :setter: Sets the flag
         :type: bool
         """
-        return self.opt_get("inside")
+        return bool(self.opt_get("inside"))
 
     @inside.setter
     def inside(self, value):
-        self.opt = ["inside", bool(value)]
+        # The flag is stored only if it is set or the custom data dict already exists
+        if value or self._opt_data is not None:
+            self.opt = ["inside", bool(value)]
 
     @property
     def data(self):
@@ -502,6 +549,7 @@ class Quad(AbstractEntity):
     A Quad entity stores the vertices in its data structure. :attr:`data` returns the vertex IDs and :attr:`vertices`
     return the :class:`Vertex` instances that compose the quadrilateral structure.
     """
+    __slots__ = ()
 
     def __init__(self, *args, **kwargs):
         super(Quad, self).__init__(*args, **kwargs)
@@ -553,6 +601,8 @@ class Quad(AbstractEntity):
 @utl.export
 class Face(AbstractEntity):
     """ Representation of Face entity which is composed of triangles or quads. """
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(Face, self).__init__(*args, **kwargs)
         self._name = "face"
@@ -588,6 +638,8 @@ class Face(AbstractEntity):
 @utl.export
 class Body(AbstractEntity):
     """ Representation of Body entity which is composed of faces. """
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(Body, self).__init__(*args, **kwargs)
         self._name = "body"
@@ -618,3 +670,378 @@ class Body(AbstractEntity):
             else:
                 raise GeomdlException("Input must be a Face object")
         self._data = res
+
+
+@utl.export
+class Mesh(object):
+    """ Compact representation of a mesh composed of triangles or quads.
+
+    The mesh stores the vertex coordinates, the parametric positions of the vertices, the vertex indices of the faces
+    and the inside-outside (trimming) flags of the vertices in flat typed arrays instead of :class:`Vertex`,
+    :class:`Triangle` and :class:`Quad` objects. The arrays support the buffer protocol, so they can be accessed as
+    NumPy arrays without copying:
+
+    .. code-block:: python
+
+        import numpy as np
+
+        vertices = np.frombuffer(mesh.vertices).reshape(-1, mesh.dimension)
+        faces = np.frombuffer(mesh.faces, dtype=np.dtype(mesh.faces.typecode)).reshape(-1, mesh.face_size)
+
+    :param dimension: spatial dimension of the vertices
+    :type dimension: int
+    :param face_size: number of vertices of a face, 3 for triangles and 4 for quads
+    :type face_size: int
+    """
+    __slots__ = ('_dimension', '_face_size', '_vertices', '_uv', '_faces', '_inside')
+
+    def __init__(self, dimension=3, face_size=3):
+        self._dimension = int(dimension)
+        self._face_size = int(face_size)
+        self._vertices = array('d')
+        self._uv = array('d')
+        self._faces = array('l')
+        self._inside = array('b')
+
+    def __len__(self):
+        return self.num_faces
+
+    @property
+    def dimension(self):
+        """ Spatial dimension of the vertices.
+
+        :getter: Gets the spatial dimension
+        :type: int
+        """
+        return self._dimension
+
+    @property
+    def face_size(self):
+        """ Number of vertices of a face.
+
+        :getter: Gets the number of vertices of a face
+        :type: int
+        """
+        return self._face_size
+
+    @property
+    def num_vertices(self):
+        """ Number of vertices.
+
+        :getter: Gets the number of vertices
+        :type: int
+        """
+        return len(self._inside)
+
+    @property
+    def num_faces(self):
+        """ Number of faces.
+
+        :getter: Gets the number of faces
+        :type: int
+        """
+        return len(self._faces) // self._face_size
+
+    @property
+    def nbytes(self):
+        """ Memory size of the flat arrays in bytes.
+
+        :getter: Gets the memory size
+        :type: int
+        """
+        return sum(len(arr) * arr.itemsize for arr in (self._vertices, self._uv, self._faces, self._inside))
+
+    @property
+    def vertices(self):
+        """ Vertex coordinates as a flat array of (number of vertices * dimension) floats.
+
+        :getter: Gets the vertex coordinates
+        :type: array.array
+        """
+        return self._vertices
+
+    @property
+    def uv(self):
+        """ Parametric positions of the vertices as a flat array of (number of vertices * 2) floats.
+
+        :getter: Gets the parametric positions
+        :type: array.array
+        """
+        return self._uv
+
+    @property
+    def faces(self):
+        """ Vertex indices of the faces as a flat array of (number of faces * face size) integers.
+
+        :getter: Gets the vertex indices
+        :type: array.array
+        """
+        return self._faces
+
+    @property
+    def inside(self):
+        """ Inside-outside (trimming) flags of the vertices.
+
+        :getter: Gets the flags
+        :type: array.array
+        """
+        return self._inside
+
+    def vertex(self, index):
+        """ Returns the coordinates of the vertex.
+
+        :param index: vertex index
+        :type: int
+        :return: vertex coordinates
+        :rtype: list
+        """
+        return self._vertices[(index * self._dimension):((index + 1) * self._dimension)].tolist()
+
+    def vertex_uv(self, index):
+        """ Returns the parametric position of the vertex.
+
+        :param index: vertex index
+        :type: int
+        :return: parametric position
+        :rtype: list
+        """
+        return self._uv[(2 * index):(2 * index + 2)].tolist()
+
+    def face(self, index):
+        """ Returns the vertex indices of the face.
+
+        :param index: face index
+        :type: int
+        :return: vertex indices
+        :rtype: list
+        """
+        return self._faces[(index * self._face_size):((index + 1) * self._face_size)].tolist()
+
+    def add_vertex(self, data, uv=(0.0, 0.0), inside=False):
+        """ Appends a vertex to the mesh.
+
+        :param data: vertex coordinates
+        :type data: list, tuple
+        :param uv: parametric position
+        :type uv: list, tuple
+        :param inside: inside-outside flag
+        :type inside: bool
+        :return: index of the vertex
+        :rtype: int
+        """
+        if len(data) != self._dimension:
+            raise GeomdlException("The vertex must be " + str(self._dimension) + " dimensional")
+        self._vertices.extend(data)
+        self._uv.extend(uv)
+        self._inside.append(1 if inside else 0)
+        return len(self._inside) - 1
+
+    def add_face(self, *args):
+        """ Appends a face to the mesh.
+
+        This method takes the vertex indices of the face as its function arguments.
+
+        :return: index of the face
+        :rtype: int
+        """
+        if len(args) != self._face_size:
+            raise GeomdlException("The face must have " + str(self._face_size) + " vertices")
+        self._faces.extend(args)
+        return self.num_faces - 1
+
+    def clear(self):
+        """ Clears the vertices and the faces. """
+        del self._vertices[:]
+        del self._uv[:]
+        del self._faces[:]
+        del self._inside[:]
+
+
+@utl.export
+class PointGrid(object):
+    """ Compact representation of the points evaluated on a regular grid of parameters.
+
+    The point coordinates are stored in a flat typed array together with the number of points on each parametric
+    direction (i.e. grid size). The instances behave like the list of points, e.g. they can be iterated, indexed,
+    compared with lists and concatenated with lists, and the points are returned as lists of floats. The instances are
+    not lists, so use :py:meth:`tolist` to pass the points to the functions requiring a list, e.g. ``json.dumps``.
+
+    The lists of the points are generated on the first iteration or indexing and cached, so that the repeated
+    accesses are as fast as the list of points. Modifying a returned point in place, e.g. ``evalpts[i][k] = x``,
+    changes only the cached list and not the coordinate array. Use item assignment, e.g. ``evalpts[i] = pt``, to
+    update both of them.
+
+    The point coordinates support the buffer protocol and NumPy array interface, so they can be accessed as NumPy
+    arrays without copying:
+
+    .. code-block:: python
+
+        import numpy as np
+
+        # (number of points, dimension) array
+        pts = np.asarray(surf.evalpts)
+
+        # (size_u, size_v, dimension) array
+        grid = np.asarray(surf.evalpts).reshape(surf.evalpts.shape)
+
+    The coordinates are stored as float64 values by default. Use ``typecode='f'`` to store them as float32 values,
+    which halves the memory footprint. The float32 coordinates differ from the float64 ones by at most 2^-24 (about
+    6e-8) times the magnitude of the coordinate, e.g. by at most 0.00006 for a coordinate around 1000.
+
+    :param points: list of points or (number of points, dimension) NumPy array
+    :type points: list, tuple, numpy.ndarray
+    :param size: number of points on each parametric direction. *Default: (number of points,)*
+    :type size: list, tuple
+    :param typecode: ``d`` for float64 and ``f`` for float32 coordinates. *Default: d*
+    :type typecode: str
+    """
+    __slots__ = ('_dimension', '_size', '_data', '_rows')
+
+    def __init__(self, points=(), size=None, typecode='d'):
+        if typecode not in ('d', 'f'):
+            raise GeomdlException("Type code must be 'd' (float64) or 'f' (float32)")
+        self._dimension = len(points[0]) if len(points) > 0 else 0
+        self._size = (len(points),) if size is None else tuple(int(sz) for sz in size)
+        if hasattr(points, 'ndim'):
+            # Copy the array memory directly
+            self._data = _arrays.points_buffer(points, typecode)
+        else:
+            self._data = array(typecode, [c for pt in points for c in pt])
+        self._rows = None
+        if len(self._data) != self._dimension * len(points) or self.num_points != len(points):
+            raise GeomdlException("The input points do not match the grid size " + str(self._size))
+
+    def __len__(self):
+        return len(self._data) // self._dimension if self._dimension > 0 else 0
+
+    def __iter__(self):
+        return iter(self._points())
+
+    def __getitem__(self, index):
+        try:
+            return self._points()[index]
+        except IndexError:
+            raise IndexError("Point index is out of range")
+
+    def _points(self):
+        """ Returns the cached list of points, generates it on the first call.
+
+        :return: list of points
+        :rtype: list
+        """
+        if self._rows is None:
+            self._rows = self.tolist()
+        return self._rows
+
+    def __setitem__(self, index, value):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Point index is out of range")
+        if len(value) != self._dimension:
+            raise GeomdlException("The point must be " + str(self._dimension) + " dimensional")
+        start = index * self._dimension
+        self._data[start:(start + self._dimension)] = array(self._data.typecode, value)
+        if self._rows is not None:
+            self._rows[index] = self._data[start:(start + self._dimension)].tolist()
+
+    def __eq__(self, other):
+        try:
+            if len(self) != len(other):
+                return False
+            return all(pt == list(opt) for pt, opt in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    def __ne__(self, other):
+        res = self.__eq__(other)
+        return res if res is NotImplemented else not res
+
+    __hash__ = None
+
+    def __add__(self, other):
+        return self.tolist() + list(other)
+
+    def __radd__(self, other):
+        return list(other) + self.tolist()
+
+    def __repr__(self):
+        return self.__class__.__name__ + "(size=" + str(self._size) + ", dimension=" + str(self._dimension) + ")"
+
+    def __copy__(self):
+        result = self.__class__.__new__(self.__class__)
+        result._dimension = self._dimension
+        result._size = self._size
+        result._data = array(self._data.typecode, self._data)
+        result._rows = None
+        return result
+
+    def __deepcopy__(self, memo):
+        return self.__copy__()
+
+    def __reduce__(self):
+        return self.__class__, (self.tolist(), self._size, self._data.typecode)
+
+    def __array__(self, dtype=None, copy=None):
+        pts = _arrays.points_view(self._data, self._dimension)
+        if dtype is not None and pts.dtype != dtype:
+            return pts.astype(dtype)
+        return pts.copy() if copy else pts
+
+    @property
+    def dimension(self):
+        """ Spatial dimension of the points.
+
+        :getter: Gets the spatial dimension
+        :type: int
+        """
+        return self._dimension
+
+    @property
+    def size(self):
+        """ Number of points on each parametric direction.
+
+        :getter: Gets the grid size
+        :type: tuple
+        """
+        return self._size
+
+    @property
+    def shape(self):
+        """ Shape of the grid of points, i.e. grid size followed by the spatial dimension.
+
+        :getter: Gets the grid shape
+        :type: tuple
+        """
+        return self._size + (self._dimension,)
+
+    @property
+    def num_points(self):
+        """ Number of points.
+
+        :getter: Gets the number of points
+        :type: int
+        """
+        num = 1
+        for sz in self._size:
+            num *= sz
+        return num
+
+    @property
+    def data(self):
+        """ Point coordinates as a flat array of (number of points * dimension) float64 or float32 values.
+
+        :getter: Gets the point coordinates
+        :type: array.array
+        """
+        return self._data
+
+    def tolist(self):
+        """ Returns the points as a new list of lists.
+
+        :return: list of points
+        :rtype: list
+        """
+        coords = self._data.tolist()
+        dim = self._dimension
+        return [coords[idx:(idx + dim)] for idx in range(0, len(coords), dim)]
@@ -7,10 +7,17 @@
 
 """
 
-import copy
 import abc
+import copy
+from bisect import bisect_right
 from . import linalg, helpers
+from .exceptions import GeomdlException
+from ._cache import LRUCache, CACHE_SIZE, CACHE_MEMORY
 from ._utilities import add_metaclass, export
+try:
+    from . import _evaluators as vec
+except ImportError:
+    vec = None
 
 
 @add_metaclass(abc.ABCMeta)
@@ -22,13 +29,37 @@ class AbstractEvaluator(object):
     * ``evaluate`` is used for computation of the complete spline shape
     * ``derivative_single`` is used for computation of derivatives at a single parametric coordinate
 
+    ``evaluate_list`` and ``derivatives_list`` methods compute the points and the derivatives at a list of parameters.
+    Their default implementations call ``evaluate`` and ``derivatives`` for each parameter.
+
     Please note that this class requires the keyword argument ``find_span_func`` to be set to a valid find_span
     function implementation. Please see :py:mod:`helpers` module for details.
+
+    The knot spans and the basis functions computed for a sample grid are stored in a least recently used cache
+    keyed by the degree, the knot vector, the start and stop parameters and the sample size. Therefore, re-evaluating
+    the geometry after changing only the control points skips these computations. The copies of an evaluator share
+    the same cache. The cache statistics can be retrieved via :py:meth:`cache_info` method.
+
+    **Keyword Arguments:**
+
+    * ``cache_size``: maximum number of cached sample grids. *Default: 128*
+    * ``cache_memory``: memory budget of the cache in bytes (estimated). *Default: 64 MB*
     """
 
     def __init__(self, **kwargs):
         self._name = kwargs.get('name', self.__class__.__name__)
         self._span_func = kwargs.get('find_span_func', None)
+        self._cache = LRUCache(kwargs.get('cache_size', CACHE_SIZE), kwargs.get('cache_memory', CACHE_MEMORY))
+
+    def __deepcopy__(self, memo):
+        # The cache is keyed by the input data, so it can be shared with the copies
+        cls = self.__class__
+        result = cls.__new__(cls)
+        memo[id(self)] = result
+        memo[id(self._cache)] = self._cache
+        for k, v in self.__dict__.items():
+            setattr(result, k, copy.deepcopy(v, memo))
+        return result
 
     @property
     def name(self):
@@ -39,6 +70,57 @@ class AbstractEvaluator(object):
         """
         return self._name
 
+    def cache_info(self):
+        """ Returns the statistics of the basis function cache.
+
+        The output is a named tuple containing ``hits``, ``misses``, ``maxsize``, ``currsize``, ``memsize`` and
+        ``maxmemsize`` fields. The memory sizes are in bytes.
+
+        :return: cache statistics
+        :rtype: tuple
+        """
+        return self._cache.info()
+
+    def cache_clear(self):
+        """ Clears the basis function cache and its statistics. """
+        self._cache.clear()
+
+    def basis(self, degree, knotvector, num_ctrlpts, start, stop, sample_size, precision=18):
+        """ Returns the knot spans and the basis functions for a uniformly sampled parametric direction.
+
+        The results are cached and the same data is returned while the inputs stay unchanged. Single parameter
+        requests, i.e. equal start and stop parameters, are not cached.
+
+        :param degree: degree
+        :type degree: int
+        :param knotvector: knot vector
+        :type knotvector: list, tuple
+        :param num_ctrlpts: number of control points
+        :type num_ctrlpts: int
+        :param start: start parameter
+        :type start: float
+        :param stop: stop parameter
+        :type stop: float
+        :param sample_size: number of samples
+        :type sample_size: int
+        :param precision: number of decimal places used for generating the parameters
+        :type precision: int
+        :return: data required by the evaluator, knot spans and basis functions by default
+        :rtype: tuple
+        """
+        # Single parameter evaluations would only pollute the cache
+        if abs(float(start) - float(stop)) <= 10e-8:
+            return self._compute_basis(degree, knotvector, num_ctrlpts, start, stop, sample_size, precision)
+        key = (degree, tuple(knotvector), num_ctrlpts, start, stop, sample_size, precision)
+        return self._cache.get(key, self._compute_basis, degree, knotvector, num_ctrlpts, start, stop, sample_size,
+                               precision)
+
+    def _compute_basis(self, degree, knotvector, num_ctrlpts, start, stop, sample_size, precision):
+        knots = linalg.linspace(start, stop, sample_size, decimals=precision)
+        spans = helpers.find_spans(degree, knotvector, num_ctrlpts, knots, self._span_func)
+        basis = helpers.basis_functions(degree, knotvector, spans, knots)
+        return spans, basis
+
     @abc.abstractmethod
     def evaluate(self, **kwargs):
         """ Abstract method for computation of points over a range of parameters.
@@ -59,6 +141,45 @@ class AbstractEvaluator(object):
         """
         pass
 
+    def evaluate_list(self, **kwargs):
+        """ Computes the points at the input list of parameters.
+
+        The default implementation calls ``evaluate`` once for each parameter. The subclasses are expected to override
+        this method to share the span and the basis function computations across the parameters.
+
+        :return: evaluated points in the order of the input parameters
+        :rtype: list
+        """
+        params = kwargs.pop('parameters')
+        eval_points = []
+        for param in params:
+            kwargs.update(start=param, stop=param)
+            eval_points.append(self.evaluate(**kwargs)[0])
+        return eval_points
+
+    def derivatives_list(self, **kwargs):
+        """ Computes the derivatives at the input list of parameters.
+
+        The default implementation calls ``derivatives`` once for each parameter. The subclasses are expected to
+        override this method to share the span and the basis function computations across the parameters.
+
+        :return: derivatives in the order of the input parameters
+        :rtype: list
+        """
+        params = kwargs.pop('parameters')
+        return [self.derivatives(parameter=param, **kwargs) for param in params]
+
+    @staticmethod
+    def rational_points(ptsw):
+        """ Projects the weighted points to the Cartesian space by dividing with the weights.
+
+        :param ptsw: weighted points, the weights are stored in the last coordinate
+        :type ptsw: list
+        :return: unweighted points
+        :rtype: list
+        """
+        return [[c / pt[-1] for c in pt[:-1]] for pt in ptsw]
+
 
 @export
 class CurveEvaluator(AbstractEvaluator):
@@ -70,13 +191,13 @@ class CurveEvaluator(AbstractEvaluator):
     * Algorithm A3.2: CurveDerivsAlg1
 
     Please note that knot vector span finding function may be changed by setting ``find_span_func`` keyword argument
-    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_linear`.
+    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_binsearch`.
     Please see :doc:`Helpers Module Documentation <module_utilities>` for more details.
     """
 
     def __init__(self, **kwargs):
         super(CurveEvaluator, self).__init__(**kwargs)
-        self._span_func = kwargs.get('find_span_func', helpers.find_span_linear)
+        self._span_func = kwargs.get('find_span_func', helpers.find_span_binsearch)
 
     def evaluate(self, **kwargs):
         """ Evaluates the curve. """
@@ -93,12 +214,26 @@ class CurveEvaluator(AbstractEvaluator):
         precision = kwargs.get('precision')
 
         # Algorithm A3.1
-        knots = linalg.linspace(start, stop, sample_size, decimals=precision)
+        spans, basis = self.basis(degree, knotvector, len(ctrlpts), start, stop, sample_size, precision)
+        return self._curve_points(degree, spans, basis, ctrlpts, dimension)
+
+    def evaluate_list(self, **kwargs):
+        """ Evaluates the curve at the input list of parameters. """
+        knots = kwargs.get('parameters')
+        degree = kwargs.get('degree')
+        knotvector = kwargs.get('knotvector')
+        ctrlpts = kwargs.get('ctrlpts')
+        dimension = kwargs.get('dimension')
+
+        # Algorithm A3.1
         spans = helpers.find_spans(degree, knotvector, len(ctrlpts), knots, self._span_func)
         basis = helpers.basis_functions(degree, knotvector, spans, knots)
+        return self._curve_points(degree, spans, basis, ctrlpts, dimension)
 
+    @staticmethod
+    def _curve_points(degree, spans, basis, ctrlpts, dimension):
         eval_points = []
-        for idx in range(len(knots)):
+        for idx in range(len(spans)):
             crvpt = [0.0 for _ in range(dimension)]
             for i in range(0, degree + 1):
                 crvpt[:] = [crv_p + (basis[idx][i] * ctl_p) for crv_p, ctl_p in
@@ -136,6 +271,33 @@ class CurveEvaluator(AbstractEvaluator):
         # Return the derivatives
         return CK
 
+    def derivatives_list(self, **kwargs):
+        """ Evaluates the derivatives at the input list of parameters. """
+        params = kwargs.get('parameters')
+        deriv_order = kwargs.get('deriv_order', 0)
+        degree = kwargs.get('degree')
+        knotvector = kwargs.get('knotvector')
+        ctrlpts = kwargs.get('ctrlpts')
+        dimension = kwargs.get('dimension')
+
+        # Algorithm A3.2
+        du = min(degree, deriv_order)
+
+        spans = helpers.find_spans(degree, knotvector, len(ctrlpts), params, self._span_func)
+        bfunsders = helpers.basis_functions_ders(degree, knotvector, spans, params, du)
+
+        eval_ders = []
+        for idx in range(len(params)):
+            CK = [[0.0 for _ in range(dimension)] for _ in range(deriv_order + 1)]
+            for k in range(0, du + 1):
+                for j in range(0, degree + 1):
+                    CK[k][:] = [drv + (bfunsders[idx][k][j] * ctl_pt) for drv, ctl_pt in
+                                zip(CK[k], ctrlpts[spans[idx] - degree + j])]
+            eval_ders.append(CK)
+
+        # Return the derivatives
+        return eval_ders
+
 
 class CurveEvaluator2(CurveEvaluator):
     """ Sequential curve evaluation algorithms (alternative).
@@ -146,13 +308,13 @@ class CurveEvaluator2(CurveEvaluator):
     * Algorithm A3.4: CurveDerivsAlg2
 
     Please note that knot vector span finding function may be changed by setting ``find_span_func`` keyword argument
-    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_linear`.
+    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_binsearch`.
     Please see :doc:`Helpers Module Documentation <module_utilities>` for more details.
     """
 
     def __init__(self, **kwargs):
         super(CurveEvaluator2, self).__init__(**kwargs)
-        self._span_func = kwargs.get('find_span_func', helpers.find_span_linear)
+        self._span_func = kwargs.get('find_span_func', helpers.find_span_binsearch)
 
     @staticmethod
     def derivatives_ctrlpts(**kwargs):
@@ -224,6 +386,96 @@ class CurveEvaluator2(CurveEvaluator):
         return CK
 
 
+@export
+class CurveEvaluatorBezierExtraction(CurveEvaluator):
+    """ Curve evaluation algorithms using Bezier extraction.
+
+    This evaluator implements the following algorithms from **The NURBS Book**:
+
+    * Algorithm A5.6: DecomposeCurve
+    * Horner's method for the power basis form of the Bezier segments
+
+    The curve is decomposed into Bezier segments once and the power basis coefficients of the segments are cached.
+    Then, the evaluation of a point reduces to finding the segment and running Horner's method. The cache is keyed
+    by the degree, the identities of the knot vector and the control points and the ``ctrlpts_version`` keyword
+    argument, which is the number of the in-place control point updates passed by the geometry. Therefore, the cache
+    lookup does not depend on the number of the control points and any change on the curve invalidates the cached
+    coefficients. Without ``ctrlpts_version``, the cache is keyed by the values of the knot vector and the control
+    points. This evaluator is suitable for the curves which are evaluated repeatedly. The derivatives are computed via
+    :py:class:`.CurveEvaluator`.
+    """
+
+    def __init__(self, **kwargs):
+        super(CurveEvaluatorBezierExtraction, self).__init__(**kwargs)
+
+    def evaluate(self, **kwargs):
+        """ Evaluates the curve. """
+        start = kwargs.get('start')
+        stop = kwargs.get('stop')
+        sample_size = kwargs.get('sample_size')
+        precision = kwargs.get('precision')
+
+        knots = linalg.linspace(start, stop, sample_size, decimals=precision)
+        return self.evaluate_list(parameters=knots, **kwargs)
+
+    def evaluate_list(self, **kwargs):
+        """ Evaluates the curve at the input list of parameters. """
+        knots = kwargs.get('parameters')
+        degree = kwargs.get('degree')
+        knotvector = kwargs.get('knotvector')
+        ctrlpts = kwargs.get('ctrlpts')
+        version = kwargs.get('ctrlpts_version', None)
+
+        breakpoints, coeffs = self.coefficients(degree, knotvector, ctrlpts, version)
+
+        eval_points = []
+        for knot in knots:
+            idx, t = self._locate(breakpoints, knot)
+            eval_points.append(self._horner(coeffs[idx], t))
+        return eval_points
+
+    def coefficients(self, degree, knotvector, ctrlpts, version=None):
+        """ Returns the breakpoints and the power basis coefficients of the Bezier segments from the cache.
+
+        :param degree: degree
+        :type degree: int
+        :param knotvector: knot vector
+        :type knotvector: list, tuple
+        :param ctrlpts: control points
+        :type ctrlpts: list, tuple
+        :param version: number of the in-place updates on the control points, None to key the cache by the values
+        :type version: int
+        :return: breakpoints and the power basis coefficients of the segments
+        :rtype: tuple
+        """
+        if version is None:
+            key = (degree, tuple(knotvector), tuple(tuple(pt) for pt in ctrlpts))
+        else:
+            key = (degree, id(knotvector), id(ctrlpts), version)
+        return self._cache.get(key, self._compute_coefficients, degree, knotvector, ctrlpts)[:2]
+
+    @staticmethod
+    def _compute_coefficients(degree, knotvector, ctrlpts):
+        breakpoints, segments = helpers.bezier_decomposition(degree, knotvector, ctrlpts)
+        coeffs = [helpers.power_basis_coefficients(degree, seg) for seg in segments]
+        # Keep the inputs alive while they are cached, so that their identities are not reused
+        return breakpoints, coeffs, knotvector, ctrlpts
+
+    @staticmethod
+    def _locate(breakpoints, knot):
+        # Find the Bezier segment and the local parameter on the segment
+        idx = max(bisect_right(breakpoints, knot, 0, len(breakpoints) - 1) - 1, 0)
+        start = breakpoints[idx]
+        return idx, (knot - start) / (breakpoints[idx + 1] - start)
+
+    @staticmethod
+    def _horner(coeffs, t):
+        pt = list(coeffs[-1])
+        for coeff in coeffs[-2::-1]:
+            pt[:] = [c * t + a for c, a in zip(pt, coeff)]
+        return pt
+
+
 @export
 class CurveEvaluatorRational(CurveEvaluator):
     """ Sequential rational curve evaluation algorithms.
@@ -234,28 +486,29 @@ class CurveEvaluatorRational(CurveEvaluator):
     * Algorithm A4.2: RatCurveDerivs
 
     Please note that knot vector span finding function may be changed by setting ``find_span_func`` keyword argument
-    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_linear`.
+    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_binsearch`.
     Please see :doc:`Helpers Module Documentation <module_utilities>` for more details.
     """
 
     def __init__(self, **kwargs):
         super(CurveEvaluatorRational, self).__init__(**kwargs)
-        self._span_func = kwargs.get('find_span_func', helpers.find_span_linear)
+        self._span_func = kwargs.get('find_span_func', helpers.find_span_binsearch)
 
     def evaluate(self, **kwargs):
         """ Evaluates the rational curve. """
-        dimension = kwargs.get('dimension')
-
         # Algorithm A4.1
         crvptw = super(CurveEvaluatorRational, self).evaluate(**kwargs)
 
         # Divide by weight
-        eval_points = []
-        for pt in crvptw:
-            cpt = [float(c / pt[-1]) for c in pt[0:(dimension - 1)]]
-            eval_points.append(cpt)
+        return self.rational_points(crvptw)
 
-        return eval_points
+    def evaluate_list(self, **kwargs):
+        """ Evaluates the rational curve at the input list of parameters. """
+        # Algorithm A4.1
+        crvptw = super(CurveEvaluatorRational, self).evaluate_list(**kwargs)
+
+        # Divide by weight
+        return self.rational_points(crvptw)
 
     def derivatives(self, **kwargs):
         """ Evaluates the derivatives at the input parameter. """
@@ -265,19 +518,187 @@ class CurveEvaluatorRational(CurveEvaluator):
         # Call the parent function to evaluate A(u) and w(u) derivatives
         CKw = super(CurveEvaluatorRational, self).derivatives(**kwargs)
 
+        # Return C(u) derivatives
+        return self.derivatives_rational(CKw, deriv_order, dimension)
+
+    def derivatives_list(self, **kwargs):
+        """ Evaluates the derivatives at the input list of parameters. """
+        deriv_order = kwargs.get('deriv_order')
+        dimension = kwargs.get('dimension')
+
+        # Call the parent function to evaluate A(u) and w(u) derivatives
+        CKw_list = super(CurveEvaluatorRational, self).derivatives_list(**kwargs)
+
+        # Return C(u) derivatives
+        return [self.derivatives_rational(CKw, deriv_order, dimension) for CKw in CKw_list]
+
+    @staticmethod
+    def derivatives_rational(CKw, deriv_order, dimension):
+        """ Computes the rational curve derivatives from the derivatives of the weighted curve.
+
+        Implementation of Algorithm A4.2 from The NURBS Book by Piegl & Tiller.
+        """
+        # Binomial coefficients are generated once for the derivative order
+        bc = linalg.binomial_coefficients(deriv_order)
+
         # Algorithm A4.2
         CK = [[0.0 for _ in range(dimension - 1)] for _ in range(deriv_order + 1)]
         for k in range(0, deriv_order + 1):
-            v = [val for val in CKw[k][0:(dimension - 1)]]
+            v = CKw[k][0:(dimension - 1)]
             for i in range(1, k + 1):
-                v[:] = [tmp - (linalg.binomial_coefficient(k, i) * CKw[i][-1] * drv) for tmp, drv in
-                        zip(v, CK[k - i])]
+                coeff = bc[k][i] * CKw[i][-1]
+                v = [tmp - (coeff * drv) for tmp, drv in zip(v, CK[k - i])]
             CK[k][:] = [tmp / CKw[0][-1] for tmp in v]
 
         # Return C(u) derivatives
         return CK
 
 
+@export
+class CurveEvaluatorVectorized(CurveEvaluator):
+    """ Vectorized curve evaluation algorithms.
+
+    This evaluator implements the following algorithms from **The NURBS Book** using NumPy array operations:
+
+    * Algorithm A3.1: CurvePoint
+
+    The knot spans, the basis functions and the weighted sums of the control points are computed for all sample points
+    at once. The derivatives are computed via :py:class:`.CurveEvaluator`.
+
+    .. note::
+
+        Requires `NumPy <https://pypi.org/project/numpy/>`_ package.
+    """
+
+    def __init__(self, **kwargs):
+        # Check if it is possible to import 'numpy'
+        if vec is None:
+            raise GeomdlException("Please install 'numpy' package to use vectorized evaluators: pip install numpy")
+        super(CurveEvaluatorVectorized, self).__init__(**kwargs)
+
+    def evaluate(self, **kwargs):
+        """ Evaluates the curve. """
+        start = kwargs.get('start')
+        stop = kwargs.get('stop')
+        sample_size = kwargs.get('sample_size')
+        degree = kwargs.get('degree')
+        knotvector = kwargs.get('knotvector')
+        ctrlpts = kwargs.get('ctrlpts')
+
+        # Algorithm A3.1 (vectorized)
+        spans, basis = self.basis(degree, knotvector, len(ctrlpts), start, stop, sample_size)
+        return vec.curve_points(degree, spans, basis, ctrlpts).tolist()
+
+    def evaluate_list(self, **kwargs):
+        """ Evaluates the curve at the input list of parameters. """
+        knots = kwargs.get('parameters')
+        degree = kwargs.get('degree')
+        knotvector = kwargs.get('knotvector')
+        ctrlpts = kwargs.get('ctrlpts')
+
+        # Algorithm A3.1 (vectorized)
+        spans = vec.find_spans(degree, knotvector, len(ctrlpts), knots)
+        basis = vec.basis_functions(degree, knotvector, spans, knots)
+
+        return vec.curve_points(degree, spans, basis, ctrlpts).tolist()
+
+    def derivatives_list(self, **kwargs):
+        """ Evaluates the derivatives at the input list of parameters. """
+        params = kwargs.get('parameters')
+        deriv_order = kwargs.get('deriv_order', 0)
+        degree = kwargs.get('degree')
+        knotvector = kwargs.get('knotvector')
+        ctrlpts = kwargs.get('ctrlpts')
+
+        # Algorithm A3.2 (vectorized)
+        du = min(degree, deriv_order)
+        spans = vec.find_spans(degree, knotvector, len(ctrlpts), params)
+        bfunsders = vec.basis_functions_ders(degree, knotvector, spans, params, du)
+
+        return vec.curve_derivatives(degree, spans, bfunsders, ctrlpts, deriv_order).tolist()
+
+    def _compute_basis(self, degree, knotvector, num_ctrlpts, start, stop, sample_size, precision):
+        knots = vec.linspace(start, stop, sample_size)
+        spans = vec.find_spans(degree, knotvector, num_ctrlpts, knots)
+        basis = vec.basis_functions(degree, knotvector, spans, knots)
+        return spans, basis
+
+
+@export
+class CurveEvaluatorRationalVectorized(CurveEvaluatorVectorized):
+    """ Vectorized rational curve evaluation algorithms.
+
+    This evaluator implements the following algorithms from **The NURBS Book** using NumPy array operations:
+
+    * Algorithm A4.1: CurvePoint
+    * Algorithm A4.2: RatCurveDerivs
+
+    The weighted curve points and derivatives are computed by :py:class:`.CurveEvaluatorVectorized`. The division by
+    the weights and the recurrence of Algorithm A4.2 are applied to the complete arrays using a binomial coefficient
+    table generated once for the derivative order.
+
+    .. note::
+
+        Requires `NumPy <https://pypi.org/project/numpy/>`_ package.
+    """
+
+    def __init__(self, **kwargs):
+        super(CurveEvaluatorRationalVectorized, self).__init__(**kwargs)
+
+    def evaluate(self, **kwargs):
+        """ Evaluates the rational curve. """
+        start = kwargs.get('start')
+        stop = kwargs.get('stop')
+        sample_size = kwargs.get('sample_size')
+        degree = kwargs.get('degree')
+        knotvector = kwargs.get('knotvector')
+        ctrlpts = kwargs.get('ctrlpts')
+
+        # Algorithm A4.1 (vectorized)
+        spans, basis = self.basis(degree, knotvector, len(ctrlpts), start, stop, sample_size)
+        crvptw = vec.curve_points(degree, spans, basis, ctrlpts)
+
+        # Divide by weight
+        return vec.rational_points(crvptw).tolist()
+
+    def evaluate_list(self, **kwargs):
+        """ Evaluates the rational curve at the input list of parameters. """
+        knots = kwargs.get('parameters')
+        degree = kwargs.get('degree')
+        knotvector = kwargs.get('knotvector')
+        ctrlpts = kwargs.get('ctrlpts')
+
+        # Algorithm A4.1 (vectorized)
+        spans = vec.find_spans(degree, knotvector, len(ctrlpts), knots)
+        basis = vec.basis_functions(degree, knotvector, spans, knots)
+        crvptw = vec.curve_points(degree, spans, basis, ctrlpts)
+
+        # Divide by weight
+        return vec.rational_points(crvptw).tolist()
+
+    def derivatives(self, **kwargs):
+        """ Evaluates the derivatives at the input parameter. """
+        parameter = kwargs.pop('parameter')
+        return self.derivatives_list(parameters=[parameter], **kwargs)[0]
+
+    def derivatives_list(self, **kwargs):
+        """ Evaluates the derivatives at the input list of parameters. """
+        params = kwargs.get('parameters')
+        deriv_order = kwargs.get('deriv_order', 0)
+        degree = kwargs.get('degree')
+        knotvector = kwargs.get('knotvector')
+        ctrlpts = kwargs.get('ctrlpts')
+
+        # Algorithm A3.2 (vectorized)
+        du = min(degree, deriv_order)
+        spans = vec.find_spans(degree, knotvector, len(ctrlpts), params)
+        bfunsders = vec.basis_functions_ders(degree, knotvector, spans, params, du)
+        CKw = vec.curve_derivatives(degree, spans, bfunsders, ctrlpts, deriv_order)
+
+        # Algorithm A4.2 (vectorized)
+        return vec.rational_curve_derivatives(CKw, deriv_order).tolist()
+
+
 @export
 class SurfaceEvaluator(AbstractEvaluator):
     """ Sequential surface evaluation algorithms.
@@ -288,13 +709,13 @@ class SurfaceEvaluator(AbstractEvaluator):
     * Algorithm A3.6: SurfaceDerivsAlg1
 
     Please note that knot vector span finding function may be changed by setting ``find_span_func`` keyword argument
-    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_linear`.
+    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_binsearch`.
     Please see :doc:`Helpers Module Documentation <module_utilities>` for more details.
     """
 
     def __init__(self, **kwargs):
         super(SurfaceEvaluator, self).__init__(**kwargs)
-        self._span_func = kwargs.get('find_span_func', helpers.find_span_linear)
+        self._span_func = kwargs.get('find_span_func', helpers.find_span_binsearch)
 
     def evaluate(self, **kwargs):
         """ Evaluates the surface. """
@@ -315,9 +736,8 @@ class SurfaceEvaluator(AbstractEvaluator):
         spans = [[] for _ in range(len(degree))]
         basis = [[] for _ in range(len(degree))]
         for idx in range(len(degree)):
-            knots = linalg.linspace(start[idx], stop[idx], sample_size[idx], decimals=precision)
-            spans[idx] = helpers.find_spans(degree[idx], knotvector[idx], ctrlpts_size[idx], knots, self._span_func)
-            basis[idx] = helpers.basis_functions(degree[idx], knotvector[idx], spans[idx], knots)
+            spans[idx], basis[idx] = self.basis(degree[idx], knotvector[idx], ctrlpts_size[idx],
+                                                start[idx], stop[idx], sample_size[idx], precision)
 
         eval_points = []
         for i in range(len(spans[0])):
@@ -336,6 +756,39 @@ class SurfaceEvaluator(AbstractEvaluator):
 
         return eval_points
 
+    def evaluate_list(self, **kwargs):
+        """ Evaluates the surface at the input list of (u, v) parameters. """
+        params = kwargs.get('parameters')
+        degree = kwargs.get('degree')
+        knotvector = kwargs.get('knotvector')
+        ctrlpts = kwargs.get('ctrlpts')
+        ctrlpts_size = kwargs.get('ctrlpts_size')
+        dimension = kwargs.get('dimension')
+
+        # Algorithm A3.5
+        spans = [[] for _ in range(len(degree))]
+        basis = [[] for _ in range(len(degree))]
+        for idx in range(len(degree)):
+            knots = [prm[idx] for prm in params]
+            spans[idx] = helpers.find_spans(degree[idx], knotvector[idx], ctrlpts_size[idx], knots, self._span_func)
+            basis[idx] = helpers.basis_functions(degree[idx], knotvector[idx], spans[idx], knots)
+
+        eval_points = []
+        for i in range(len(params)):
+            idx_u = spans[0][i] - degree[0]
+            idx_v = spans[1][i] - degree[1]
+            spt = [0.0 for _ in range(dimension)]
+            for k in range(0, degree[0] + 1):
+                temp = [0.0 for _ in range(dimension)]
+                for l in range(0, degree[1] + 1):
+                    temp[:] = [tmp + (basis[1][i][l] * cp) for tmp, cp in
+                               zip(temp, ctrlpts[idx_v + l + (ctrlpts_size[1] * (idx_u + k))])]
+                spt[:] = [pt + (basis[0][i][k] * tmp) for pt, tmp in zip(spt, temp)]
+
+            eval_points.append(spt)
+
+        return eval_points
+
     def derivatives(self, **kwargs):
         """ Evaluates the derivatives at the input parameter. """
         # Call parent method
@@ -377,6 +830,127 @@ class SurfaceEvaluator(AbstractEvaluator):
 
         return SKL
 
+    def derivatives_list(self, **kwargs):
+        """ Evaluates the derivatives at the input list of (u, v) parameters. """
+        deriv_order = kwargs.get('deriv_order')
+        params = kwargs.get('parameters')
+        degree = kwargs.get('degree')
+        knotvector = kwargs.get('knotvector')
+        ctrlpts = kwargs.get('ctrlpts')
+        ctrlpts_size = kwargs.get('ctrlpts_size')
+        dimension = kwargs.get('dimension')
+
+        # Algorithm A3.6
+        d = (min(degree[0], deriv_order), min(degree[1], deriv_order))
+
+        spans = [[] for _ in range(len(degree))]
+        basisdrv = [[] for _ in range(len(degree))]
+        for idx in range(len(degree)):
+            knots = [prm[idx] for prm in params]
+            spans[idx] = helpers.find_spans(degree[idx], knotvector[idx], ctrlpts_size[idx], knots, self._span_func)
+            basisdrv[idx] = helpers.basis_functions_ders(degree[idx], knotvector[idx], spans[idx], knots, d[idx])
+
+        eval_ders = []
+        for idx in range(len(params)):
+            SKL = [[[0.0 for _ in range(dimension)] for _ in range(deriv_order + 1)] for _ in range(deriv_order + 1)]
+            for k in range(0, d[0] + 1):
+                temp = [[0.0 for _ in range(dimension)] for _ in range(degree[1] + 1)]
+                for s in range(0, degree[1] + 1):
+                    for r in range(0, degree[0] + 1):
+                        cu = spans[0][idx] - degree[0] + r
+                        cv = spans[1][idx] - degree[1] + s
+                        temp[s][:] = [tmp + (basisdrv[0][idx][k][r] * cp) for tmp, cp in
+                                      zip(temp[s], ctrlpts[cv + (ctrlpts_size[1] * cu)])]
+
+                dd = min(deriv_order, d[1])
+                for l in range(0, dd + 1):
+                    for s in range(0, degree[1] + 1):
+                        SKL[k][l][:] = [elem + (basisdrv[1][idx][l][s] * tmp) for elem, tmp in
+                                        zip(SKL[k][l], temp[s])]
+            eval_ders.append(SKL)
+
+        return eval_ders
+
+
+@export
+class SurfaceEvaluatorVectorized(SurfaceEvaluator):
+    """ Vectorized surface evaluation algorithms.
+
+    This evaluator implements the following algorithms from **The NURBS Book** using NumPy array operations:
+
+    * Algorithm A3.5: SurfacePoint
+
+    The basis function matrices :math:`N_u` (samples on u x control points on u) and :math:`N_v` (samples on v x
+    control points on v) are generated once and cached, then the surface points are computed as
+    :math:`N_u \\cdot P \\cdot N_v^T` for each coordinate. The derivatives are computed via
+    :py:class:`.SurfaceEvaluator`. If the ``as_array`` keyword argument is True, :py:meth:`evaluate` returns the
+    points as a NumPy array instead of a list, e.g. for generating the :class:`.elements.PointGrid` without copying
+    the points into lists.
+
+    .. note::
+
+        Requires `NumPy <https://pypi.org/project/numpy/>`_ package.
+    """
+
+    def __init__(self, **kwargs):
+        # Check if it is possible to import 'numpy'
+        if vec is None:
+            raise GeomdlException("Please install 'numpy' package to use vectorized evaluators: pip install numpy")
+        super(SurfaceEvaluatorVectorized, self).__init__(**kwargs)
+
+    def evaluate(self, **kwargs):
+        """ Evaluates the surface. """
+        start = kwargs.get('start')
+        stop = kwargs.get('stop')
+        sample_size = kwargs.get('sample_size')
+        degree = kwargs.get('degree')
+        knotvector = kwargs.get('knotvector')
+        ctrlpts = kwargs.get('ctrlpts')
+        ctrlpts_size = kwargs.get('ctrlpts_size')
+        dimension = kwargs.get('dimension')
+
+        # Algorithm A3.5 (vectorized)
+        basis = [self.basis(degree[idx], knotvector[idx], ctrlpts_size[idx], start[idx], stop[idx], sample_size[idx])
+                 for idx in range(len(degree))]
+        eval_points = vec.surface_points(basis[0], basis[1], ctrlpts, ctrlpts_size).reshape(-1, dimension)
+        return eval_points if kwargs.get('as_array', False) else eval_points.tolist()
+
+    def evaluate_list(self, **kwargs):
+        """ Evaluates the surface at the input list of (u, v) parameters. """
+        params = kwargs.get('parameters')
+        degree = kwargs.get('degree')
+        knotvector = kwargs.get('knotvector')
+        ctrlpts = kwargs.get('ctrlpts')
+        ctrlpts_size = kwargs.get('ctrlpts_size')
+
+        # Algorithm A3.5 (vectorized)
+        return vec.tensor_points(params, degree, knotvector, ctrlpts, ctrlpts_size).tolist()
+
+    def derivatives_list(self, **kwargs):
+        """ Evaluates the derivatives at the input list of (u, v) parameters. """
+        deriv_order = kwargs.get('deriv_order')
+        params = kwargs.get('parameters')
+        degree = kwargs.get('degree')
+        knotvector = kwargs.get('knotvector')
+        ctrlpts = kwargs.get('ctrlpts')
+        ctrlpts_size = kwargs.get('ctrlpts_size')
+
+        # Algorithm A3.6 (vectorized)
+        d = (min(degree[0], deriv_order), min(degree[1], deriv_order))
+
+        spans = [[] for _ in range(len(degree))]
+        basisdrv = [[] for _ in range(len(degree))]
+        for idx in range(len(degree)):
+            knots = [prm[idx] for prm in params]
+            spans[idx] = vec.find_spans(degree[idx], knotvector[idx], ctrlpts_size[idx], knots)
+            basisdrv[idx] = vec.basis_functions_ders(degree[idx], knotvector[idx], spans[idx], knots, d[idx])
+
+        return vec.surface_derivatives(degree, spans, basisdrv, ctrlpts, ctrlpts_size, deriv_order).tolist()
+
+    def _compute_basis(self, degree, knotvector, num_ctrlpts, start, stop, sample_size, precision):
+        knots = vec.linspace(start, stop, sample_size)
+        return vec.basis_matrix(degree, knotvector, num_ctrlpts, knots)
+
 
 class SurfaceEvaluator2(SurfaceEvaluator):
     """ Sequential surface evaluation algorithms.
@@ -388,13 +962,13 @@ class SurfaceEvaluator2(SurfaceEvaluator):
     * Algorithm A3.8: SurfaceDerivsAlg2
 
     Please note that knot vector span finding function may be changed by setting ``find_span_func`` keyword argument
-    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_linear`.
+    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_binsearch`.
     Please see :doc:`Helpers Module Documentation <module_utilities>` for more details.
     """
 
     def __init__(self, **kwargs):
         super(SurfaceEvaluator2, self).__init__(**kwargs)
-        self._span_func = kwargs.get('find_span_func', helpers.find_span_linear)
+        self._span_func = kwargs.get('find_span_func', helpers.find_span_binsearch)
 
     @staticmethod
     def derivatives_ctrlpts(**kwargs):
@@ -501,6 +1075,127 @@ class SurfaceEvaluator2(SurfaceEvaluator):
         return SKL
 
 
+@export
+class SurfaceEvaluatorBezierExtraction(SurfaceEvaluator):
+    """ Surface evaluation algorithms using Bezier extraction.
+
+    This evaluator implements the following algorithms from **The NURBS Book**:
+
+    * Algorithm A5.6: DecomposeCurve (applied on the u- and v-directions)
+    * Horner's method for the power basis form of the Bezier patches
+
+    The surface is decomposed into Bezier patches once and the power basis coefficients of the patches are cached.
+    Then, the evaluation of a point reduces to finding the patch and running Horner's method on both directions. On
+    the regular grid evaluation, the u-direction step is shared by all points on the same u-parameter. Similar to
+    :py:class:`.CurveEvaluatorBezierExtraction`, the cache is keyed by the degrees, the identities of the knot vectors
+    and the control points and the ``ctrlpts_version`` keyword argument, therefore any change on the surface
+    invalidates the cached coefficients. The derivatives are computed via :py:class:`.SurfaceEvaluator`.
+    """
+
+    def __init__(self, **kwargs):
+        super(SurfaceEvaluatorBezierExtraction, self).__init__(**kwargs)
+
+    def evaluate(self, **kwargs):
+        """ Evaluates the surface. """
+        start = kwargs.get('start')
+        stop = kwargs.get('stop')
+        sample_size = kwargs.get('sample_size')
+        degree = kwargs.get('degree')
+        knotvector = kwargs.get('knotvector')
+        ctrlpts = kwargs.get('ctrlpts')
+        ctrlpts_size = kwargs.get('ctrlpts_size')
+        precision = kwargs.get('precision')
+        version = kwargs.get('ctrlpts_version', None)
+
+        breakpoints, coeffs = self.coefficients(degree, knotvector, ctrlpts, ctrlpts_size, version)
+        locate = CurveEvaluatorBezierExtraction._locate
+        horner = CurveEvaluatorBezierExtraction._horner
+
+        knots_u = linalg.linspace(start[0], stop[0], sample_size[0], decimals=precision)
+        knots_v = linalg.linspace(start[1], stop[1], sample_size[1], decimals=precision)
+        loc_v = [locate(breakpoints[1], knot) for knot in knots_v]
+
+        eval_points = []
+        for knot_u in knots_u:
+            idx_u, t = locate(breakpoints[0], knot_u)
+            # Reduce the patches on the u-direction to the curves on the v-direction
+            crv_coeffs = [[horner(row, t) for row in patch] for patch in coeffs[idx_u]]
+            for idx_v, s in loc_v:
+                eval_points.append(horner(crv_coeffs[idx_v], s))
+        return eval_points
+
+    def evaluate_list(self, **kwargs):
+        """ Evaluates the surface at the input list of (u, v) parameters. """
+        params = kwargs.get('parameters')
+        degree = kwargs.get('degree')
+        knotvector = kwargs.get('knotvector')
+        ctrlpts = kwargs.get('ctrlpts')
+        ctrlpts_size = kwargs.get('ctrlpts_size')
+        version = kwargs.get('ctrlpts_version', None)
+
+        breakpoints, coeffs = self.coefficients(degree, knotvector, ctrlpts, ctrlpts_size, version)
+        locate = CurveEvaluatorBezierExtraction._locate
+        horner = CurveEvaluatorBezierExtraction._horner
+
+        eval_points = []
+        for param in params:
+            idx_u, t = locate(breakpoints[0], param[0])
+            idx_v, s = locate(breakpoints[1], param[1])
+            eval_points.append(horner([horner(row, t) for row in coeffs[idx_u][idx_v]], s))
+        return eval_points
+
+    def coefficients(self, degree, knotvector, ctrlpts, ctrlpts_size, version=None):
+        """ Returns the breakpoints and the power basis coefficients of the Bezier patches from the cache.
+
+        The coefficients of a patch are stored in [v-direction][u-direction] order.
+
+        :param degree: degrees on the u- and v-directions
+        :type degree: list, tuple
+        :param knotvector: knot vectors on the u- and v-directions
+        :type knotvector: list, tuple
+        :param ctrlpts: control points (v index varies first)
+        :type ctrlpts: list, tuple
+        :param ctrlpts_size: number of control points on the u- and v-directions
+        :type ctrlpts_size: list, tuple
+        :param version: number of the in-place updates on the control points, None to key the cache by the values
+        :type version: int
+        :return: breakpoints on the u- and v-directions and the power basis coefficients of the patches
+        :rtype: tuple
+        """
+        if version is None:
+            key = (tuple(degree), tuple(tuple(kv) for kv in knotvector), tuple(ctrlpts_size),
+                   tuple(tuple(pt) for pt in ctrlpts))
+        else:
+            key = (tuple(degree), tuple(id(kv) for kv in knotvector), tuple(ctrlpts_size), id(ctrlpts), version)
+        return self._cache.get(key, self._compute_coefficients, degree, knotvector, ctrlpts, ctrlpts_size)[:2]
+
+    @staticmethod
+    def _compute_coefficients(degree, knotvector, ctrlpts, ctrlpts_size):
+        size_u, size_v = ctrlpts_size
+        dim = len(ctrlpts[0])
+
+        # Decompose on the u-direction, the rows of the control points are flattened
+        rows = [[c for v in range(size_v) for c in ctrlpts[v + (size_v * u)]] for u in range(size_u)]
+        breakpoints_u, segments_u = helpers.bezier_decomposition(degree[0], knotvector[0], rows)
+
+        breakpoints_v = []
+        coeffs = []
+        for seg_u in segments_u:
+            # Decompose on the v-direction, the columns of the segment are flattened
+            cols = [[c for row in seg_u for c in row[(v * dim):((v + 1) * dim)]] for v in range(size_v)]
+            breakpoints_v, segments_v = helpers.bezier_decomposition(degree[1], knotvector[1], cols)
+            patches = []
+            for seg_v in segments_v:
+                coeffs_v = helpers.power_basis_coefficients(degree[1], seg_v)
+                flat_u = [[c for cf in coeffs_v for c in cf[(i * dim):((i + 1) * dim)]] for i in range(degree[0] + 1)]
+                coeffs_uv = helpers.power_basis_coefficients(degree[0], flat_u)
+                patches.append([[cf[(l * dim):((l + 1) * dim)] for cf in coeffs_uv] for l in range(degree[1] + 1)])
+            coeffs.append(patches)
+
+        # Keep the inputs alive while they are cached, so that their identities are not reused
+        return (breakpoints_u, breakpoints_v), coeffs, tuple(knotvector), ctrlpts
+
+
 @export
 class SurfaceEvaluatorRational(SurfaceEvaluator):
     """ Sequential rational surface evaluation algorithms.
@@ -511,28 +1206,29 @@ class SurfaceEvaluatorRational(SurfaceEvaluator):
     * Algorithm A4.4: RatSurfaceDerivs
 
     Please note that knot vector span finding function may be changed by setting ``find_span_func`` keyword argument
-    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_linear`.
+    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_binsearch`.
     Please see :doc:`Helpers Module Documentation <module_utilities>` for more details.
     """
 
     def __init__(self, **kwargs):
         super(SurfaceEvaluatorRational, self).__init__(**kwargs)
-        self._span_func = kwargs.get('find_span_func', helpers.find_span_linear)
+        self._span_func = kwargs.get('find_span_func', helpers.find_span_binsearch)
 
     def evaluate(self, **kwargs):
         """ Evaluates the rational surface. """
-        dimension = kwargs.get('dimension')
-
         # Algorithm A4.3
         cptw = super(SurfaceEvaluatorRational, self).evaluate(**kwargs)
 
         # Divide by weight
-        eval_points = []
-        for pt in cptw:
-            cpt = [float(c / pt[-1]) for c in pt[0:(dimension - 1)]]
-            eval_points.append(cpt)
+        return self.rational_points(cptw)
 
-        return eval_points
+    def evaluate_list(self, **kwargs):
+        """ Evaluates the rational surface at the input list of (u, v) parameters. """
+        # Algorithm A4.3
+        cptw = super(SurfaceEvaluatorRational, self).evaluate_list(**kwargs)
+
+        # Divide by weight
+        return self.rational_points(cptw)
 
     def derivatives(self, **kwargs):
         """ Evaluates the derivatives at the input parameter. """
@@ -542,46 +1238,152 @@ class SurfaceEvaluatorRational(SurfaceEvaluator):
         # Call the parent function to evaluate A(u) and w(u) derivatives
         SKLw = super(SurfaceEvaluatorRational, self).derivatives(**kwargs)
 
+        # Return S(u,v) derivatives
+        return self.derivatives_rational(SKLw, deriv_order, dimension)
+
+    def derivatives_list(self, **kwargs):
+        """ Evaluates the derivatives at the input list of (u, v) parameters. """
+        deriv_order = kwargs.get('deriv_order')
+        dimension = kwargs.get('dimension')
+
+        # Call the parent function to evaluate A(u) and w(u) derivatives
+        SKLw_list = super(SurfaceEvaluatorRational, self).derivatives_list(**kwargs)
+
+        # Return S(u,v) derivatives
+        return [self.derivatives_rational(SKLw, deriv_order, dimension) for SKLw in SKLw_list]
+
+    @staticmethod
+    def derivatives_rational(SKLw, deriv_order, dimension):
+        """ Computes the rational surface derivatives from the derivatives of the weighted surface.
+
+        Implementation of Algorithm A4.4 from The NURBS Book by Piegl & Tiller.
+        """
         # Generate an empty list of derivatives
         SKL = [[[0.0 for _ in range(dimension)] for _ in range(deriv_order + 1)] for _ in range(deriv_order + 1)]
 
+        # Binomial coefficients are generated once for the derivative order
+        bc = linalg.binomial_coefficients(deriv_order)
+
         # Algorithm A4.4
         for k in range(0, deriv_order + 1):
             # for l in range(0, deriv_order - k + 1):
             for l in range(0, deriv_order + 1):
-                # Deep copying might seem a little overkill but we also want to avoid same pointer issues too
-                v = copy.deepcopy(SKLw[k][l])
+                v = SKLw[k][l][0:(dimension - 1)]
 
                 for j in range(1, l + 1):
-                    v[:] = [tmp - (linalg.binomial_coefficient(l, j) * SKLw[0][j][-1] * drv) for tmp, drv in
-                            zip(v, SKL[k][l - j])]
+                    coeff = bc[l][j] * SKLw[0][j][-1]
+                    v = [tmp - (coeff * drv) for tmp, drv in zip(v, SKL[k][l - j])]
                 for i in range(1, k + 1):
-                    v[:] = [tmp - (linalg.binomial_coefficient(k, i) * SKLw[i][0][-1] * drv) for tmp, drv in
-                            zip(v, SKL[k - i][l])]
+                    coeff = bc[k][i] * SKLw[i][0][-1]
+                    v = [tmp - (coeff * drv) for tmp, drv in zip(v, SKL[k - i][l])]
                     v2 = [0.0 for _ in range(dimension - 1)]
                     for j in range(1, l + 1):
-                        v2[:] = [tmp + (linalg.binomial_coefficient(l, j) * SKLw[i][j][-1] * drv) for tmp, drv in
-                                 zip(v2, SKL[k - i][l - j])]
-                    v[:] = [tmp - (linalg.binomial_coefficient(k, i) * tmp2) for tmp, tmp2 in zip(v, v2)]
+                        coeff = bc[l][j] * SKLw[i][j][-1]
+                        v2 = [tmp + (coeff * drv) for tmp, drv in zip(v2, SKL[k - i][l - j])]
+                    v = [tmp - (bc[k][i] * tmp2) for tmp, tmp2 in zip(v, v2)]
 
-                SKL[k][l][:] = [tmp / SKLw[0][0][-1] for tmp in v[0:(dimension - 1)]]
+                SKL[k][l][:] = [tmp / SKLw[0][0][-1] for tmp in v]
 
         # Return S(u,v) derivatives
         return SKL
 
 
+@export
+class SurfaceEvaluatorRationalVectorized(SurfaceEvaluatorVectorized):
+    """ Vectorized rational surface evaluation algorithms.
+
+    This evaluator implements the following algorithms from **The NURBS Book** using NumPy array operations:
+
+    * Algorithm A4.3: SurfacePoint
+    * Algorithm A4.4: RatSurfaceDerivs
+
+    The weighted surface points and derivatives are computed by :py:class:`.SurfaceEvaluatorVectorized`. The division
+    by the weights and the recurrence of Algorithm A4.4 are applied to the complete arrays using a binomial coefficient
+    table generated once for the derivative order.
+
+    .. note::
+
+        Requires `NumPy <https://pypi.org/project/numpy/>`_ package.
+    """
+
+    def __init__(self, **kwargs):
+        super(SurfaceEvaluatorRationalVectorized, self).__init__(**kwargs)
+
+    def evaluate(self, **kwargs):
+        """ Evaluates the rational surface. """
+        start = kwargs.get('start')
+        stop = kwargs.get('stop')
+        sample_size = kwargs.get('sample_size')
+        degree = kwargs.get('degree')
+        knotvector = kwargs.get('knotvector')
+        ctrlpts = kwargs.get('ctrlpts')
+        ctrlpts_size = kwargs.get('ctrlpts_size')
+        dimension = kwargs.get('dimension')
+
+        # Algorithm A4.3 (vectorized)
+        basis = [self.basis(degree[idx], knotvector[idx], ctrlpts_size[idx], start[idx], stop[idx], sample_size[idx])
+                 for idx in range(len(degree))]
+        cptw = vec.surface_points(basis[0], basis[1], ctrlpts, ctrlpts_size)
+
+        # Divide by weight
+        eval_points = vec.rational_points(cptw).reshape(-1, dimension - 1)
+        return eval_points if kwargs.get('as_array', False) else eval_points.tolist()
+
+    def evaluate_list(self, **kwargs):
+        """ Evaluates the rational surface at the input list of (u, v) parameters. """
+        params = kwargs.get('parameters')
+        degree = kwargs.get('degree')
+        knotvector = kwargs.get('knotvector')
+        ctrlpts = kwargs.get('ctrlpts')
+        ctrlpts_size = kwargs.get('ctrlpts_size')
+
+        # Algorithm A4.3 (vectorized)
+        cptw = vec.tensor_points(params, degree, knotvector, ctrlpts, ctrlpts_size)
+
+        # Divide by weight
+        return vec.rational_points(cptw).tolist()
+
+    def derivatives(self, **kwargs):
+        """ Evaluates the derivatives at the input parameter. """
+        parameter = kwargs.pop('parameter')
+        return self.derivatives_list(parameters=[parameter], **kwargs)[0]
+
+    def derivatives_list(self, **kwargs):
+        """ Evaluates the derivatives at the input list of (u, v) parameters. """
+        deriv_order = kwargs.get('deriv_order')
+        params = kwargs.get('parameters')
+        degree = kwargs.get('degree')
+        knotvector = kwargs.get('knotvector')
+        ctrlpts = kwargs.get('ctrlpts')
+        ctrlpts_size = kwargs.get('ctrlpts_size')
+
+        # Algorithm A3.6 (vectorized)
+        d = (min(degree[0], deriv_order), min(degree[1], deriv_order))
+
+        spans = [[] for _ in range(len(degree))]
+        basisdrv = [[] for _ in range(len(degree))]
+        for idx in range(len(degree)):
+            knots = [prm[idx] for prm in params]
+            spans[idx] = vec.find_spans(degree[idx], knotvector[idx], ctrlpts_size[idx], knots)
+            basisdrv[idx] = vec.basis_functions_ders(degree[idx], knotvector[idx], spans[idx], knots, d[idx])
+        SKLw = vec.surface_derivatives(degree, spans, basisdrv, ctrlpts, ctrlpts_size, deriv_order)
+
+        # Algorithm A4.4 (vectorized)
+        return vec.rational_surface_derivatives(SKLw, deriv_order).tolist()
+
+
 @export
 class VolumeEvaluator(AbstractEvaluator):
     """ Sequential volume evaluation algorithms.
 
     Please note that knot vector span finding function may be changed by setting ``find_span_func`` keyword argument
-    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_linear`.
+    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_binsearch`.
     Please see :doc:`Helpers Module Documentation <module_utilities>` for more details.
     """
 
     def __init__(self, **kwargs):
         super(VolumeEvaluator, self).__init__(**kwargs)
-        self._span_func = kwargs.get('find_span_func', helpers.find_span_linear)
+        self._span_func = kwargs.get('find_span_func', helpers.find_span_binsearch)
 
     def evaluate(self, **kwargs):
         """ Evaluates the volume. """
@@ -601,9 +1403,8 @@ class VolumeEvaluator(AbstractEvaluator):
         spans = [[] for _ in range(len(degree))]
         basis = [[] for _ in range(len(degree))]
         for idx in range(len(degree)):
-            knots = linalg.linspace(start[idx], stop[idx], sample_size[idx], decimals=precision)
-            spans[idx] = helpers.find_spans(degree[idx], knotvector[idx], size[idx], knots, self._span_func)
-            basis[idx] = helpers.basis_functions(degree[idx], knotvector[idx], spans[idx], knots)
+            spans[idx], basis[idx] = self.basis(degree[idx], knotvector[idx], size[idx],
+                                                start[idx], stop[idx], sample_size[idx], precision)
 
         eval_points = []
         for i in range(len(spans[0])):
@@ -628,37 +1429,174 @@ class VolumeEvaluator(AbstractEvaluator):
 
         return eval_points
 
+    def evaluate_list(self, **kwargs):
+        """ Evaluates the volume at the input list of (u, v, w) parameters. """
+        params = kwargs.get('parameters')
+        degree = kwargs.get('degree')
+        knotvector = kwargs.get('knotvector')
+        ctrlpts = kwargs.get('ctrlpts')
+        size = kwargs.get('ctrlpts_size')
+        dimension = kwargs.get('dimension')
+
+        spans = [[] for _ in range(len(degree))]
+        basis = [[] for _ in range(len(degree))]
+        for idx in range(len(degree)):
+            knots = [prm[idx] for prm in params]
+            spans[idx] = helpers.find_spans(degree[idx], knotvector[idx], size[idx], knots, self._span_func)
+            basis[idx] = helpers.basis_functions(degree[idx], knotvector[idx], spans[idx], knots)
+
+        eval_points = []
+        for i in range(len(params)):
+            iu = spans[0][i] - degree[0]
+            iv = spans[1][i] - degree[1]
+            iw = spans[2][i] - degree[2]
+            spt = [0.0 for _ in range(dimension)]
+            for du in range(0, degree[0] + 1):
+                temp2 = [0.0 for _ in range(dimension)]
+                for dv in range(0, degree[1] + 1):
+                    temp = [0.0 for _ in range(dimension)]
+                    for dw in range(0, degree[2] + 1):
+                        temp[:] = [tmp + (basis[2][i][dw] * cp) for tmp, cp in
+                                   zip(temp, ctrlpts[iv + dv + (size[1] * (iu + du + (size[0] * (iw + dw))))])]
+                    temp2[:] = [pt + (basis[1][i][dv] * tmp) for pt, tmp in zip(temp2, temp)]
+                spt[:] = [pt + (basis[0][i][du] * tmp) for pt, tmp in zip(spt, temp2)]
+            eval_points.append(spt)
+
+        return eval_points
+
     def derivatives(self, **kwargs):
         """ Evaluates the derivative at the given parametric coordinate. """
         pass
 
 
+@export
+class VolumeEvaluatorVectorized(VolumeEvaluator):
+    """ Vectorized volume evaluation algorithms.
+
+    The basis function matrices are generated once and cached for all parametric directions, then the control points
+    tensor is contracted with these matrices in a single NumPy operation. If the ``as_array`` keyword argument is
+    True, :py:meth:`evaluate` returns the points as a NumPy array instead of a list.
+
+    .. note::
+
+        Requires `NumPy <https://pypi.org/project/numpy/>`_ package.
+    """
+
+    def __init__(self, **kwargs):
+        # Check if it is possible to import 'numpy'
+        if vec is None:
+            raise GeomdlException("Please install 'numpy' package to use vectorized evaluators: pip install numpy")
+        super(VolumeEvaluatorVectorized, self).__init__(**kwargs)
+
+    def evaluate(self, **kwargs):
+        """ Evaluates the volume. """
+        start = kwargs.get('start')
+        stop = kwargs.get('stop')
+        sample_size = kwargs.get('sample_size')
+        degree = kwargs.get('degree')
+        knotvector = kwargs.get('knotvector')
+        ctrlpts = kwargs.get('ctrlpts')
+        size = kwargs.get('ctrlpts_size')
+        dimension = kwargs.get('dimension')
+
+        basis = [self.basis(degree[idx], knotvector[idx], size[idx], start[idx], stop[idx], sample_size[idx])
+                 for idx in range(len(degree))]
+        eval_points = vec.volume_points(basis[0], basis[1], basis[2], ctrlpts, size).reshape(-1, dimension)
+        return eval_points if kwargs.get('as_array', False) else eval_points.tolist()
+
+    def evaluate_list(self, **kwargs):
+        """ Evaluates the volume at the input list of (u, v, w) parameters. """
+        params = kwargs.get('parameters')
+        degree = kwargs.get('degree')
+        knotvector = kwargs.get('knotvector')
+        ctrlpts = kwargs.get('ctrlpts')
+        size = kwargs.get('ctrlpts_size')
+
+        return vec.tensor_points(params, degree, knotvector, ctrlpts, size).tolist()
+
+    def _compute_basis(self, degree, knotvector, num_ctrlpts, start, stop, sample_size, precision):
+        knots = vec.linspace(start, stop, sample_size)
+        return vec.basis_matrix(degree, knotvector, num_ctrlpts, knots)
+
+
 @export
 class VolumeEvaluatorRational(VolumeEvaluator):
     """ Sequential rational volume evaluation algorithms.
 
     Please note that knot vector span finding function may be changed by setting ``find_span_func`` keyword argument
-    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_linear`.
+    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_binsearch`.
     Please see :doc:`Helpers Module Documentation <module_utilities>` for more details.
     """
 
     def __init__(self, **kwargs):
         super(VolumeEvaluatorRational, self).__init__(**kwargs)
-        self._span_func = kwargs.get('find_span_func', helpers.find_span_linear)
+        self._span_func = kwargs.get('find_span_func', helpers.find_span_binsearch)
+
+    def evaluate(self, **kwargs):
+        """ Evaluates the rational volume. """
+        cptw = super(VolumeEvaluatorRational, self).evaluate(**kwargs)
+
+        # Divide by weight
+        return self.rational_points(cptw)
+
+    def evaluate_list(self, **kwargs):
+        """ Evaluates the rational volume at the input list of (u, v, w) parameters. """
+        cptw = super(VolumeEvaluatorRational, self).evaluate_list(**kwargs)
+
+        # Divide by weight
+        return self.rational_points(cptw)
+
+    def derivatives(self, **kwargs):
+        """ Evaluates the derivatives at the input parameter. """
+        pass
+
+
+@export
+class VolumeEvaluatorRationalVectorized(VolumeEvaluatorVectorized):
+    """ Vectorized rational volume evaluation algorithms.
+
+    The weighted volume points are computed by :py:class:`.VolumeEvaluatorVectorized` and the division by the weights
+    is applied to the complete array in one step.
+
+    .. note::
+
+        Requires `NumPy <https://pypi.org/project/numpy/>`_ package.
+    """
+
+    def __init__(self, **kwargs):
+        super(VolumeEvaluatorRationalVectorized, self).__init__(**kwargs)
 
     def evaluate(self, **kwargs):
         """ Evaluates the rational volume. """
+        start = kwargs.get('start')
+        stop = kwargs.get('stop')
+        sample_size = kwargs.get('sample_size')
+        degree = kwargs.get('degree')
+        knotvector = kwargs.get('knotvector')
+        ctrlpts = kwargs.get('ctrlpts')
+        size = kwargs.get('ctrlpts_size')
         dimension = kwargs.get('dimension')
 
-        cptw = super(VolumeEvaluatorRational, self).evaluate(**kwargs)
+        basis = [self.basis(degree[idx], knotvector[idx], size[idx], start[idx], stop[idx], sample_size[idx])
+                 for idx in range(len(degree))]
+        cptw = vec.volume_points(basis[0], basis[1], basis[2], ctrlpts, size)
 
         # Divide by weight
-        eval_points = []
-        for pt in cptw:
-            cpt = [float(c / pt[-1]) for c in pt[0:(dimension - 1)]]
-            eval_points.append(cpt)
+        eval_points = vec.rational_points(cptw).reshape(-1, dimension - 1)
+        return eval_points if kwargs.get('as_array', False) else eval_points.tolist()
 
-        return eval_points
+    def evaluate_list(self, **kwargs):
+        """ Evaluates the rational volume at the input list of (u, v, w) parameters. """
+        params = kwargs.get('parameters')
+        degree = kwargs.get('degree')
+        knotvector = kwargs.get('knotvector')
+        ctrlpts = kwargs.get('ctrlpts')
+        size = kwargs.get('ctrlpts_size')
+
+        cptw = vec.tensor_points(params, degree, knotvector, ctrlpts, size)
+
+        # Divide by weight
+        return vec.rational_points(cptw).tolist()
 
     def derivatives(self, **kwargs):
         """ Evaluates the derivatives at the input parameter. """
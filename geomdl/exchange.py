@@ -186,8 +186,14 @@ def export_csv(obj, file_name, point_type='evalpts', **kwargs):
     line += str(dim) + "\n"
 
     # Prepare values
-    for pt in points:
-        line += ",".join([str(p) for p in pt]) + "\n"
+    if isinstance(points, elements.PointGrid):
+        # Read the coordinates directly from the flat array of the point grid
+        coords = [str(c) for c in points.data]
+        for idx in range(0, len(coords), dim):
+            line += ",".join(coords[idx:(idx + dim)]) + "\n"
+    else:
+        for pt in points:
+            line += ",".join([str(p) for p in pt]) + "\n"
 
     # Write to file
     return exch.write_file(file_name, line)
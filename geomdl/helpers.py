@@ -8,7 +8,9 @@
 """
 
 import os
+from bisect import bisect_right
 from copy import deepcopy
+from itertools import islice
 from . import linalg
 from .exceptions import GeomdlException
 try:
@@ -25,6 +27,9 @@ def find_span_binsearch(degree, knot_vector, num_ctrlpts, knot, **kwargs):
     The NURBS Book states that the knot span index always starts from zero, i.e. for a knot vector [0, 0, 1, 1];
     if FindSpan returns 1, then the knot is between the interval [0, 1).
 
+    The search is limited to the first :math:`n + 1` knots, so the knots at the end of the domain are assigned to the
+    last non-zero knot span. The output is always consistent with :func:`.find_span_linear`.
+
     :param degree: degree, :math:`p`
     :type degree: int
     :param knot_vector: knot vector, :math:`U`
@@ -36,36 +41,8 @@ def find_span_binsearch(degree, knot_vector, num_ctrlpts, knot, **kwargs):
     :return: knot span
     :rtype: int
     """
-    # Get tolerance value
-    tol = kwargs.get('tol', 10e-6)
-
-    # In The NURBS Book; number of knots = m + 1, number of control points = n + 1, p = degree
-    # All knot vectors should follow the rule: m = p + n + 1
-    n = num_ctrlpts - 1
-    if abs(knot_vector[n + 1] - knot) <= tol:
-        return n
-
-    # Set max and min positions of the array to be searched
-    low = degree
-    high = num_ctrlpts
-
-    # The division could return a float value which makes it impossible to use as an array index
-    mid = (low + high) / 2
-    # Direct int casting would cause numerical errors due to discarding the significand figures (digits after the dot)
-    # The round function could return unexpected results, so we add the floating point with some small number
-    # This addition would solve the issues caused by the division operation and how Python stores float numbers.
-    # E.g. round(13/2) = 6 (expected to see 7)
-    mid = int(round(mid + tol))
-
-    # Search for the span
-    while (knot < knot_vector[mid]) or (knot >= knot_vector[mid + 1]):
-        if knot < knot_vector[mid]:
-            high = mid
-        else:
-            low = mid
-        mid = int((low + high) / 2)
-
-    return mid
+    # Find the number of knots which are less than or equal to the input knot in U[0:n+1]
+    return bisect_right(knot_vector, knot, 0, num_ctrlpts) - 1
 
 
 def find_span_linear(degree, knot_vector, num_ctrlpts, knot, **kwargs):
@@ -91,9 +68,12 @@ def find_span_linear(degree, knot_vector, num_ctrlpts, knot, **kwargs):
     return span - 1
 
 
-def find_spans(degree, knot_vector, num_ctrlpts, knots, func=find_span_linear):
+def find_spans(degree, knot_vector, num_ctrlpts, knots, func=find_span_binsearch):
     """ Finds spans of a list of knots over the knot vector.
 
+    If the input knots are sorted in ascending order and ``func`` is one of the span finding functions of this module,
+    the spans are found in a single sweep over the knot vector. Otherwise, ``func`` is called for each knot.
+
     :param degree: degree, :math:`p`
     :type degree: int
     :param knot_vector: knot vector, :math:`U`
@@ -106,9 +86,17 @@ def find_spans(degree, knot_vector, num_ctrlpts, knots, func=find_span_linear):
     :return: list of spans
     :rtype: list
     """
+    if func not in (find_span_binsearch, find_span_linear) or \
+            not all(k1 <= k2 for k1, k2 in zip(knots, islice(knots, 1, None))):
+        return [func(degree, knot_vector, num_ctrlpts, knot) for knot in knots]
+
+    # Merge the sorted knots with the knot vector
     spans = []
+    span = 0
     for knot in knots:
-        spans.append(func(degree, knot_vector, num_ctrlpts, knot))
+        while span < num_ctrlpts and knot_vector[span] <= knot:
+            span += 1
+        spans.append(span - 1)
     return spans
 
 
@@ -939,6 +927,86 @@ def knot_refinement(degree, knotvector, ctrlpts, **kwargs):
     return new_ctrlpts, new_kv
 
 
+def bezier_decomposition(degree, knotvector, ctrlpts):
+    """ Computes the control points of the Bezier segments of the rational/non-rational spline.
+
+    Implementation of Algorithm A5.6 of The NURBS Book by Piegl & Tiller, 2nd Edition.
+
+    The control points may be lists of any length, which allows decomposing the surfaces and the volumes on a single
+    parametric direction by flattening the control points on the other directions. The knot vector is expected to be
+    clamped.
+
+    :param degree: degree
+    :type degree: int
+    :param knotvector: knot vector
+    :type knotvector: list, tuple
+    :param ctrlpts: control points
+    :type ctrlpts: list, tuple
+    :return: breakpoints, i.e. the distinct knots, and the control points of the Bezier segments
+    :rtype: tuple
+    """
+    m = len(knotvector) - 1
+    a = degree
+    b = degree + 1
+    breakpoints = [knotvector[a]]
+    segments = [[list(pt) for pt in ctrlpts[0:degree + 1]]]
+    next_segment = None
+    while b < m:
+        i = b
+        while b < m and knotvector[b + 1] == knotvector[b]:
+            b += 1
+        mult = b - i + 1
+        if b < m:
+            next_segment = [None for _ in range(degree + 1)]
+        if mult < degree:
+            # Insert the knot until its multiplicity is equal to the degree
+            numer = knotvector[b] - knotvector[a]
+            alphas = [numer / (knotvector[a + j] - knotvector[a]) for j in range(mult + 1, degree + 1)]
+            r = degree - mult
+            seg = segments[-1]
+            for j in range(1, r + 1):
+                s = mult + j
+                for k in range(degree, s - 1, -1):
+                    alpha = alphas[k - s]
+                    seg[k] = [alpha * e1 + (1.0 - alpha) * e2 for e1, e2 in zip(seg[k], seg[k - 1])]
+                if b < m:
+                    next_segment[r - j] = seg[degree]
+        breakpoints.append(knotvector[b])
+        if b < m:
+            for idx in range(degree - mult, degree + 1):
+                next_segment[idx] = list(ctrlpts[b - degree + idx])
+            segments.append(next_segment)
+            a = b
+            b += 1
+
+    # Return breakpoints and Bezier segments
+    return breakpoints, segments
+
+
+def power_basis_coefficients(degree, ctrlpts):
+    """ Converts the control points of a Bezier segment to the power basis coefficients.
+
+    The power basis coefficients :math:`a_k` satisfy :math:`C(t) = \\sum_{k=0}^{p} a_k t^k` for
+    :math:`t \\in [0, 1]`, so that the segment can be evaluated with Horner's method.
+
+    :param degree: degree
+    :type degree: int
+    :param ctrlpts: control points of the Bezier segment
+    :type ctrlpts: list, tuple
+    :return: power basis coefficients
+    :rtype: list
+    """
+    bc = linalg.binomial_coefficients(degree)
+    coeffs = []
+    for k in range(0, degree + 1):
+        coeff = [0.0 for _ in range(len(ctrlpts[0]))]
+        for i in range(0, k + 1):
+            factor = bc[degree][k] * bc[k][i] * (-1.0 if (k - i) % 2 else 1.0)
+            coeff = [c + (factor * pt) for c, pt in zip(coeff, ctrlpts[i])]
+        coeffs.append(coeff)
+    return coeffs
+
+
 def degree_elevation(degree, ctrlpts, **kwargs):
     """ Computes the control points of the rational/non-rational spline after degree elevation.
 
@@ -438,6 +438,25 @@ def binomial_coefficient(k, i):
     return float(k_fact / (k_i_fact * i_fact))
 
 
+@lru_cache(maxsize=os.environ['GEOMDL_CACHE_SIZE'] if "GEOMDL_CACHE_SIZE" in os.environ else 128)
+def binomial_coefficients(n):
+    """ Generates the table of binomial coefficients up to *n* (Pascal's triangle).
+
+    The table is generated once for each *n* and the entry ``[k][i]`` of the table is equal to *k choose i* for
+    :math:`0 \\leq i \\leq k \\leq n`.
+
+    :param n: maximum size of the set of distinct elements
+    :type n: int
+    :return: table of binomial coefficients
+    :rtype: tuple
+    """
+    table = [[1.0]]
+    for k in range(1, n + 1):
+        prev = table[-1]
+        table.append([1.0] + [prev[i - 1] + prev[i] for i in range(1, k)] + [1.0])
+    return tuple(tuple(row) for row in table)
+
+
 def lu_decomposition(matrix_a):
     """ LU-Factorization method using Doolittle's Method for solution of linear systems.
 
@@ -511,28 +530,47 @@ def linspace(start, stop, num, decimals=18):
 
     Inspired from Numpy's linspace function: https://github.com/numpy/numpy/blob/master/numpy/core/function_base.py
 
+    The last number is always equal to the end value. The numbers are generated once for each set of inputs and the
+    repeated calls return copies of the cached numbers. Rounding to ``decimals`` decimal places is only applied to the
+    numbers which can be changed by it, e.g. the numbers smaller than 0.018 for the default value of 18.
+
     :param start: starting value
     :type start: float
     :param stop: end value
     :type stop: float
     :param num: number of samples to generate
     :type num: int
-    :param decimals: number of significands
+    :param decimals: number of significands, None to skip rounding
     :type decimals: int
     :return: a list of equally spaced numbers
     :rtype: list
     """
-    start = float(start)
-    stop = float(stop)
+    return list(_linspace(float(start), float(stop), int(num), decimals))
+
+
+@lru_cache(maxsize=os.environ['GEOMDL_CACHE_SIZE'] if "GEOMDL_CACHE_SIZE" in os.environ else 128)
+def _linspace(start, stop, num, decimals):
+    """ Generates evenly spaced numbers over a specified interval (cached).
+
+    Please see :func:`.linspace` for details.
+
+    :return: equally spaced numbers
+    :rtype: tuple
+    """
     if abs(start - stop) <= 10e-8:
-        return [start]
-    num = int(num)
+        return start,
     if num > 1:
-        div = num - 1
+        div = float(num - 1)
         delta = stop - start
-        return [float(("{:." + str(decimals) + "f}").format((start + (float(x) * float(delta) / float(div)))))
-                for x in range(num)]
-    return [float(("{:." + str(decimals) + "f}").format(start))]
+        numbers = [start + (float(x) * delta / div) for x in range(num)]
+        numbers[-1] = stop
+    else:
+        numbers = [start]
+    if decimals is not None:
+        # Rounding changes a number only if the rounding step is larger than its spacing, i.e. 2^-53 * abs(number)
+        limit = (2.0 ** 54) * (10.0 ** -decimals)
+        numbers = [round(n, decimals) if abs(n) < limit else n for n in numbers]
+    return tuple(numbers)
 
 
 def frange(start, stop, step=1.0):
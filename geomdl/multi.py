@@ -8,6 +8,7 @@
 """
 
 import abc
+import math
 import warnings
 from functools import partial
 from multiprocessing import Value, Lock
@@ -704,6 +705,65 @@ class SurfaceContainer(AbstractContainer):
         self._cache['vertices'][:] = []
         self._cache['faces'][:] = []
 
+    def tessellate_lod(self, viewpoint, levels, **kwargs):
+        """ Tessellates the surfaces inside the container using a level of detail selected for each surface.
+
+        The levels of detail are the keyword arguments of :py:meth:`.abstract.Surface.tessellate_lod` ordered from the
+        coarsest to the finest. The tessellations are cached by the surfaces, therefore moving the viewpoint only
+        tessellates the surfaces for the levels which are not in their caches.
+
+        The level of each surface is selected by comparing the distance between the viewpoint and the bounding box of
+        the surface, or the projected size of the bounding box on the screen with the thresholds. The number of the
+        thresholds should be one less than the number of the levels, and the surface uses the level with the index
+        equal to the number of the thresholds passed.
+
+        .. code-block:: python
+
+            levels = [dict(sample_size=5), dict(sample_size=20), dict(tolerance=0.01)]
+
+            # Use the 2nd level closer than 100 units and the 3rd level closer than 20 units
+            meshes = surf_container.tessellate_lod([0.0, 0.0, 250.0], levels, distances=[100.0, 20.0])
+
+            # Use the 2nd level larger than 50 pixels and the 3rd level larger than 400 pixels
+            meshes = surf_container.tessellate_lod([0.0, 0.0, 250.0], levels, pixels=[50, 400])
+
+        Keyword Arguments:
+            * ``distances``: distance thresholds in descending order
+            * ``pixels``: screen-space size thresholds in pixels in ascending order
+            * ``fov``: vertical field of view of the camera in degrees. *Default: 60*
+            * ``height``: height of the viewport in pixels. *Default: 1080*
+
+        :param viewpoint: position of the viewer
+        :type viewpoint: list, tuple
+        :param levels: levels of detail as a list of dicts
+        :type levels: list, tuple
+        :return: compact meshes of the surfaces
+        :rtype: list
+        """
+        distances = kwargs.get('distances', None)
+        pixels = kwargs.get('pixels', None)
+        if (distances is None) == (pixels is None):
+            raise GeomdlException("Please set either 'distances' or 'pixels' keyword argument")
+        thresholds = distances if pixels is None else pixels
+        if len(thresholds) != len(levels) - 1:
+            raise GeomdlException("The number of the thresholds should be one less than the number of the levels")
+
+        # Scale factor of the perspective projection
+        scale = float(kwargs.get('height', 1080)) / (2.0 * math.tan(math.radians(kwargs.get('fov', 60)) / 2.0))
+
+        meshes = []
+        for elem in self._elements:
+            # Distance between the viewpoint and the closest point of the bounding box of the surface
+            bbox = elem.bbox
+            dist = math.sqrt(sum(max(lo - p, 0.0, p - hi) ** 2 for p, lo, hi in zip(viewpoint, bbox[0], bbox[1])))
+            if pixels is None:
+                idx = sum(1 for t in distances if dist < t)
+            else:
+                size = math.sqrt(sum((hi - lo) ** 2 for lo, hi in zip(bbox[0], bbox[1])))
+                idx = sum(1 for t in pixels if dist == 0.0 or (size * scale) / dist >= t)
+            meshes.append(elem.tessellate_lod(**levels[idx]))
+        return meshes
+
     def render(self, **kwargs):
         """ Renders the surfaces.
 
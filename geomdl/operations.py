@@ -917,7 +917,7 @@ def split_curve(obj, param, **kwargs):
     curve objects and returns them. It does not modify the input curve.
 
     Keyword Arguments:
-        * ``find_span_func``: FindSpan implementation. *Default:* :func:`.helpers.find_span_linear`
+        * ``find_span_func``: FindSpan implementation. *Default:* :func:`.helpers.find_span_binsearch`
         * ``insert_knot_func``: knot insertion algorithm implementation. *Default:* :func:`.operations.insert_knot`
 
     :param obj: Curve to be split
@@ -935,7 +935,7 @@ def split_curve(obj, param, **kwargs):
         raise GeomdlException("Cannot split on the corner points")
 
     # Keyword arguments
-    span_func = kwargs.get('find_span_func', helpers.find_span_linear)  # FindSpan implementation
+    span_func = kwargs.get('find_span_func', helpers.find_span_binsearch)  # FindSpan implementation
     insert_knot_func = kwargs.get('insert_knot_func', insert_knot)  # Knot insertion algorithm
 
     # Find multiplicity of the knot and define how many times we need to add the knot
@@ -963,13 +963,13 @@ def split_curve(obj, param, **kwargs):
     curve2_ctrlpts = cpts[ks + r - 1:]
 
     # Create a new curve for the first half
-    curve1 = temp_obj.__class__()
+    curve1 = temp_obj.__class__(array_storage=temp_obj._array_storage)
     curve1.degree = temp_obj.degree
     curve1.set_ctrlpts(curve1_ctrlpts)
     curve1.knotvector = curve1_kv
 
     # Create another curve fot the second half
-    curve2 = temp_obj.__class__()
+    curve2 = temp_obj.__class__(array_storage=temp_obj._array_storage)
     curve2.degree = temp_obj.degree
     curve2.set_ctrlpts(curve2_ctrlpts)
     curve2.knotvector = curve2_kv
@@ -986,7 +986,7 @@ def decompose_curve(obj, **kwargs):
     This operation does not modify the input curve, instead it returns the split curve segments.
 
     Keyword Arguments:
-        * ``find_span_func``: FindSpan implementation. *Default:* :func:`.helpers.find_span_linear`
+        * ``find_span_func``: FindSpan implementation. *Default:* :func:`.helpers.find_span_binsearch`
         * ``insert_knot_func``: knot insertion algorithm implementation. *Default:* :func:`.operations.insert_knot`
 
     :param obj: Curve to be decomposed
@@ -1086,7 +1086,7 @@ def split_surface_u(obj, param, **kwargs):
     generates two different surface objects and returns them. It does not modify the input surface.
 
     Keyword Arguments:
-        * ``find_span_func``: FindSpan implementation. *Default:* :func:`.helpers.find_span_linear`
+        * ``find_span_func``: FindSpan implementation. *Default:* :func:`.helpers.find_span_binsearch`
         * ``insert_knot_func``: knot insertion algorithm implementation. *Default:* :func:`.operations.insert_knot`
 
     :param obj: surface
@@ -1104,7 +1104,7 @@ def split_surface_u(obj, param, **kwargs):
         raise GeomdlException("Cannot split on the edge")
 
     # Keyword arguments
-    span_func = kwargs.get('find_span_func', helpers.find_span_linear)  # FindSpan implementation
+    span_func = kwargs.get('find_span_func', helpers.find_span_binsearch)  # FindSpan implementation
     insert_knot_func = kwargs.get('insert_knot_func', insert_knot)  # Knot insertion algorithm
 
     # Find multiplicity of the knot
@@ -1131,7 +1131,7 @@ def split_surface_u(obj, param, **kwargs):
     surf2_ctrlpts = temp_obj.ctrlpts2d[ks + r - 1:]
 
     # Create a new surface for the first half
-    surf1 = temp_obj.__class__()
+    surf1 = temp_obj.__class__(array_storage=temp_obj._array_storage)
     surf1.degree_u = temp_obj.degree_u
     surf1.degree_v = temp_obj.degree_v
     surf1.ctrlpts2d = surf1_ctrlpts
@@ -1139,7 +1139,7 @@ def split_surface_u(obj, param, **kwargs):
     surf1.knotvector_v = temp_obj.knotvector_v
 
     # Create another surface fot the second half
-    surf2 = temp_obj.__class__()
+    surf2 = temp_obj.__class__(array_storage=temp_obj._array_storage)
     surf2.degree_u = temp_obj.degree_u
     surf2.degree_v = temp_obj.degree_v
     surf2.ctrlpts2d = surf2_ctrlpts
@@ -1159,7 +1159,7 @@ def split_surface_v(obj, param, **kwargs):
     generates two different surface objects and returns them. It does not modify the input surface.
 
     Keyword Arguments:
-        * ``find_span_func``: FindSpan implementation. *Default:* :func:`.helpers.find_span_linear`
+        * ``find_span_func``: FindSpan implementation. *Default:* :func:`.helpers.find_span_binsearch`
         * ``insert_knot_func``: knot insertion algorithm implementation. *Default:* :func:`.operations.insert_knot`
 
     :param obj: surface
@@ -1177,7 +1177,7 @@ def split_surface_v(obj, param, **kwargs):
         raise GeomdlException("Cannot split on the edge")
 
     # Keyword arguments
-    span_func = kwargs.get('find_span_func', helpers.find_span_linear)  # FindSpan implementation
+    span_func = kwargs.get('find_span_func', helpers.find_span_binsearch)  # FindSpan implementation
     insert_knot_func = kwargs.get('insert_knot_func', insert_knot)  # Knot insertion algorithm
 
     # Find multiplicity of the knot
@@ -1210,7 +1210,7 @@ def split_surface_v(obj, param, **kwargs):
         surf2_ctrlpts.append(temp)
 
     # Create a new surface for the first half
-    surf1 = temp_obj.__class__()
+    surf1 = temp_obj.__class__(array_storage=temp_obj._array_storage)
     surf1.degree_u = temp_obj.degree_u
     surf1.degree_v = temp_obj.degree_v
     surf1.ctrlpts2d = surf1_ctrlpts
@@ -1218,7 +1218,7 @@ def split_surface_v(obj, param, **kwargs):
     surf1.knotvector_u = temp_obj.knotvector_u
 
     # Create another surface fot the second half
-    surf2 = temp_obj.__class__()
+    surf2 = temp_obj.__class__(array_storage=temp_obj._array_storage)
     surf2.degree_u = temp_obj.degree_u
     surf2.degree_v = temp_obj.degree_v
     surf2.ctrlpts2d = surf2_ctrlpts
@@ -1237,7 +1237,7 @@ def decompose_surface(obj, **kwargs):
     This operation does not modify the input surface, instead it returns the surface patches.
 
     Keyword Arguments:
-        * ``find_span_func``: FindSpan implementation. *Default:* :func:`.helpers.find_span_linear`
+        * ``find_span_func``: FindSpan implementation. *Default:* :func:`.helpers.find_span_binsearch`
         * ``insert_knot_func``: knot insertion algorithm implementation. *Default:* :func:`.operations.insert_knot`
 
     :param obj: surface
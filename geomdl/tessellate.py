@@ -8,14 +8,19 @@
 """
 
 import abc
+import copy
 from .exceptions import GeomdlException
 from . import _tessellate as tsl
+from .elements import Mesh
 from ._utilities import add_metaclass, export
 
 
 # Add some aliases
 make_triangle_mesh = tsl.make_triangle_mesh
 make_quad_mesh = tsl.make_quad_mesh
+make_triangle_grid = tsl.make_triangle_grid
+make_quad_grid = tsl.make_quad_grid
+make_adaptive_mesh = tsl.make_adaptive_mesh
 polygon_triangulate = tsl.polygon_triangulate
 surface_tessellate = tsl.surface_tessellate
 surface_trim_tessellate = tsl.surface_trim_tessellate
@@ -23,14 +28,41 @@ surface_trim_tessellate = tsl.surface_trim_tessellate
 
 @add_metaclass(abc.ABCMeta)
 class AbstractTessellate(object):
-    """ Abstract base class for tessellation algorithms. """
+    """ Abstract base class for tessellation algorithms.
+
+    The tessellation results are stored in a compact :class:`.Mesh` instance, accessible via :py:attr:`~mesh`.
+    :py:attr:`~vertices` and :py:attr:`~faces` are generated from the compact mesh on first access.
+    """
 
     def __init__(self, **kwargs):
         self._tsl_func = None
         self._vertices = []
         self._faces = []
+        self._mesh = Mesh()
+        self._entity_views = True  # flag for vertex and face objects generated from the compact mesh
         self._arguments = dict()
 
+    def __deepcopy__(self, memo):
+        cls = self.__class__
+        result = cls.__new__(cls)
+        memo[id(self)] = result
+        # Copy only the compact mesh, the vertex and face objects are generated again on demand
+        if self._entity_views and self._mesh.num_vertices > 0:
+            memo[id(self._vertices)] = []
+            memo[id(self._faces)] = []
+        for k, v in self.__dict__.items():
+            setattr(result, k, copy.deepcopy(v, memo))
+        return result
+
+    @property
+    def mesh(self):
+        """ Compact mesh generated after tessellation.
+
+        :getter: Gets the compact mesh
+        :type: elements.Mesh
+        """
+        return self._mesh
+
     @property
     def vertices(self):
         """ Vertex objects generated after tessellation.
@@ -38,6 +70,7 @@ class AbstractTessellate(object):
         :getter: Gets the vertices
         :type: elements.AbstractEntity
         """
+        self._build_entities()
         return self._vertices
 
     @property
@@ -47,6 +80,7 @@ class AbstractTessellate(object):
         :getter: Gets the faces
         :type: elements.AbstractEntity
         """
+        self._build_entities()
         return self._faces
 
     @property
@@ -76,6 +110,7 @@ class AbstractTessellate(object):
         """ Clears stored vertices and faces. """
         self._vertices[:] = []
         self._faces[:] = []
+        self._mesh.clear()
 
     def is_tessellated(self):
         """ Checks if vertices and faces are generated.
@@ -83,7 +118,42 @@ class AbstractTessellate(object):
         :return: tessellation status
         :rtype: bool
         """
-        return all((self.vertices, self.faces))
+        if self._mesh.num_faces > 0:
+            return True
+        return all((self._vertices, self._faces))
+
+    def update_vertices(self, indices, points):
+        """ Updates the spatial coordinates of the vertices.
+
+        :param indices: vertex indices
+        :type indices: list, tuple
+        :param points: new coordinates of the vertices
+        :type points: list, tuple
+        """
+        vdata = self._mesh.vertices
+        dim = self._mesh.dimension
+        for idx, pt in zip(indices, points):
+            for c in range(dim):
+                vdata[(idx * dim) + c] = pt[c]
+        # Keep the vertex objects in sync, if they are already generated
+        if self._vertices:
+            for idx, pt in zip(indices, points):
+                self._vertices[idx].data = pt
+
+    def _set_mesh(self, points, face_size):
+        # Prepares the compact mesh for the input points
+        dim = len(points[0]) if len(points) > 0 else 3
+        if self._mesh.dimension != dim or self._mesh.face_size != face_size:
+            self._mesh = Mesh(dim, face_size)
+        self._vertices[:] = []
+        self._faces[:] = []
+        self._entity_views = True
+        return self._mesh
+
+    def _build_entities(self):
+        # Generates vertex and face objects from the compact mesh on first access
+        if not self._vertices and self._mesh.num_vertices > 0:
+            self._vertices[:], self._faces[:] = tsl.mesh_to_entities(self._mesh)
 
     @abc.abstractmethod
     def tessellate(self, points, **kwargs):
@@ -111,7 +181,8 @@ class TriangularTessellate(AbstractTessellate):
     def tessellate(self, points, **kwargs):
         """ Applies triangular tessellation.
 
-        This function does not check if the points have already been tessellated.
+        This function does not check if the points have already been tessellated. The triangles are directly
+        generated in the compact mesh, unless a custom ``tessellate_func`` is passed as a keyword argument.
 
         Keyword Arguments:
             * ``size_u``: number of points on the u-direction
@@ -123,8 +194,16 @@ class TriangularTessellate(AbstractTessellate):
         # Call parent function
         super(TriangularTessellate, self).tessellate(points, **kwargs)
 
+        # Prepare the compact mesh
+        mesh = self._set_mesh(points, 3)
+
         # Apply default triangular mesh generator function
-        self._vertices, self._faces = self._tsl_func(points, **kwargs)
+        if kwargs.get('tessellate_func') is None and self._tsl_func is tsl.make_triangle_mesh:
+            tsl.make_triangle_grid(mesh, points, **kwargs)
+        else:
+            self._vertices[:], self._faces[:] = self._tsl_func(points, **kwargs)
+            tsl.mesh_from_entities(mesh, self._vertices, self._faces)
+            self._entity_views = False
 
 
 @export
@@ -157,9 +236,75 @@ class TrimTessellate(AbstractTessellate):
             if trim.opt_get('reversed') is None:
                 trim.opt = ['reversed', 0]  # always trim the enclosed area by the curve
 
+        # Prepare the compact mesh
+        mesh = self._set_mesh(points, 3)
+
+        # Index the trim curve segments once for all cells of the grid
+        tsl_args = dict(self.arguments)
+        tsl_args['trim_index'] = tsl.TrimIndex(trims)
+
         # Apply default triangular mesh generator function with trimming customization
-        self._vertices, self._faces = self._tsl_func(points, trims=trims, tessellate_func=self._tsl_trim_func,
-                                                     tessellate_args=self.arguments, **kwargs)
+        self._vertices[:], self._faces[:] = self._tsl_func(points, trims=trims, tessellate_func=self._tsl_trim_func,
+                                                           tessellate_args=tsl_args, **kwargs)
+
+        # Keep the trimming data on the generated objects and copy the results to the compact mesh
+        tsl.mesh_from_entities(mesh, self._vertices, self._faces)
+        self._entity_views = False
+
+
+@export
+class AdaptiveTessellate(AbstractTessellate):
+    """ Adaptive triangular tessellation algorithm for surfaces.
+
+    The parametric domain is refined until the chordal deviation and the angle between the surface normals are within
+    the tolerances, instead of the uniform sampling of the evaluated points. Please see
+    :func:`.make_adaptive_mesh` for the details of the algorithm. The default values of the keyword arguments of
+    :py:meth:`tessellate` can be set via the constructor and they are stored in :py:attr:`arguments`.
+
+    .. code-block:: python
+
+        from geomdl import tessellate
+
+        surf.tessellator = tessellate.AdaptiveTessellate(tolerance=0.01, angle=10)
+        surf.tessellate()
+
+    This tessellator does not support trimming and tessellating a trimmed surface raises :class:`.GeomdlException`.
+
+    Keyword Arguments:
+        * ``tolerance``: maximum chordal deviation. *Default: 0.1% of the bounding box diagonal of the control points*
+        * ``angle``: maximum angle between the normals in degrees. *Default: 15*
+        * ``max_depth``: maximum number of the subdivisions of a knot span on each direction. *Default: 8*
+    """
+
+    def __init__(self, **kwargs):
+        super(AdaptiveTessellate, self).__init__(**kwargs)
+        self._tsl_func = tsl.make_adaptive_mesh
+        self._arguments.update((k, kwargs[k]) for k in ('tolerance', 'angle', 'max_depth') if k in kwargs)
+
+    def tessellate(self, points, **kwargs):
+        """ Applies adaptive triangular tessellation.
+
+        This function does not check if the surface has already been tessellated. The generated vertices are the
+        evaluated surface points.
+
+        Keyword Arguments:
+            * ``tolerance``: maximum chordal deviation
+            * ``angle``: maximum angle between the normals in degrees
+            * ``max_depth``: maximum number of the subdivisions of a knot span on each direction
+
+        :param points: surface to be tessellated
+        :type points: abstract.Surface
+        """
+        # Call parent function
+        super(AdaptiveTessellate, self).tessellate(points, **kwargs)
+
+        # Keyword arguments override the tessellation arguments
+        options = dict(self.arguments)
+        options.update((k, kwargs[k]) for k in ('tolerance', 'angle', 'max_depth') if k in kwargs)
+
+        # Generate the triangles directly in the compact mesh
+        mesh = self._set_mesh(points.ctrlpts, 3)
+        self._tsl_func(mesh, points, **options)
 
 
 @export
@@ -185,5 +330,13 @@ class QuadTessellate(AbstractTessellate):
         # Call parent function
         super(QuadTessellate, self).tessellate(points, **kwargs)
 
-        # Apply default triangular mesh generator function
-        self._vertices, self._faces = self._tsl_func(points, **kwargs)
+        # Prepare the compact mesh
+        mesh = self._set_mesh(points, 4)
+
+        # Apply default quadrilateral mesh generator function
+        if self._tsl_func is tsl.make_quad_mesh:
+            tsl.make_quad_grid(mesh, points, **kwargs)
+        else:
+            self._vertices[:], self._faces[:] = self._tsl_func(points, **kwargs)
+            tsl.mesh_from_entities(mesh, self._vertices, self._faces)
+            self._entity_views = False
@@ -701,7 +701,7 @@ class VisSurfScatter(vis.VisAbstract):
 
             # Plot evaluated points
             if plot['type'] == 'evalpts' and self.vconf.display_evalpts:
-                pts = np.array(plot['ptsarr'], dtype=self.vconf.dtype)
+                pts = np.asarray(plot['ptsarr'], dtype=self.vconf.dtype)
                 ax.scatter(pts[:, 0], pts[:, 1], pts[:, 2],
                            color=plot['color'], s=50, depthshade=True, alpha=self.vconf.alpha)
                 plot_proxy = mpl.lines.Line2D([0], [0], linestyle='none', color=plot['color'], marker='o')
@@ -792,7 +792,7 @@ class VisVolume(vis.VisAbstract):
 
         # Start plotting
         for plot in self._plots:
-            pts = np.array(plot['ptsarr'], dtype=self.vconf.dtype)
+            pts = np.asarray(plot['ptsarr'], dtype=self.vconf.dtype)
             # Plot control points
             if plot['type'] == 'ctrlpts' and self.vconf.display_ctrlpts:
                 ax.scatter(pts[:, 0], pts[:, 1], pts[:, 2], color=plot['color'], marker='^', s=20, depthshade=True)
@@ -8,6 +8,7 @@
 """
 
 import struct
+from . import elements
 from . import _voxelize as vxl
 from ._utilities import export
 
@@ -43,7 +44,9 @@ def voxelize(obj, **kwargs):
     for o in obj:
         # Generate voxel grid
         grid_temp = vxl.generate_voxel_grid(o.bbox, grid_size, use_cubes=use_cubes)
-        args = [grid_temp, o.evalpts]
+        # The in-outs are found point by point for each voxel, so the point grid is converted to a list only once
+        evalpts = o.evalpts
+        args = [grid_temp, evalpts.tolist() if isinstance(evalpts, elements.PointGrid) else evalpts]
 
         # Find in-outs
         filled_temp = vxl.find_inouts_mp(*args, **kwargs) if num_procs > 1 else vxl.find_inouts_st(*args, **kwargs)
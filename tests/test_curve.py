@@ -6,8 +6,10 @@
     Requires "pytest" to run.
 """
 
-from pytest import fixture, mark
+import copy
+from pytest import fixture, mark, importorskip
 from geomdl import BSpline
+from geomdl import NURBS
 from geomdl import evaluators
 from geomdl import helpers
 from geomdl import convert
@@ -83,6 +85,48 @@ def test_bspline_curve2d_deriv_eval(spline_curve):
     assert abs(der2[0][1] - evalpt[1]) < GEOMDL_DELTA
 
 
+def test_bspline_curve2d_eval_list(spline_curve):
+    params = [0.0, 0.3, 0.5, 0.6, 1.0]
+    evalpts = spline_curve.evaluate_list(params)
+
+    assert len(evalpts) == len(params)
+    for param, evalpt in zip(params, evalpts):
+        res = spline_curve.evaluate_single(param)
+        assert abs(evalpt[0] - res[0]) < GEOMDL_DELTA
+        assert abs(evalpt[1] - res[1]) < GEOMDL_DELTA
+
+
+def test_bspline_curve2d_deriv_list(spline_curve):
+    params = [0.0, 0.35, 0.66, 1.0]
+    ders = spline_curve.derivatives_list(params, order=2)
+
+    assert len(ders) == len(params)
+    for param, der1 in zip(params, ders):
+        der2 = spline_curve.derivatives(u=param, order=2)
+        for k in range(0, 3):
+            assert abs(der1[k][0] - der2[k][0]) < GEOMDL_DELTA
+            assert abs(der1[k][1] - der2[k][1]) < GEOMDL_DELTA
+
+
+def test_bspline_curve2d_update_ctrlpt(spline_curve):
+    spline_curve.sample_size = 25
+    spline_curve.evaluate()
+    spline_curve.update_ctrlpt(2, [20.0, 25.0])
+    evalpts = spline_curve.evalpts
+
+    res = BSpline.Curve()
+    res.degree = spline_curve.degree
+    res.ctrlpts = [[5.0, 5.0], [10.0, 10.0], [20.0, 25.0], [35.0, 15.0], [45.0, 10.0], [50.0, 5.0]]
+    res.knotvector = spline_curve.knotvector
+    res.sample_size = 25
+
+    assert spline_curve.ctrlpts == res.ctrlpts
+    assert len(evalpts) == len(res.evalpts)
+    for pt, r in zip(evalpts, res.evalpts):
+        assert abs(pt[0] - r[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - r[1]) < GEOMDL_DELTA
+
+
 @mark.parametrize("param, num_insert, res", [
     (0.3, 1, (18.617, 13.377)),
     (0.6, 1, (32.143, 14.328)),
@@ -217,6 +261,102 @@ def test_nurbs_curve2d_deriv(nurbs_curve, param, order, res):
             assert abs(c - e) < GEOMDL_DELTA
 
 
+def test_nurbs_curve2d_eval_list(nurbs_curve):
+    params = [0.0, 0.2, 0.5, 0.95]
+    evalpts = nurbs_curve.evaluate_list(params)
+
+    for param, evalpt in zip(params, evalpts):
+        res = nurbs_curve.evaluate_single(param)
+        assert abs(evalpt[0] - res[0]) < GEOMDL_DELTA
+        assert abs(evalpt[1] - res[1]) < GEOMDL_DELTA
+
+
+def test_nurbs_curve2d_deriv_list(nurbs_curve):
+    params = [0.0, 0.2, 0.5, 0.95]
+    ders = nurbs_curve.derivatives_list(params, order=3)
+
+    for param, deriv in zip(params, ders):
+        res = nurbs_curve.derivatives(u=param, order=3)
+        for computed, expected in zip(deriv, res):
+            for c, e in zip(computed, expected):
+                assert abs(c - e) < GEOMDL_DELTA
+
+
+def test_nurbs_curve2d_update_ctrlpt(nurbs_curve):
+    nurbs_curve.evaluate()
+    nurbs_curve.update_ctrlpt(4, [45.0, 20.0])
+
+    crv = BSpline.Curve()
+    crv.degree = nurbs_curve.degree
+    crv.ctrlpts = [[5.0, 5.0], [10.0, 10.0], [20.0, 15.0], [35.0, 15.0], [45.0, 20.0], [50.0, 5.0]]
+    crv.knotvector = nurbs_curve.knotvector
+    res = convert.bspline_to_nurbs(crv)
+    res.weights = nurbs_curve.weights
+
+    assert nurbs_curve.weights == [0.5, 1.0, 0.75, 1.0, 0.25, 1.0]
+    for pt, r in zip(nurbs_curve.evalpts, res.evalpts):
+        assert abs(pt[0] - r[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - r[1]) < GEOMDL_DELTA
+
+
+def test_nurbs_curve2d_array_storage(nurbs_curve):
+    np = importorskip('numpy')
+    curve = NURBS.Curve(array_storage=True)
+    curve.degree = nurbs_curve.degree
+    curve.ctrlptsw = nurbs_curve.ctrlptsw
+    curve.knotvector = nurbs_curve.knotvector
+
+    # Weights are a view of the weighted control points array
+    assert isinstance(curve.ctrlptsw, np.ndarray)
+    assert curve.ctrlptsw.shape == (6, 3)
+    assert np.shares_memory(curve.weights, curve.ctrlptsw)
+    assert list(curve.weights) == [0.5, 1.0, 0.75, 1.0, 0.25, 1.0]
+    for pt, r in zip(curve.ctrlpts, nurbs_curve.ctrlpts):
+        assert abs(pt[0] - r[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - r[1]) < GEOMDL_DELTA
+
+    for pt, r in zip(curve.evalpts, nurbs_curve.evalpts):
+        assert abs(pt[0] - r[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - r[1]) < GEOMDL_DELTA
+
+
+    # The weights of a copy are a view of its own weighted control points array after updating it
+    curve_copy = copy.deepcopy(curve)
+    curve_copy.update_ctrlpt(1, [10.0, 10.0])
+    assert np.shares_memory(curve_copy.weights, curve_copy.ctrlptsw)
+    assert not np.shares_memory(curve_copy.ctrlptsw, curve.ctrlptsw)
+
+def test_bspline_curve2d_array_storage_split(spline_curve):
+    np = importorskip('numpy')
+    curve = BSpline.Curve(array_storage=True)
+    curve.degree = spline_curve.degree
+    curve.ctrlpts = spline_curve.ctrlpts
+    curve.knotvector = spline_curve.knotvector
+
+    curves = operations.split_curve(curve, 0.5)
+    assert isinstance(curves[0].ctrlpts, np.ndarray)
+    for crv, res in zip(curves, operations.split_curve(spline_curve, 0.5)):
+        for pt, r in zip(crv.ctrlpts, res.ctrlpts):
+            assert abs(pt[0] - r[0]) < GEOMDL_DELTA
+            assert abs(pt[1] - r[1]) < GEOMDL_DELTA
+
+    assert len(operations.decompose_curve(curve)) == 3
+
+
+def test_bspline_curve2d_array_storage_reverse(spline_curve):
+    np = importorskip('numpy')
+    curve = BSpline.Curve(array_storage=True)
+    curve.degree = spline_curve.degree
+    curve.ctrlpts = spline_curve.ctrlpts
+    curve.knotvector = spline_curve.knotvector
+    curve.reverse()
+
+    assert isinstance(curve.ctrlpts, np.ndarray)
+    assert curve.ctrlpts.flags['C_CONTIGUOUS']
+    assert list(curve.ctrlpts[0]) == [50.0, 5.0]
+    assert list(curve.ctrlpts[-1]) == [5.0, 5.0]
+
+
 @fixture
 def spline_curve_kv_norm1():
     """ Creates a spline Curve with knot vector normalization """
@@ -6,9 +6,13 @@
     Requires "pytest" to run.
 """
 
+from pytest import importorskip
 from geomdl import BSpline
+from geomdl import NURBS
+from geomdl import evaluators
 
 
+GEOMDL_DELTA = 10e-8
 SAMPLE_SIZE = 5
 C_DEGREE = 2
 C_CTRLPTS2D = [[1, 1], [2, 1], [2, 2]]
@@ -23,6 +27,12 @@ S_CTRLPTS = [[0, 0, 0], [0, 1, 0], [0, 2, -3],
 S_KV_U = [0, 0, 0, 1, 1, 1]
 S_KV_V = [0, 0, 0, 1, 1, 1]
 
+V_DEGREE = 2
+V_CTRLPTS = [[float(u), float(v), float(w + ((u * v) % 2))] for w in range(3) for u in range(3) for v in range(4)]
+V_KV_U = [0, 0, 0, 1, 1, 1]
+V_KV_V = [0, 0, 0, 0.5, 1, 1, 1]
+V_KV_W = [0, 0, 0, 1, 1, 1]
+
 
 def test_bspline_curve2d_evaluate():
     curve = BSpline.Curve()
@@ -68,3 +78,368 @@ def test_bspline_surface_evaluate():
            [2.0, 0.0, 0.0], [2.0, 0.5, 0.1875], [2.0, 1.0, 0.75], [2.0, 1.5, 1.6875], [2.0, 2.0, 3.0]]
 
     assert surf.evalpts == res
+
+
+def test_evaluator_basis_cache():
+    surf = BSpline.Surface()
+    surf.degree_u = S_DEGREE_U
+    surf.degree_v = S_DEGREE_V
+    surf.set_ctrlpts(S_CTRLPTS, 3, 3)
+    surf.knotvector_u = S_KV_U
+    surf.knotvector_v = S_KV_V
+    surf.sample_size = SAMPLE_SIZE
+    res = surf.evalpts
+
+    # Changing the control points only reuses the cached spans and basis functions
+    # (u- and v-directions have the same degree, knot vector and sample size, so they share a cache entry)
+    surf.ctrlpts = [[pt[0], pt[1], pt[2] + 1.0] for pt in S_CTRLPTS]
+    surf.evaluate()
+    info = surf.evaluator.cache_info()
+    assert info.hits == 3
+    assert info.misses == 1
+    assert info.currsize == 1
+    for pt, r in zip(surf.evalpts, res):
+        assert abs(pt[2] - (r[2] + 1.0)) < GEOMDL_DELTA
+
+    # Changing the sample size requires new spans and basis functions
+    surf.sample_size = SAMPLE_SIZE + 1
+    surf.evaluate()
+    assert surf.evaluator.cache_info().misses == 2
+
+    surf.evaluator.cache_clear()
+    assert surf.evaluator.cache_info().currsize == 0
+
+
+def test_evaluator_basis_cache_budget():
+    curve = BSpline.Curve()
+    curve.degree = C_DEGREE
+    curve.ctrlpts = C_CTRLPTS2D
+    curve.knotvector = C_KV
+    curve.evaluator = evaluators.CurveEvaluator(cache_size=2)
+    for sample_size in (5, 6, 7):
+        curve.sample_size = sample_size
+        curve.evaluate()
+    assert curve.evaluator.cache_info().currsize == 2
+
+    # Nothing fits into the memory budget
+    curve.evaluator = evaluators.CurveEvaluator(cache_memory=0)
+    curve.evaluate()
+    curve.evaluate()
+    info = curve.evaluator.cache_info()
+    assert info.hits == 0
+    assert info.currsize == 0
+    assert info.memsize == 0
+
+
+def test_bspline_curve3d_evaluate_vectorized():
+    importorskip('numpy')
+    curve = BSpline.Curve()
+    curve.degree = C_DEGREE
+    curve.ctrlpts = C_CTRLPTS3D
+    curve.knotvector = C_KV
+    curve.sample_size = SAMPLE_SIZE
+    curve.evaluator = evaluators.CurveEvaluatorVectorized()
+
+    # Expected output
+    res = [[1.0, 1.0, 0.0], [1.4375, 1.0625, -0.375], [1.75, 1.25, -0.5], [1.9375, 1.5625, -0.375], [2.0, 2.0, 0.0]]
+
+    for pt, r in zip(curve.evalpts, res):
+        assert abs(pt[0] - r[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - r[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - r[2]) < GEOMDL_DELTA
+
+
+def test_bspline_curve_evaluate_vectorized_consistency():
+    importorskip('numpy')
+    curve = BSpline.Curve()
+    curve.degree = 3
+    curve.ctrlpts = [[5.0, 5.0], [10.0, 10.0], [20.0, 15.0], [35.0, 15.0], [45.0, 10.0], [50.0, 5.0]]
+    curve.knotvector = [0.0, 0.0, 0.0, 0.0, 0.33, 0.66, 1.0, 1.0, 1.0, 1.0]
+    curve.sample_size = 101
+    res = curve.evalpts
+
+    curve.evaluator = evaluators.CurveEvaluatorVectorized()
+    curve.evaluate(start=0.0, stop=1.0)
+    assert len(curve.evalpts) == len(res)
+    for pt, r in zip(curve.evalpts, res):
+        assert abs(pt[0] - r[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - r[1]) < GEOMDL_DELTA
+
+
+def test_bspline_surface_evaluate_vectorized():
+    importorskip('numpy')
+    surf = BSpline.Surface()
+    surf.degree_u = S_DEGREE_U
+    surf.degree_v = S_DEGREE_V
+    surf.set_ctrlpts(S_CTRLPTS, 3, 3)
+    surf.knotvector_u = S_KV_U
+    surf.knotvector_v = S_KV_V
+    surf.sample_size = SAMPLE_SIZE
+    res = surf.evalpts
+
+    surf.evaluator = evaluators.SurfaceEvaluatorVectorized()
+    surf.evaluate()
+    assert len(surf.evalpts) == len(res)
+    for pt, r in zip(surf.evalpts, res):
+        assert abs(pt[0] - r[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - r[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - r[2]) < GEOMDL_DELTA
+
+
+def test_bspline_volume_evaluate_vectorized():
+    importorskip('numpy')
+    vol = BSpline.Volume()
+    vol.degree = [V_DEGREE, V_DEGREE, V_DEGREE]
+    vol.set_ctrlpts(V_CTRLPTS, 3, 4, 3)
+    vol.knotvector_u = V_KV_U
+    vol.knotvector_v = V_KV_V
+    vol.knotvector_w = V_KV_W
+    vol.sample_size = SAMPLE_SIZE
+    res = vol.evalpts
+
+    vol.evaluator = evaluators.VolumeEvaluatorVectorized()
+    vol.evaluate()
+    assert len(vol.evalpts) == len(res)
+    for pt, r in zip(vol.evalpts, res):
+        assert abs(pt[0] - r[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - r[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - r[2]) < GEOMDL_DELTA
+
+
+def test_nurbs_volume_evaluate_vectorized():
+    importorskip('numpy')
+    vol = NURBS.Volume()
+    vol.degree = [V_DEGREE, V_DEGREE, V_DEGREE]
+    vol.set_ctrlpts([pt + [1.0 + (idx % 3) * 0.5] for idx, pt in enumerate(V_CTRLPTS)], 3, 4, 3)
+    vol.knotvector_u = V_KV_U
+    vol.knotvector_v = V_KV_V
+    vol.knotvector_w = V_KV_W
+    vol.sample_size = SAMPLE_SIZE
+    res = vol.evalpts
+
+    vol.evaluator = evaluators.VolumeEvaluatorRationalVectorized()
+    vol.evaluate()
+    assert len(vol.evalpts) == len(res)
+    for pt, r in zip(vol.evalpts, res):
+        assert abs(pt[0] - r[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - r[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - r[2]) < GEOMDL_DELTA
+
+
+def test_evaluate_list_vectorized():
+    importorskip('numpy')
+    surf = BSpline.Surface()
+    surf.degree_u = S_DEGREE_U
+    surf.degree_v = S_DEGREE_V
+    surf.set_ctrlpts(S_CTRLPTS, 3, 3)
+    surf.knotvector_u = S_KV_U
+    surf.knotvector_v = S_KV_V
+    params = [(0.0, 0.0), (0.15, 0.9), (0.5, 0.5), (1.0, 0.3), (1.0, 1.0)]
+    res = surf.evaluate_list(params)
+
+    surf.evaluator = evaluators.SurfaceEvaluatorVectorized()
+    evalpts = surf.evaluate_list(params)
+    assert len(evalpts) == len(res)
+    for pt, r in zip(evalpts, res):
+        assert abs(pt[0] - r[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - r[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - r[2]) < GEOMDL_DELTA
+
+
+def test_nurbs_volume_evaluate_list_vectorized():
+    importorskip('numpy')
+    vol = NURBS.Volume()
+    vol.degree = [V_DEGREE, V_DEGREE, V_DEGREE]
+    vol.set_ctrlpts([pt + [1.0 + (idx % 3) * 0.5] for idx, pt in enumerate(V_CTRLPTS)], 3, 4, 3)
+    vol.knotvector_u = V_KV_U
+    vol.knotvector_v = V_KV_V
+    vol.knotvector_w = V_KV_W
+    params = [(0.0, 0.0, 0.0), (0.2, 0.7, 0.4), (0.5, 1.0, 0.9), (1.0, 1.0, 1.0)]
+    res = [vol.evaluate_single(prm) for prm in params]
+
+    vol.evaluator = evaluators.VolumeEvaluatorRationalVectorized()
+    evalpts = vol.evaluate_list(params)
+    assert len(evalpts) == len(res)
+    for pt, r in zip(evalpts, res):
+        assert abs(pt[0] - r[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - r[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - r[2]) < GEOMDL_DELTA
+
+
+def test_bspline_curve_derivatives_vectorized():
+    importorskip('numpy')
+    curve = BSpline.Curve()
+    curve.degree = C_DEGREE
+    curve.ctrlpts = C_CTRLPTS3D
+    curve.knotvector = C_KV
+    params = [0.0, 0.2, 0.5, 0.75, 1.0]
+    res = curve.derivatives_list(params, order=3)
+
+    curve.evaluator = evaluators.CurveEvaluatorVectorized()
+    ders = curve.derivatives_list(params, order=3)
+    assert len(ders) == len(params)
+    for der, r in zip(ders, res):
+        assert len(der) == 4
+        for k in range(4):
+            assert abs(der[k][0] - r[k][0]) < GEOMDL_DELTA
+            assert abs(der[k][1] - r[k][1]) < GEOMDL_DELTA
+            assert abs(der[k][2] - r[k][2]) < GEOMDL_DELTA
+
+
+def test_bspline_surface_derivatives_vectorized():
+    importorskip('numpy')
+    surf = BSpline.Surface()
+    surf.degree_u = S_DEGREE_U
+    surf.degree_v = S_DEGREE_V
+    surf.set_ctrlpts(S_CTRLPTS, 3, 3)
+    surf.knotvector_u = S_KV_U
+    surf.knotvector_v = S_KV_V
+    params = [(0.0, 0.0), (0.15, 0.9), (0.5, 0.5), (1.0, 0.3), (1.0, 1.0)]
+    res = surf.derivatives_list(params, order=2)
+
+    surf.evaluator = evaluators.SurfaceEvaluatorVectorized()
+    ders = surf.derivatives_list(params, order=2)
+    assert len(ders) == len(params)
+    for der, r in zip(ders, res):
+        for k in range(3):
+            for l in range(3):
+                assert abs(der[k][l][0] - r[k][l][0]) < GEOMDL_DELTA
+                assert abs(der[k][l][1] - r[k][l][1]) < GEOMDL_DELTA
+                assert abs(der[k][l][2] - r[k][l][2]) < GEOMDL_DELTA
+
+
+def test_nurbs_curve_evaluate_vectorized():
+    importorskip('numpy')
+    curve = NURBS.Curve()
+    curve.degree = C_DEGREE
+    curve.ctrlptsw = [[1, 1, 0, 1], [4, 2, -2, 2], [1, 1, 0, 0.5]]
+    curve.knotvector = C_KV
+    curve.sample_size = SAMPLE_SIZE
+    res = curve.evalpts
+    params = [0.0, 0.2, 0.5, 0.75, 1.0]
+    res_ders = curve.derivatives_list(params, order=3)
+
+    curve.evaluator = evaluators.CurveEvaluatorRationalVectorized()
+    curve.evaluate()
+    assert len(curve.evalpts) == len(res)
+    for pt, r in zip(curve.evalpts, res):
+        assert abs(pt[0] - r[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - r[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - r[2]) < GEOMDL_DELTA
+
+    ders = curve.derivatives_list(params, order=3)
+    assert len(ders) == len(params)
+    for der, r in zip(ders, res_ders):
+        assert len(der) == 4
+        for k in range(4):
+            assert abs(der[k][0] - r[k][0]) < GEOMDL_DELTA
+            assert abs(der[k][1] - r[k][1]) < GEOMDL_DELTA
+            assert abs(der[k][2] - r[k][2]) < GEOMDL_DELTA
+
+
+def test_nurbs_surface_evaluate_vectorized():
+    importorskip('numpy')
+    surf = NURBS.Surface()
+    surf.degree_u = S_DEGREE_U
+    surf.degree_v = S_DEGREE_V
+    surf.set_ctrlpts([pt + [1.0 + (idx % 3) * 0.5] for idx, pt in enumerate(S_CTRLPTS)], 3, 3)
+    surf.knotvector_u = S_KV_U
+    surf.knotvector_v = S_KV_V
+    surf.sample_size = SAMPLE_SIZE
+    res = surf.evalpts
+    params = [(0.0, 0.0), (0.15, 0.9), (0.5, 0.5), (1.0, 0.3), (1.0, 1.0)]
+    res_ders = surf.derivatives_list(params, order=2)
+
+    surf.evaluator = evaluators.SurfaceEvaluatorRationalVectorized()
+    surf.evaluate()
+    assert len(surf.evalpts) == len(res)
+    for pt, r in zip(surf.evalpts, res):
+        assert abs(pt[0] - r[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - r[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - r[2]) < GEOMDL_DELTA
+
+    ders = surf.derivatives_list(params, order=2)
+    assert len(ders) == len(params)
+    for der, r in zip(ders, res_ders):
+        for k in range(3):
+            for l in range(3):
+                assert abs(der[k][l][0] - r[k][l][0]) < GEOMDL_DELTA
+                assert abs(der[k][l][1] - r[k][l][1]) < GEOMDL_DELTA
+                assert abs(der[k][l][2] - r[k][l][2]) < GEOMDL_DELTA
+
+
+def test_bspline_curve_evaluate_bezier_extraction():
+    curve = BSpline.Curve()
+    curve.degree = 3
+    curve.ctrlpts = [[5.0, 5.0, 0.0], [10.0, 10.0, 1.0], [20.0, 15.0, 0.0], [35.0, 15.0, -1.0], [45.0, 10.0, 0.0],
+                     [50.0, 5.0, 2.0]]
+    curve.knotvector = [0.0, 0.0, 0.0, 0.0, 0.25, 0.25, 1.0, 1.0, 1.0, 1.0]
+    curve.sample_size = 13
+    res = curve.evalpts
+    params = [0.0, 0.1, 0.25, 0.6, 1.0]
+    res_list = [curve.evaluate_single(prm) for prm in params]
+
+    curve.evaluator = evaluators.CurveEvaluatorBezierExtraction()
+    curve.evaluate()
+    assert len(curve.evalpts) == len(res)
+    for pt, r in zip(curve.evalpts, res):
+        assert abs(pt[0] - r[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - r[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - r[2]) < GEOMDL_DELTA
+
+    for pt, r in zip(curve.evaluate_list(params), res_list):
+        assert abs(pt[0] - r[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - r[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - r[2]) < GEOMDL_DELTA
+
+    # Changing the control points invalidates the cached coefficients
+    curve.ctrlpts = [[pt[0], pt[1], 2.0 * pt[2]] for pt in curve.ctrlpts]
+    pt = curve.evaluate_single(0.6)
+    assert abs(pt[2] - (2.0 * res_list[3][2])) < GEOMDL_DELTA
+    assert curve.evaluator.cache_info().misses == 2
+
+    # The cache is keyed by the identities of the buffers and the in-place updates invalidate it
+    curve.evaluate_single(0.1)
+    assert curve.evaluator.cache_info().misses == 2
+    curve.update_ctrlpt(3, [35.0, 15.0, 4.0])
+    pt = curve.evaluate_single(0.6)
+    assert curve.evaluator.cache_info().misses == 3
+    ref = BSpline.Curve()
+    ref.degree = 3
+    ref.ctrlpts = curve.ctrlpts
+    ref.knotvector = curve.knotvector
+    for c, r in zip(pt, ref.evaluate_single(0.6)):
+        assert abs(c - r) < GEOMDL_DELTA
+
+
+def test_bspline_surface_evaluate_bezier_extraction():
+    surf = BSpline.Surface()
+    surf.degree_u = S_DEGREE_U
+    surf.degree_v = 1
+    surf.set_ctrlpts(S_CTRLPTS + [[3, 0, 1], [3, 1, 2], [3, 2, 1]], 4, 3)
+    surf.knotvector_u = [0, 0, 0, 0.4, 1, 1, 1]
+    surf.knotvector_v = [0, 0, 0.5, 1, 1]
+    surf.sample_size = SAMPLE_SIZE
+    res = surf.evalpts
+    params = [(0.0, 0.0), (0.15, 0.9), (0.4, 0.5), (1.0, 0.3), (1.0, 1.0)]
+    res_list = [surf.evaluate_single(prm) for prm in params]
+
+    surf.evaluator = evaluators.SurfaceEvaluatorBezierExtraction()
+    surf.evaluate()
+    assert len(surf.evalpts) == len(res)
+    for pt, r in zip(surf.evalpts, res):
+        assert abs(pt[0] - r[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - r[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - r[2]) < GEOMDL_DELTA
+
+    for pt, r in zip(surf.evaluate_list(params), res_list):
+        assert abs(pt[0] - r[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - r[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - r[2]) < GEOMDL_DELTA
+
+    # Updating a control point invalidates the cached coefficients
+    surf.update_ctrlpt(1, 1, [1.0, 1.0, 5.0])
+    pt = surf.evaluate_single((0.15, 0.4))
+    surf.evaluator = evaluators.SurfaceEvaluator()
+    for c, r in zip(pt, surf.evaluate_single((0.15, 0.4))):
+        assert abs(c - r) < GEOMDL_DELTA
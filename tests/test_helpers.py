@@ -152,3 +152,63 @@ def test_basis_function_ders_one():
 	assert abs(to_check[2][0] - result[2][0]) < GEOMDL_DELTA
 	assert abs(to_check[2][1] - result[2][1]) < GEOMDL_DELTA
 	assert abs(to_check[2][2] - result[2][2]) < GEOMDL_DELTA
+
+
+def test_find_span_binsearch_end_of_domain():
+	degree = 2
+	knot_vector = [0, 0, 0, 1, 2, 3, 4, 4, 5, 5, 5]
+	num_ctrlpts = len(knot_vector) - degree - 1
+
+	to_check = helpers.find_span_binsearch(degree, knot_vector, num_ctrlpts, 5.0)
+	result = num_ctrlpts - 1  # last non-zero knot span
+
+	assert to_check == result
+
+
+def test_find_span_binsearch_linear():
+	degree = 2
+	knot_vector = [0, 0, 0, 1, 2, 3, 4, 4, 5, 5, 5]
+	num_ctrlpts = len(knot_vector) - degree - 1
+	knots = [0.0, 0.5, 1.0, 2.5, 3.999, 4.0, 4.5, 5.0]
+
+	for knot in knots:
+		assert helpers.find_span_binsearch(degree, knot_vector, num_ctrlpts, knot) == \
+			helpers.find_span_linear(degree, knot_vector, num_ctrlpts, knot)
+
+
+def test_find_spans_sorted_unsorted():
+	degree = 2
+	knot_vector = [0, 0, 0, 1, 2, 3, 4, 4, 5, 5, 5]
+	num_ctrlpts = len(knot_vector) - degree - 1
+	knots = [0.0, 0.5, 1.0, 2.5, 3.999, 4.0, 4.5, 5.0]
+	result = [helpers.find_span_linear(degree, knot_vector, num_ctrlpts, knot) for knot in knots]
+
+	to_check_sorted = helpers.find_spans(degree, knot_vector, num_ctrlpts, knots)
+	to_check_unsorted = helpers.find_spans(degree, knot_vector, num_ctrlpts, knots[::-1])
+
+	assert to_check_sorted == result
+	assert to_check_unsorted == result[::-1]
+
+
+def test_bezier_decomposition():
+	degree = 2
+	knot_vector = [0, 0, 0, 1, 2, 2, 2]
+	ctrlpts = [[0.0, 0.0], [1.0, 2.0], [3.0, 2.0], [4.0, 0.0]]
+
+	breakpoints, segments = helpers.bezier_decomposition(degree, knot_vector, ctrlpts)
+	assert breakpoints == [0, 1, 2]
+	assert len(segments) == 2
+	assert segments[0][0:2] == ctrlpts[0:2]
+	assert segments[1][1:3] == ctrlpts[2:4]
+	# The joint point is the midpoint of the middle control points
+	assert segments[0][2] == [2.0, 2.0]
+	assert segments[1][0] == [2.0, 2.0]
+
+
+def test_power_basis_coefficients():
+	degree = 2
+	ctrlpts = [[0.0, 0.0], [1.0, 2.0], [2.0, 0.0]]
+
+	to_check = helpers.power_basis_coefficients(degree, ctrlpts)
+	result = [[0.0, 0.0], [2.0, 4.0], [0.0, -4.0]]
+	assert to_check == result
@@ -21,6 +21,21 @@ def test_linspace():
     assert to_check == result
 
 
+def test_linspace_no_rounding():
+    to_check = linalg.linspace(0, 1, 11, decimals=None)
+    assert to_check == [x / 10.0 for x in range(11)]
+
+
+def test_linspace_cached():
+    to_check = linalg.linspace(0.1, 0.7, 7)
+    assert to_check[-1] == 0.7
+    assert to_check == [float("{:.18f}".format(0.1 + (x * 0.6 / 6.0))) for x in range(6)] + [0.7]
+
+    # The cached numbers are not modified via the returned list
+    to_check[0] = 5.0
+    assert linalg.linspace(0.1, 0.7, 7)[0] == 0.1
+
+
 def test_vector_dot1():
     with pytest.raises(ValueError):
         vec1 = ()
@@ -172,6 +187,15 @@ def test_binomial_coefficient3():
     assert to_check == result
 
 
+def test_binomial_coefficients():
+    table = linalg.binomial_coefficients(17)
+    assert len(table) == 18
+    for k in range(18):
+        assert len(table[k]) == k + 1
+        for i in range(k + 1):
+            assert table[k][i] == linalg.binomial_coefficient(k, i)
+
+
 def test_frange1():
     start = 5
     stop = 11
@@ -395,6 +395,11 @@ def test_export_csv_surface_evalpts(bspline_surface):
     assert os.path.isfile(fname)
     assert os.path.getsize(fname) > 0
 
+    with open(fname, 'r') as fp:
+        lines = fp.read().splitlines()
+    assert len(lines) == len(bspline_surface.evalpts) + 1
+    assert lines[1] == ",".join([str(c) for c in bspline_surface.evalpts[0]])
+
     # Clean up temporary file if exists
     if os.path.isfile(fname):
         os.remove(fname)
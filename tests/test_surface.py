@@ -6,11 +6,19 @@
     Requires "pytest" to run.
 """
 
-from pytest import fixture, mark
+import copy
+from pytest import fixture, mark, importorskip, raises
 from geomdl import BSpline
 from geomdl import evaluators
 from geomdl import convert
+from geomdl import elements
 from geomdl import helpers
+from geomdl import linalg
+from geomdl import multi
+from geomdl import operations
+from geomdl import tessellate
+from geomdl import _tessellate as tsl
+from geomdl.exceptions import GeomdlException
 
 GEOMDL_DELTA = 0.001
 
@@ -103,6 +111,482 @@ def test_bspline_surface_deriv(spline_surf):
             assert abs(der1[k][l][2] - der2[k][l][2]) < GEOMDL_DELTA
 
 
+def test_bspline_surface_eval_list(spline_surf):
+    params = [(0.0, 0.0), (0.0, 0.2), (0.3, 0.4), (0.6, 1.0), (1.0, 1.0)]
+    evalpts = spline_surf.evaluate_list(params)
+
+    assert len(evalpts) == len(params)
+    for param, evalpt in zip(params, evalpts):
+        res = spline_surf.evaluate_single(param)
+        assert abs(evalpt[0] - res[0]) < GEOMDL_DELTA
+        assert abs(evalpt[1] - res[1]) < GEOMDL_DELTA
+        assert abs(evalpt[2] - res[2]) < GEOMDL_DELTA
+
+
+def test_bspline_surface_deriv_list(spline_surf):
+    params = [(0.0, 0.25), (0.35, 0.35), (1.0, 0.8)]
+    ders = spline_surf.derivatives_list(params, order=2)
+
+    for param, der1 in zip(params, ders):
+        der2 = spline_surf.derivatives(u=param[0], v=param[1], order=2)
+        for k in range(0, 3):
+            for l in range(0, 3 - k):
+                assert abs(der1[k][l][0] - der2[k][l][0]) < GEOMDL_DELTA
+                assert abs(der1[k][l][1] - der2[k][l][1]) < GEOMDL_DELTA
+                assert abs(der1[k][l][2] - der2[k][l][2]) < GEOMDL_DELTA
+
+
+def test_bspline_surface_update_ctrlpt(spline_surf):
+    spline_surf.sample_size = 15
+    spline_surf.evaluate()
+    spline_surf.update_ctrlpt(1, 4, [-15.0, 15.0, 10.0])
+    evalpts = spline_surf.evalpts
+
+    res = BSpline.Surface()
+    res.degree_u = spline_surf.degree_u
+    res.degree_v = spline_surf.degree_v
+    ctrlpts = [pt for pt in spline_surf.ctrlpts]
+    res.set_ctrlpts(ctrlpts, 6, 6)
+    res.knotvector_u = spline_surf.knotvector_u
+    res.knotvector_v = spline_surf.knotvector_v
+    res.sample_size = 15
+
+    assert spline_surf.ctrlpts2d[1][4] == [-15.0, 15.0, 10.0]
+    assert ctrlpts[4 + (6 * 1)] == [-15.0, 15.0, 10.0]
+    for pt, r in zip(evalpts, res.evalpts):
+        assert abs(pt[0] - r[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - r[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - r[2]) < GEOMDL_DELTA
+
+
+def test_bspline_surface_array_storage(spline_surf):
+    np = importorskip('numpy')
+    surf = BSpline.Surface(array_storage=True)
+    surf.degree_u = spline_surf.degree_u
+    surf.degree_v = spline_surf.degree_v
+    surf.set_ctrlpts(spline_surf.ctrlpts, 6, 6)
+    surf.knotvector_u = spline_surf.knotvector_u
+    surf.knotvector_v = spline_surf.knotvector_v
+
+    # Control points are stored in a single contiguous array and the 2-dimensional array is a view of it
+    assert isinstance(surf.ctrlpts, np.ndarray)
+    assert surf.ctrlpts.shape == (36, 3)
+    assert surf.ctrlpts.flags['C_CONTIGUOUS']
+    assert surf.ctrlpts2d.shape == (6, 6, 3)
+    assert np.shares_memory(surf.ctrlpts2d, surf.ctrlpts)
+
+    surf.update_ctrlpt(1, 4, [-15.0, 15.0, 10.0])
+    spline_surf.update_ctrlpt(1, 4, [-15.0, 15.0, 10.0])
+    assert list(surf.ctrlpts2d[1][4]) == [-15.0, 15.0, 10.0]
+    for pt, r in zip(surf.evalpts, spline_surf.evalpts):
+        assert abs(pt[0] - r[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - r[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - r[2]) < GEOMDL_DELTA
+
+
+@mark.parametrize("split_func", [operations.split_surface_u, operations.split_surface_v])
+def test_bspline_surface_array_storage_split(spline_surf, split_func):
+    np = importorskip('numpy')
+    surf = BSpline.Surface(array_storage=True)
+    surf.degree_u = spline_surf.degree_u
+    surf.degree_v = spline_surf.degree_v
+    surf.set_ctrlpts(spline_surf.ctrlpts, 6, 6)
+    surf.knotvector_u = spline_surf.knotvector_u
+    surf.knotvector_v = spline_surf.knotvector_v
+
+    surfs = split_func(surf, 0.5)
+    assert isinstance(surfs[0].ctrlpts, np.ndarray)
+    for srf, res in zip(surfs, split_func(spline_surf, 0.5)):
+        assert srf.ctrlpts_size_u == res.ctrlpts_size_u
+        assert srf.ctrlpts_size_v == res.ctrlpts_size_v
+        for pt, r in zip(srf.ctrlpts, res.ctrlpts):
+            assert abs(pt[0] - r[0]) < GEOMDL_DELTA
+            assert abs(pt[1] - r[1]) < GEOMDL_DELTA
+            assert abs(pt[2] - r[2]) < GEOMDL_DELTA
+
+
+def test_bspline_surface_array_storage_decompose(spline_surf):
+    importorskip('numpy')
+    surf = BSpline.Surface(array_storage=True)
+    surf.degree_u = spline_surf.degree_u
+    surf.degree_v = spline_surf.degree_v
+    surf.set_ctrlpts(spline_surf.ctrlpts, 6, 6)
+    surf.knotvector_u = spline_surf.knotvector_u
+    surf.knotvector_v = spline_surf.knotvector_v
+
+    assert len(operations.decompose_surface(surf)) == len(operations.decompose_surface(spline_surf))
+
+
+def test_bspline_surface_ctrlpts2d_lazy(spline_surf):
+    # The 2-dimensional control points are generated on first access
+    assert len(spline_surf._control_points2D) == 0
+    assert spline_surf.ctrlpts2d[1][4] == [-15.0, 15.0, -4.0]
+
+    # Updating a control point invalidates the 2-dimensional control points
+    spline_surf.update_ctrlpt(1, 4, [-15.0, 15.0, 10.0])
+    assert len(spline_surf._control_points2D) == 0
+    assert spline_surf.ctrlpts2d[1][4] == [-15.0, 15.0, 10.0]
+    assert len(spline_surf.ctrlpts2d) == 6
+    assert len(spline_surf.ctrlpts2d[0]) == 6
+
+
+def test_bspline_surface_set_ctrlpts_trusted(spline_surf):
+    ctrlpts = [list(pt) for pt in spline_surf.ctrlpts]
+    surf = BSpline.Surface()
+    surf.degree_u = 3
+    surf.degree_v = 3
+    surf.set_ctrlpts(ctrlpts, 6, 6, validate=False)
+    surf.knotvector_u = spline_surf.knotvector_u
+    surf.knotvector_v = spline_surf.knotvector_v
+
+    # The input list is adopted without copying
+    assert surf.ctrlpts is ctrlpts
+    assert surf.ctrlpts2d[1][1] == [-15.0, -15.0, -4.0]
+    assert surf.evaluate_single((0.3, 0.4)) == spline_surf.evaluate_single((0.3, 0.4))
+
+    # The shape of the input is still checked
+    with raises(ValueError):
+        surf.set_ctrlpts(ctrlpts[:-1], 6, 6, validate=False)
+    with raises(ValueError):
+        surf.set_ctrlpts(ctrlpts, 6, 6, dimension=4, validate=False)
+
+
+def test_bspline_surface_set_ctrlpts_trusted_array(spline_surf):
+    np = importorskip('numpy')
+    ctrlpts = np.array(spline_surf.ctrlpts)
+    surf = BSpline.Surface(array_storage=True)
+    surf.degree_u = 3
+    surf.degree_v = 3
+    surf.set_ctrlpts(ctrlpts, 6, 6, validate=False)
+
+    assert surf.ctrlpts is ctrlpts
+    assert np.shares_memory(surf.ctrlpts2d, ctrlpts)
+
+
+def test_bspline_surface_deepcopy_shared(spline_surf):
+    spline_surf.sample_size = 10
+    evalpts = [list(pt) for pt in spline_surf.evalpts]
+    surf = copy.deepcopy(spline_surf)
+
+    # The copy shares the data with the original surface until it is accessed
+    assert surf._control_points is spline_surf._control_points
+    assert surf._knot_vector[0] is spline_surf._knot_vector[0]
+    assert surf._eval_points is spline_surf._eval_points
+
+    # Updating the copy does not change the original surface
+    surf.update_ctrlpt(1, 4, [-15.0, 15.0, 10.0])
+    assert surf.ctrlpts is not spline_surf.ctrlpts
+    assert surf.ctrlpts2d[1][4] == [-15.0, 15.0, 10.0]
+    assert spline_surf.ctrlpts2d[1][4] == [-15.0, 15.0, -4.0]
+    assert surf.evalpts != evalpts
+    assert spline_surf.evalpts == evalpts
+
+
+def test_bspline_surface_deepcopy_modify(spline_surf):
+    surf = copy.deepcopy(spline_surf)
+
+    # Modifying the data returned by the getters of the copy does not change the original surface
+    surf.ctrlpts[0][0] = 99.0
+    surf.knotvector_u[1] = 0.5
+    surf.ctrlpts2d[1][4][2] = 10.0
+    assert spline_surf.ctrlpts[0] == [-25.0, -25.0, -10.0]
+    assert spline_surf.knotvector_u[1] == 0.0
+    assert spline_surf.ctrlpts2d[1][4] == [-15.0, 15.0, -4.0]
+
+    # Modifying the original surface does not change the copy
+    surf = copy.deepcopy(spline_surf)
+    spline_surf.ctrlpts[0][0] = 99.0
+    assert surf.ctrlpts[0] == [-25.0, -25.0, -10.0]
+
+
+def test_bspline_surface_deepcopy_modify_array(spline_surf):
+    np = importorskip('numpy')
+    surf = BSpline.Surface(array_storage=True)
+    surf.degree_u = spline_surf.degree_u
+    surf.degree_v = spline_surf.degree_v
+    surf.set_ctrlpts(spline_surf.ctrlpts, 6, 6)
+    surf.knotvector_u = spline_surf.knotvector_u
+    surf.knotvector_v = spline_surf.knotvector_v
+    surf_copy = copy.deepcopy(surf)
+
+    surf_copy.ctrlpts[0, 0] = 5.0
+    assert surf.ctrlpts[0, 0] == -25.0
+    assert np.shares_memory(surf_copy.ctrlpts2d, surf_copy.ctrlpts)
+
+
+def test_bspline_surface_evalpts_grid(spline_surf):
+    spline_surf.sample_size_u = 5
+    spline_surf.sample_size_v = 7
+    evalpts = spline_surf.evalpts
+
+    # The evaluated points carry the grid shape and behave like the list of points
+    assert evalpts.size == (5, 7)
+    assert evalpts.shape == (5, 7, 3)
+    assert len(evalpts) == 35
+    assert evalpts[-1] == list(evalpts)[34] == evalpts.tolist()[34]
+    assert evalpts == evalpts.tolist()
+    assert evalpts + [[0.0, 0.0, 0.0]] == evalpts.tolist() + [[0.0, 0.0, 0.0]]
+    assert [[0.0, 0.0, 0.0]] + evalpts == [[0.0, 0.0, 0.0]] + evalpts.tolist()
+    for c, e in zip(evalpts[7 + 3], spline_surf.evaluate_single((0.25, 0.5))):
+        assert abs(c - e) < GEOMDL_DELTA
+
+    # The lists of the points are cached and item assignment updates the coordinate array too
+    assert evalpts[3] is evalpts[3]
+    evalpts[3] = [1.0, 2.0, 3.0]
+    assert evalpts[3] == [1.0, 2.0, 3.0]
+    assert evalpts.data[9:12].tolist() == [1.0, 2.0, 3.0]
+    assert evalpts.tolist()[3] is not evalpts[3]
+
+
+def test_bspline_surface_evalpts_array(spline_surf):
+    np = importorskip('numpy')
+    evalpts = spline_surf.evalpts
+    pts = np.asarray(evalpts)
+    assert pts.shape == (len(evalpts), 3)
+    assert np.shares_memory(pts, np.frombuffer(evalpts.data))
+    assert np.allclose(pts.reshape(evalpts.shape)[2][3], evalpts[3 + 2 * evalpts.size[1]])
+
+    # The point grid can be generated from a NumPy array
+    grid = elements.PointGrid(pts, evalpts.size)
+    assert grid == evalpts
+    assert grid.shape == evalpts.shape
+
+    # The vectorized evaluator returns the points as an array for the point grid
+    surf = copy.deepcopy(spline_surf)
+    surf.evaluator = evaluators.SurfaceEvaluatorVectorized()
+    surf.evaluate()
+    assert np.allclose(np.asarray(surf.evalpts), pts)
+
+
+def test_bspline_surface_single_precision(spline_surf):
+    surf = BSpline.Surface(single_precision=True)
+    surf.degree_u = spline_surf.degree_u
+    surf.degree_v = spline_surf.degree_v
+    surf.set_ctrlpts(spline_surf.ctrlpts, 6, 6)
+    surf.knotvector_u = spline_surf.knotvector_u
+    surf.knotvector_v = spline_surf.knotvector_v
+
+    # The evaluated points are stored as float32 values within the documented error bound
+    assert surf.evalpts.data.itemsize == 4
+    assert surf.evalpts.size == (spline_surf.sample_size_u, spline_surf.sample_size_v)
+    for pt, r in zip(surf.evalpts, spline_surf.evalpts):
+        for c, e in zip(pt, r):
+            assert abs(c - e) <= 2 ** -24 * abs(e)
+
+
+def test_bspline_surface_tessellate_mesh(spline_surf):
+    spline_surf.sample_size = 10
+    spline_surf.tessellate()
+    mesh = spline_surf.tessellator.mesh
+
+    # Compare with the object-based triangular mesh generator
+    vertices, triangles = tessellate.make_triangle_mesh(spline_surf.evalpts, 10, 10)
+    assert mesh.num_vertices == len(vertices) == 100
+    assert mesh.num_faces == len(triangles) == 162
+    for idx, tri in enumerate(triangles):
+        assert mesh.face(idx) == tri.data
+    for idx, vrt in enumerate(vertices):
+        assert mesh.vertex_uv(idx) == list(vrt.uv)
+
+    # Vertex and triangle objects are generated from the compact mesh
+    for idx, vrt in enumerate(spline_surf.vertices):
+        assert vrt.id == idx
+        assert list(vrt.data) == mesh.vertex(idx)
+        assert list(vrt.uv) == mesh.vertex_uv(idx)
+    assert [tri.data for tri in spline_surf.faces] == [tri.data for tri in triangles]
+
+    # Vertices are re-evaluated on the surface
+    pt = spline_surf.evaluate_single(mesh.vertex_uv(15))
+    for c, e in zip(mesh.vertex(15), pt):
+        assert abs(c - e) < GEOMDL_DELTA
+
+    spline_surf.reset(evalpts=True)
+    assert mesh.num_vertices == 0
+    assert not spline_surf.tessellator.is_tessellated()
+
+
+def test_bspline_surface_tessellate_mesh_spacing(spline_surf):
+    spline_surf.sample_size = 10
+    spline_surf.tessellate(vertex_spacing=2)
+    mesh = spline_surf.tessellator.mesh
+
+    # The grid is generated via array slicing and it must be the same with the object-based generator
+    vertices, triangles = tessellate.make_triangle_mesh(spline_surf.evalpts, 10, 10, vertex_spacing=2)
+    assert mesh.num_vertices == len(vertices) == 25
+    assert mesh.num_faces == len(triangles) == 32
+    assert [mesh.face(idx) for idx in range(mesh.num_faces)] == [tri.data for tri in triangles]
+    assert [mesh.vertex_uv(idx) for idx in range(mesh.num_vertices)] == [list(vrt.uv) for vrt in vertices]
+
+
+class _TrimReference(object):
+    """ Tests the points and the cells against all trim curve segments, i.e. without a spatial index """
+
+    def __init__(self, trims):
+        self._points = [trim.evalpts for trim in trims]
+
+    def points(self, tdx):
+        return self._points[tdx]
+
+    def winding(self, tdx, uv):
+        return linalg.wn_poly(uv, self._points[tdx])
+
+    def segments(self, bbmin, bbmax):
+        return [(tdx, idx) for tdx, pts in enumerate(self._points) for idx in range(len(pts) - 1)]
+
+
+def test_bspline_surface_tessellate_trim(spline_surf):
+    trim = BSpline.Curve()
+    trim.degree = 1
+    trim.ctrlpts = [[0.3, 0.3], [0.6, 0.3], [0.6, 0.6], [0.3, 0.6], [0.3, 0.3]]
+    trim.knotvector = [0.0, 0.0, 0.25, 0.5, 0.75, 1.0, 1.0]
+    trim.sample_size = 40
+    trim.opt = ['reversed', 0]
+
+    # The spatial index gives the same results with testing all trim curve segments
+    index = tsl.TrimIndex([trim])
+    pts = trim.evalpts
+    for uv in [(0.45, 0.45), (0.3, 0.45), (0.2, 0.45), (0.45, 0.6), (0.61, 0.59), (0.0, 1.0)]:
+        assert index.winding(0, uv) == linalg.wn_poly(uv, pts)
+    assert index.segments([0.0, 0.0], [0.1, 0.1]) == []
+    assert index.segments([0.25, 0.25], [0.31, 0.31]) == [(0, 0), (0, 38)]
+
+    # A second trim curve crossing the cells diagonally
+    trim2 = BSpline.Curve()
+    trim2.degree = 1
+    trim2.ctrlpts = [[0.05, 0.1], [0.9, 0.35], [0.4, 0.95], [0.05, 0.1]]
+    trim2.knotvector = [0.0, 0.0, 1.0 / 3.0, 2.0 / 3.0, 1.0, 1.0]
+    trim2.sample_size = 25
+    trim2.opt = ['reversed', 1]
+
+    for trims in ([trim], [trim2, trim]):
+        spline_surf.sample_size = 20
+        spline_surf.trims = trims
+        spline_surf.tessellator = tessellate.TrimTessellate()
+        spline_surf.tessellate(force=True)
+
+        # The mesh must be the same with testing all trim curve segments without the spatial index
+        vertices, triangles = tessellate.make_triangle_mesh(spline_surf.evalpts, 20, 20, trims=trims,
+                                                            tessellate_func=tessellate.surface_trim_tessellate,
+                                                            tessellate_args=dict(trim_index=_TrimReference(trims)))
+        assert len(triangles) > 0
+        assert [tri.data for tri in spline_surf.faces] == [tri.data for tri in triangles]
+        assert [list(vrt.uv) for vrt in spline_surf.vertices] == [list(vrt.uv) for vrt in vertices]
+
+
+def test_bspline_surface_tessellate_adaptive(spline_surf):
+    spline_surf.tessellator = tessellate.AdaptiveTessellate(tolerance=0.5)
+    spline_surf.tessellate()
+    mesh = spline_surf.tessellator.mesh
+    assert 0 < mesh.num_faces < 1000
+
+    # All edges are shared by two triangles, except the edges on the boundary of the domain (no cracks)
+    edges = dict()
+    for idx in range(mesh.num_faces):
+        face = mesh.face(idx)
+        for edge in zip(face, face[1:] + face[:1]):
+            assert edge not in edges
+            edges[edge] = idx
+    for v1, v2 in edges:
+        if (v2, v1) not in edges:
+            uv1, uv2 = mesh.vertex_uv(v1), mesh.vertex_uv(v2)
+            assert any(uv1[i] == uv2[i] and uv1[i] in (0.0, 1.0) for i in range(2))
+
+    # The vertices are on the surface and the triangles are within the tolerance
+    for idx in range(mesh.num_faces):
+        face = mesh.face(idx)
+        uv = [sum(mesh.vertex_uv(v)[i] for v in face) / 3.0 for i in range(2)]
+        center = [sum(mesh.vertex(v)[i] for v in face) / 3.0 for i in range(3)]
+        for c, e in zip(center, spline_surf.evaluate_single(uv)):
+            assert abs(c - e) < 0.5
+
+    # Flat surfaces are not refined
+    spline_surf.set_ctrlpts([[pt[0], pt[1], 0.0] for pt in spline_surf.ctrlpts], 6, 6)
+    spline_surf.tessellate(force=True)
+    assert spline_surf.tessellator.mesh.num_faces == 2 * 3 * 3
+
+
+def test_bspline_surface_tessellate_adaptive_trim(spline_surf):
+    trim = BSpline.Curve()
+    trim.degree = 1
+    trim.ctrlpts = [[0.3, 0.3], [0.6, 0.3], [0.6, 0.6], [0.3, 0.6], [0.3, 0.3]]
+    trim.knotvector = [0.0, 0.0, 0.25, 0.5, 0.75, 1.0, 1.0]
+    spline_surf.trims = [trim]
+
+    # Trimmed surfaces are not tessellated over the untrimmed domain
+    spline_surf.tessellator = tessellate.AdaptiveTessellate(tolerance=0.5)
+    with raises(GeomdlException):
+        spline_surf.tessellate()
+    with raises(GeomdlException):
+        spline_surf.tessellate_lod(tolerance=0.5)
+
+
+def test_bspline_surface_tessellate_lod(spline_surf):
+    coarse = spline_surf.tessellate_lod(sample_size=5)
+    fine = spline_surf.tessellate_lod(sample_size=(20, 10), vertex_spacing=2)
+    adaptive = spline_surf.tessellate_lod(tolerance=0.5)
+    assert coarse.num_faces == 32
+    assert fine.num_faces == 2 * 9 * 4
+    assert adaptive.num_faces == BSpline.Surface.tessellate_lod(spline_surf, tolerance=0.5).num_faces
+
+    # The levels of detail are cached and the surface is not tessellated
+    assert spline_surf.tessellate_lod(sample_size=5) is coarse
+    assert spline_surf.lod_cache.info().currsize == 3
+    assert not spline_surf.tessellator.is_tessellated()
+
+    # Compare with the tessellation of the surface
+    spline_surf.sample_size = 5
+    spline_surf.tessellate()
+    assert spline_surf.tessellate_lod() is coarse
+    assert list(spline_surf.tessellator.mesh.faces) == list(coarse.faces)
+    for c, e in zip(spline_surf.tessellator.mesh.vertices, coarse.vertices):
+        assert abs(c - e) < GEOMDL_DELTA
+
+    # Updating the surface clears the cache
+    spline_surf.update_ctrlpt(1, 4, [-15.0, 15.0, 10.0])
+    assert spline_surf.lod_cache.info().currsize == 0
+    assert spline_surf.tessellate_lod(sample_size=5) is not coarse
+
+    # The least recently used levels are discarded
+    surf = BSpline.Surface(lod_cache_memory=coarse.nbytes + fine.nbytes)
+    surf.degree_u = spline_surf.degree_u
+    surf.degree_v = spline_surf.degree_v
+    surf.set_ctrlpts(spline_surf.ctrlpts, 6, 6)
+    surf.knotvector_u = spline_surf.knotvector_u
+    surf.knotvector_v = spline_surf.knotvector_v
+    surf.tessellate_lod(sample_size=5)
+    surf.tessellate_lod(sample_size=(20, 10), vertex_spacing=2)
+    surf.tessellate_lod(sample_size=5)
+    assert surf.tessellate_lod(sample_size=9, vertex_spacing=2).nbytes == coarse.nbytes
+    assert ((5, 5), 1, None) in surf.lod_cache
+    assert ((20, 10), 2, None) not in surf.lod_cache
+
+
+def test_surface_container_tessellate_lod(spline_surf):
+    surf = copy.deepcopy(spline_surf)
+    msurf = multi.SurfaceContainer(spline_surf, operations.translate(surf, [0.0, 0.0, 200.0]))
+    levels = [dict(sample_size=5), dict(sample_size=20)]
+
+    # The closer surface uses the finer level of detail
+    meshes = msurf.tessellate_lod([0.0, 0.0, 50.0], levels, distances=[100.0])
+    assert [m.num_faces for m in meshes] == [722, 32]
+    meshes = msurf.tessellate_lod([0.0, 0.0, 180.0], levels, pixels=[1000])
+    assert [m.num_faces for m in meshes] == [32, 722]
+    with raises(GeomdlException):
+        msurf.tessellate_lod([0.0, 0.0, 50.0], levels, distances=[100.0, 10.0])
+
+
+def test_quad_tessellate_mesh(spline_surf):
+    spline_surf.sample_size = 5
+    tsl = tessellate.QuadTessellate()
+    tsl.tessellate(spline_surf.evalpts, size_u=5, size_v=5)
+    vertices, quads = tessellate.make_quad_mesh(spline_surf.evalpts, 5, 5)
+
+    assert tsl.mesh.face_size == 4
+    assert tsl.mesh.num_faces == len(quads) == 16
+    assert [q.data for q in tsl.faces] == [q.data for q in quads]
+    assert [v.data for v in tsl.vertices] == [v.data for v in vertices]
+
+
 @mark.parametrize("params, uv, res", [
     (dict(u=0.3, v=0.4), (0.3, 0.4), (-7.006, -3.308, -6.265)),
     (dict(u=0.3, num_u=2), (0.3, 0.4), (-7.006, -3.308, -6.265)),
@@ -199,6 +683,24 @@ def test_nurbs_weights(nurbs_surf):
     assert nurbs_surf.weights[5] == 1.0
 
 
+def test_nurbs_weights_cache(nurbs_surf):
+    # The unweighted control points and the weights are separated while setting the weighted control points
+    ctrlpts = nurbs_surf.ctrlpts
+    weights = nurbs_surf.weights
+    nurbs_surf.reset(evalpts=True)
+    assert nurbs_surf.ctrlpts is ctrlpts
+    assert nurbs_surf.weights is weights
+
+    nurbs_surf.update_ctrlpt(1, 1, [1.0, 2.0, 3.0])
+    assert nurbs_surf.ctrlpts[7] == [1.0, 2.0, 3.0]
+
+    ctrlptsw = [list(pt) for pt in nurbs_surf.ctrlptsw]
+    ctrlptsw[7] = [2.0, 4.0, 6.0, 2.0]
+    nurbs_surf.ctrlptsw = ctrlptsw
+    assert nurbs_surf.ctrlpts[7] == [1.0, 2.0, 3.0]
+    assert nurbs_surf.weights[7] == 2.0
+
+
 @mark.parametrize("param, res", [
     ((0.0, 0.0), (-25.0, -25.0, -10.0)),
     ((0.0, 0.2), (-25.0, -11.403, -3.385)),
@@ -233,6 +735,31 @@ def test_nurbs_surface_deriv(nurbs_surf, param, order, res):
                 assert abs(c - e) < GEOMDL_DELTA
 
 
+def test_bspline_surface_normal_list(spline_surf):
+    params = [(0.0, 0.25), (0.35, 0.35), (1.0, 0.8)]
+    normals = operations.normal(spline_surf, params)
+
+    assert len(normals) == len(params)
+    for param, nvec in zip(params, normals):
+        res = operations.normal(spline_surf, param)
+        for c, e in zip(nvec[0], res[0]):
+            assert abs(c - e) < GEOMDL_DELTA
+        for c, e in zip(nvec[1], res[1]):
+            assert abs(c - e) < GEOMDL_DELTA
+
+
+def test_nurbs_surface_deriv_list(nurbs_surf):
+    params = [(0.0, 0.25), (0.95, 0.75)]
+    ders = nurbs_surf.derivatives_list(params, order=2)
+
+    for param, deriv in zip(params, ders):
+        res = nurbs_surf.derivatives(*param, order=2)
+        for computed, expected in zip(deriv, res):
+            for idx in range(3):
+                for c, e in zip(computed[idx], expected[idx]):
+                    assert abs(c - e) < GEOMDL_DELTA
+
+
 def test_surface_bounding_box(spline_surf):
     # Evaluate bounding box
     to_check = spline_surf.bbox